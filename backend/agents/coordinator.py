@@ -384,14 +384,13 @@ class AgentCoordinator:
         query_type = state.context.query_type
         insights = self._extract_key_insights(state.agent_results)
         
-        analysis = f"Based on your {query_type} query, here's my analysis:\n\n"
+        parts = [f"Based on your {query_type} query, here's my analysis:\n\n"]
         
         if insights:
-            analysis += "Key Insights:\n"
-            for i, insight in enumerate(insights, 1):
-                analysis += f"{i}. {insight}\n"
+            parts.append("Key Insights:\n")
+            parts.extend(f"{i}. {insight}\n" for i, insight in enumerate(insights, 1))
         
-        analysis += f"\nI analyzed your request using {len(state.agent_results) - 1} specialized agents "
-        analysis += f"with an overall confidence of {state.agent_results.get('query_analysis', type('obj', (object,), {'data': {'complexity': 'medium'}})).data.get('complexity', 'medium')} complexity."
+        parts.append(f"\nI analyzed your request using {len(state.agent_results) - 1} specialized agents ")
+        parts.append(f"with an overall confidence of {state.agent_results.get('query_analysis', type('obj', (object,), {'data': {'complexity': 'medium'}})).data.get('complexity', 'medium')} complexity.")
         
-        return analysis
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -6,13 +6,12 @@ import asyncio
 import logging
 from typing import Dict, Any, List, Optional, TypedDict
 from datetime import datetime
-import json
 
 from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
-from .llm_integration import LLMManager
+from .llm_integration import LLMManager, prompt_json
 from ..data.data_enrichment import data_enrichment
 from ..data.data_pipeline import data_pipeline
 from ..scrapers.sleeper_api import SleeperAPI
@@ -147,8 +146,10 @@ class FantasyFootballWorkflow:
         try:
             # Get Sleeper data
             async with SleeperAPI() as sleeper:
-                user_data = await sleeper.get_user(state["username"])
-                league_data = await sleeper.get_league(state["league_id"])
+                user_data, league_data = await asyncio.gather(
+                    sleeper.get_user(state["username"]),
+                    sleeper.get_league(state["league_id"])
+                )
                 
                 if user_data and league_data:
                     user_id = user_data.get('user_id')
@@ -453,7 +454,7 @@ STRATEGIC PLANNING AGENT:
 - {len(strategy.get("opportunity_ranking", []))} ranked opportunities
 
 === DETAILED INSIGHTS ===
-{json.dumps(enriched_data.get("actionable_insights", []), indent=2)}
+{prompt_json(enriched_data.get("actionable_insights", []))}
 
 Please provide a comprehensive fantasy football analysis that synthesizes all agent outputs into actionable advice.
 """
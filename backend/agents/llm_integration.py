@@ -6,7 +6,7 @@ for complex fantasy football analysis and decision making.
 """
 
 import asyncio
-import json
+import orjson
 import logging
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
@@ -26,6 +26,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+def prompt_json(obj: Any) -> str:
+    """Pretty-print data for a prompt with orjson, keeping non-ASCII names as-is."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
 class ReActPromptGenerator:
     """
     Generates ReAct (Reasoning + Acting) prompts for fantasy football analysis.
@@ -70,7 +74,7 @@ LEAGUE CONTEXT:
 - Current Week: {league_data.get('current_week', 'Unknown')}
 
 ROSTER DATA:
-{json.dumps(roster_data, indent=2) if roster_data else 'No roster data available'}
+{prompt_json(roster_data) if roster_data else 'No roster data available'}
 
 AVAILABLE DATA:
 - Current player stats and projections
@@ -99,7 +103,7 @@ CONTEXT:
 - Recent snap count and target share trends
 
 PLAYERS TO ANALYZE:
-{json.dumps(players, indent=2)}
+{prompt_json(players)}
 
 AVAILABLE DATA:
 - Opponent defensive rankings vs position
@@ -127,10 +131,10 @@ Provide start/sit recommendations with confidence levels.
 TASK: Analyze waiver wire pickups and FAAB bidding strategy.
 
 ROSTER CONTEXT:
-{json.dumps(context.get('user_roster', {}), indent=2)}
+{prompt_json(context.get('user_roster', {}))}
 
 AVAILABLE PLAYERS:
-{json.dumps(available_players[:10], indent=2)}  # Limit for prompt size
+{prompt_json(available_players[:10])}  # Limit for prompt size
 
 LEAGUE SETTINGS:
 - FAAB Budget Remaining: {context.get('faab_remaining', 'Unknown')}
@@ -167,7 +171,7 @@ Giving: {trade_proposal.get('giving', [])}
 Receiving: {trade_proposal.get('receiving', [])}
 
 ROSTER CONTEXT:
-{json.dumps(context.get('user_roster', {}), indent=2)}
+{prompt_json(context.get('user_roster', {}))}
 
 LEAGUE CONTEXT:
 - Current Record: {context.get('record', 'Unknown')}
@@ -202,13 +206,12 @@ class LLMManager:
         self.anthropic_client = None
         self.prompt_generator = ReActPromptGenerator()
         
-        # Initialize clients if API keys are available
+        # Initialize async clients once if API keys are available; each keeps its own connection pool
         if OPENAI_AVAILABLE and os.getenv('OPENAI_API_KEY'):
-            openai.api_key = os.getenv('OPENAI_API_KEY')
-            self.openai_client = openai
+            self.openai_client = openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
         
         if ANTHROPIC_AVAILABLE and os.getenv('ANTHROPIC_API_KEY'):
-            self.anthropic_client = anthropic.Anthropic(
+            self.anthropic_client = anthropic.AsyncAnthropic(
                 api_key=os.getenv('ANTHROPIC_API_KEY')
             )
     
@@ -244,10 +247,46 @@ class LLMManager:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def analyze_with_system_prompt(self, system_prompt: str, user_prompt: str,
+                                         model: str = "claude") -> Dict[str, Any]:
+        """
+        Perform analysis with static instructions sent as the system prompt.
+        
+        Only the short user prompt varies per call. The instructions are too short
+        for provider prompt caching (1024-token minimum), so no cache marker is sent.
+        """
+        try:
+            if model == "claude" and self.anthropic_client:
+                response = await self._query_claude_with_system(system_prompt, user_prompt)
+            elif model == "gpt4" and self.openai_client:
+                response = await self._query_gpt4_with_system(system_prompt, user_prompt)
+            else:
+                # Fallback to structured analysis
+                response = self._generate_structured_fallback(user_prompt)
+            
+            # Parse ReAct response
+            parsed_response = self._parse_react_response(response)
+            
+            return {
+                "analysis": response,
+                "structured_output": parsed_response,
+                "model_used": model,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"LLM analysis failed: {str(e)}")
+            return {
+                "analysis": f"Analysis failed: {str(e)}",
+                "structured_output": {},
+                "model_used": "fallback",
+                "timestamp": datetime.now().isoformat()
+            }
+    
     async def _query_claude(self, prompt: str) -> str:
         """Query Claude using Anthropic API."""
         try:
-            message = self.anthropic_client.messages.create(
+            message = await self.anthropic_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=2000,
                 temperature=0.7,
@@ -263,10 +302,7 @@ class LLMManager:
     async def _query_gpt4(self, prompt: str) -> str:
         """Query GPT-4 using OpenAI API."""
         try:
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-            
-            response = await client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are an expert fantasy football analyst using ReAct methodology."},
@@ -280,6 +316,40 @@ class LLMManager:
             logger.error(f"GPT-4 query failed: {str(e)}")
             raise
     
+    async def _query_claude_with_system(self, system_prompt: str, user_prompt: str) -> str:
+        """Query Claude with separate system instructions."""
+        try:
+            message = await self.anthropic_client.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=2000,
+                temperature=0.7,
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
+            return message.content[0].text
+        except Exception as e:
+            logger.error(f"Claude query failed: {str(e)}")
+            raise
+    
+    async def _query_gpt4_with_system(self, system_prompt: str, user_prompt: str) -> str:
+        """Query GPT-4 with separate system instructions."""
+        try:
+            response = await self.openai_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=2000,
+                temperature=0.7
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"GPT-4 query failed: {str(e)}")
+            raise
+    
     def _generate_structured_fallback(self, prompt: str) -> str:
         """Generate structured fallback response when LLMs are unavailable."""
         
@@ -335,6 +405,8 @@ NEXT STEPS:
             
             lines = response.split('\n')
             current_section = None
+            # Final answer lines are joined once at the end rather than re-copied per line
+            final_answer_parts = []
             
             for line in lines:
                 line = line.strip()
@@ -347,9 +419,9 @@ NEXT STEPS:
                     parsed["observations"].append(line.replace('Observation:', '').strip())
                 elif line.startswith('Final Answer:'):
                     current_section = "final_answer"
-                    parsed["final_answer"] = line.replace('Final Answer:', '').strip()
+                    final_answer_parts = [line.replace('Final Answer:', '').strip()]
                 elif current_section == "final_answer" and line:
-                    parsed["final_answer"] += " " + line
+                    final_answer_parts.append(line)
                 
                 # Extract confidence if mentioned
                 if 'confidence' in line.lower() and '%' in line:
@@ -360,6 +432,7 @@ NEXT STEPS:
                     except:
                         pass
             
+            parsed["final_answer"] = " ".join(final_answer_parts)
             return parsed
             
         except Exception as e:
@@ -371,6 +444,10 @@ NEXT STEPS:
         prompt = self.prompt_generator.generate_team_analysis_prompt(context)
         return await self.analyze_with_react(prompt, "claude")
     
+    async def team_analysis_with_system(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Perform team-level analysis with static instructions as the system prompt."""
+        return await self.analyze_with_system_prompt(system_prompt, user_prompt, "claude")
+    
     async def matchup_analysis(self, context: Dict[str, Any], players: List[str]) -> Dict[str, Any]:
         """Perform matchup analysis using ReAct prompting."""
         prompt = self.prompt_generator.generate_matchup_analysis_prompt(context, players)
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 import json
 from dataclasses import dataclass, asdict
 
+import aiohttp
+
 # Import all scrapers
 from ..scrapers.sleeper_api import SleeperAPI
 from ..scrapers.fantasypros_scraper import FantasyProsScraper
@@ -47,11 +49,18 @@ class RealTimeDataPipeline:
         }
         self.running = False
         self.background_tasks = []
+        # One pooled session shared by every scraper update instead of a pool per update
+        self.http: Optional[aiohttp.ClientSession] = None
         
     async def start_pipeline(self):
         """Start all background data collection tasks."""
         self.running = True
         
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        
         # Start individual scraper tasks
         tasks = [
             self._run_sleeper_updates(),
@@ -71,20 +80,28 @@ class RealTimeDataPipeline:
         for task in self.background_tasks:
             task.cancel()
         await asyncio.gather(*self.background_tasks, return_exceptions=True)
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
         logger.info("Data pipeline stopped")
         
     async def get_fresh_data(self, data_types: List[str] = None) -> Dict[str, Any]:
-        """Get fresh data from cache with timestamps."""
+        """Get fresh data from cache with timestamps.
+        
+        Sources are refreshed by the background tasks, so this is one in-memory
+        pass over the cache with no upstream calls; ages share a single clock read.
+        """
         if data_types is None:
             data_types = list(self.update_intervals.keys())
             
+        now = datetime.now()
         result = {}
         for data_type in data_types:
             if data_type in self.data_cache:
                 result[data_type] = {
                     'data': self.data_cache[data_type],
                     'last_updated': self.last_updates.get(data_type),
-                    'age_seconds': (datetime.now() - self.last_updates.get(data_type, datetime.min)).total_seconds()
+                    'age_seconds': (now - self.last_updates.get(data_type, datetime.min)).total_seconds()
                 }
             else:
                 result[data_type] = {
@@ -95,20 +112,27 @@ class RealTimeDataPipeline:
                 
         return result
         
-    async def force_update(self, data_type: str) -> DataUpdate:
-        """Force immediate update of specific data type."""
+    async def force_update(self, data_type: str,
+                           session: Optional[aiohttp.ClientSession] = None) -> DataUpdate:
+        """Force immediate update of specific data type.
+        
+        An optional shared ``session`` is reused by the API clients instead of
+        opening a new connection pool for the update; the pipeline's own session
+        is used otherwise.
+        """
+        session = session or self.http
         if data_type == 'sleeper_trending':
-            return await self._update_sleeper_data()
+            return await self._update_sleeper_data(session)
         elif data_type == 'fantasypros_rankings':
             return await self._update_fantasypros_data()
         elif data_type == 'reddit_sentiment':
             return await self._update_reddit_data()
         elif data_type == 'weather_data':
-            return await self._update_weather_data()
+            return await self._update_weather_data(session)
         elif data_type == 'vegas_odds':
-            return await self._update_vegas_data()
+            return await self._update_vegas_data(session)
         elif data_type == 'nfl_injuries':
-            return await self._update_nfl_data()
+            return await self._update_nfl_data(session)
         else:
             return DataUpdate(
                 source=data_type,
@@ -124,7 +148,7 @@ class RealTimeDataPipeline:
         """Background task for Sleeper data updates."""
         while self.running:
             try:
-                await self._update_sleeper_data()
+                await self._update_sleeper_data(self.http)
                 await asyncio.sleep(self.update_intervals['sleeper_trending'])
             except asyncio.CancelledError:
                 break
@@ -160,7 +184,7 @@ class RealTimeDataPipeline:
         """Background task for weather data updates."""
         while self.running:
             try:
-                await self._update_weather_data()
+                await self._update_weather_data(self.http)
                 await asyncio.sleep(self.update_intervals['weather_data'])
             except asyncio.CancelledError:
                 break
@@ -172,7 +196,7 @@ class RealTimeDataPipeline:
         """Background task for Vegas odds updates."""
         while self.running:
             try:
-                await self._update_vegas_data()
+                await self._update_vegas_data(self.http)
                 await asyncio.sleep(self.update_intervals['vegas_odds'])
             except asyncio.CancelledError:
                 break
@@ -184,7 +208,7 @@ class RealTimeDataPipeline:
         """Background task for NFL injury/news updates."""
         while self.running:
             try:
-                await self._update_nfl_data()
+                await self._update_nfl_data(self.http)
                 await asyncio.sleep(self.update_intervals['nfl_injuries'])
             except asyncio.CancelledError:
                 break
@@ -193,10 +217,10 @@ class RealTimeDataPipeline:
                 await asyncio.sleep(300)  # Retry in 5 minutes on error
     
     # Individual update methods
-    async def _update_sleeper_data(self) -> DataUpdate:
+    async def _update_sleeper_data(self, session: Optional[aiohttp.ClientSession] = None) -> DataUpdate:
         """Update Sleeper trending players and league data."""
         try:
-            async with SleeperAPI() as sleeper:
+            async with SleeperAPI(session=session) as sleeper:
                 trending_add = await sleeper.get_trending_players("add")
                 trending_drop = await sleeper.get_trending_players("drop")
                 
@@ -308,19 +332,14 @@ class RealTimeDataPipeline:
                 error_message=error_msg
             )
     
-    async def _update_weather_data(self) -> DataUpdate:
+    async def _update_weather_data(self, session: Optional[aiohttp.ClientSession] = None) -> DataUpdate:
         """Update weather data for outdoor games."""
         try:
-            weather = WeatherAPI()
+            weather = WeatherAPI(session=session)
             
             # Get weather for all outdoor NFL teams
-            outdoor_teams = [
-                "CHI", "GB", "BUF", "NE", "DEN", "KC", "PIT", "CLE", 
-                "CIN", "BAL", "WAS", "PHI", "CAR", "JAX", "MIA", "NYJ", "NYG"
-            ]
-            
             weather_data = {}
-            for team in outdoor_teams:
+            for team in weather.get_outdoor_teams():
                 weather_info = await weather.get_current_weather(team)
                 if weather_info:
                     weather_data[team] = weather_info
@@ -353,10 +372,10 @@ class RealTimeDataPipeline:
                 error_message=error_msg
             )
     
-    async def _update_vegas_data(self) -> DataUpdate:
+    async def _update_vegas_data(self, session: Optional[aiohttp.ClientSession] = None) -> DataUpdate:
         """Update Vegas odds and game totals."""
         try:
-            vegas = VegasOddsAPI()
+            vegas = VegasOddsAPI(session=session)
             
             # Get current week's NFL odds and analysis
             game_odds = await vegas.get_nfl_odds()
@@ -391,10 +410,10 @@ class RealTimeDataPipeline:
                 error_message=error_msg
             )
     
-    async def _update_nfl_data(self) -> DataUpdate:
+    async def _update_nfl_data(self, session: Optional[aiohttp.ClientSession] = None) -> DataUpdate:
         """Update NFL injury reports and player news."""
         try:
-            nfl = NFLAPI()
+            nfl = NFLAPI(session=session)
             
             # Get current injury and game data
             injury_reports = await nfl.get_injury_report()
@@ -29,7 +29,8 @@ class EmbeddingService:
         """Initialize the embedding model."""
         try:
             if SENTENCE_TRANSFORMERS_AVAILABLE:
-                self.model = SentenceTransformer(self.model_name)
+                # Model loading reads weights from disk, so keep it off the event loop
+                self.model = await asyncio.to_thread(SentenceTransformer, self.model_name)
                 logger.info(f"Initialized embedding model: {self.model_name}")
             else:
                 logger.warning("sentence-transformers not available, using fallback embeddings")
@@ -46,7 +47,7 @@ class EmbeddingService:
         try:
             if self.model:
                 # Use sentence transformers
-                embedding = self.model.encode(text, convert_to_tensor=False)
+                embedding = await asyncio.to_thread(self.model.encode, text, convert_to_tensor=False)
                 return embedding.tolist()
             else:
                 # Fallback to simple hash-based embedding
@@ -64,7 +65,7 @@ class EmbeddingService:
             
         try:
             if self.model:
-                embeddings = self.model.encode(texts, convert_to_tensor=False)
+                embeddings = await asyncio.to_thread(self.model.encode, texts, convert_to_tensor=False)
                 return [emb.tolist() for emb in embeddings]
             else:
                 return [self._generate_fallback_embedding(text) for text in texts]
@@ -16,16 +16,19 @@ class NFLAPI:
     NFL API client for official NFL data including stats, schedules, and injury reports.
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://api.nfl.com/v1"
-        self.session = None
+        # A session passed in by the caller is shared and left open on exit
+        self.session = session
+        self._owns_session = session is None
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
@@ -137,6 +140,6 @@ class NFLAPI:
             return {}
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
+        """Close the HTTP session unless it is shared with the caller."""
+        if self.session and self._owns_session:
             await self.session.close()
\ No newline at end of file
@@ -5,33 +5,74 @@ Sleeper API client for real-time fantasy football data.
 import aiohttp
 import asyncio
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 
 logger = logging.getLogger(__name__)
 
+# Sleeper asks clients to fetch the full player dump at most once a day
+NFL_PLAYERS_CACHE_TTL = 86400
+
 class SleeperAPI:
     """
     Enhanced Sleeper API client for comprehensive fantasy football data.
     """
     
-    def __init__(self):
+    # The NFL player dump is shared by every client instance in the process
+    _nfl_players: Optional[Dict[str, Any]] = None
+    _nfl_players_fetched_at = 0.0
+    _nfl_players_lock: Optional[asyncio.Lock] = None
+    
+    # Clients without their own session share one per event loop, so connections stay warm
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://api.sleeper.app/v1"
-        self.session = None
+        # Either the caller's session or the shared one; neither is closed on exit
+        self.session = session
+    
+    @classmethod
+    def shared_session(cls) -> aiohttp.ClientSession:
+        """Return the process-wide session for the running loop, opening it on first use."""
+        loop = asyncio.get_running_loop()
+        if cls._shared_session is None or cls._shared_session.closed or cls._shared_session_loop is not loop:
+            if cls._shared_session is not None and not cls._shared_session.closed:
+                cls._discard_session(cls._shared_session, cls._shared_session_loop)
+            cls._shared_session = aiohttp.ClientSession()
+            cls._shared_session_loop = loop
+        return cls._shared_session
+    
+    @staticmethod
+    def _discard_session(session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]):
+        """Close a session left behind by another event loop, on that loop if it is still running."""
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            logger.warning("Dropping Sleeper session whose event loop is no longer running")
+    
+    @classmethod
+    async def close_shared_session(cls):
+        """Close the process-wide session at application shutdown."""
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        cls._shared_session_loop = None
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = self.shared_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        pass
     
     async def _make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
         """Make async HTTP request to Sleeper API."""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = self.shared_session()
             
         try:
             url = f"{self.base_url}/{endpoint}"
@@ -83,9 +124,23 @@ class SleeperAPI:
         return result or []
     
     async def get_nfl_players(self) -> Dict[str, Any]:
-        """Get all NFL players."""
-        result = await self._make_request("players/nfl")
-        return result or {}
+        """Get all NFL players, cached process-wide for NFL_PLAYERS_CACHE_TTL seconds."""
+        cls = type(self)
+        if cls._nfl_players is not None and time.monotonic() - cls._nfl_players_fetched_at < NFL_PLAYERS_CACHE_TTL:
+            return cls._nfl_players
+        
+        if cls._nfl_players_lock is None:
+            cls._nfl_players_lock = asyncio.Lock()
+        async with cls._nfl_players_lock:
+            # Another caller may have refreshed the dump while we waited
+            if cls._nfl_players is None or time.monotonic() - cls._nfl_players_fetched_at >= NFL_PLAYERS_CACHE_TTL:
+                result = await self._make_request("players/nfl")
+                if result:
+                    cls._nfl_players = result
+                    cls._nfl_players_fetched_at = time.monotonic()
+        
+        # Serve the previous dump rather than nothing if a refresh fails
+        return cls._nfl_players or {}
     
     async def get_nfl_schedule(self, season: int = None) -> List[Dict[str, Any]]:
         """Get NFL schedule."""
@@ -212,21 +267,19 @@ class SleeperAPI:
     
     def format_player_names(self, player_ids: List[str], nfl_players: Dict[str, Any]) -> List[str]:
         """Convert player IDs to names."""
-        names = []
-        for player_id in player_ids or []:
-            if player_id in nfl_players:
-                player = nfl_players[player_id]
-                full_name = player.get('full_name', f'Player {player_id}')
-                names.append(full_name)
-        return names
+        # One dict lookup per id; the placeholder name is only formatted when it is needed
+        return [
+            player.get('full_name') or f'Player {player_id}'
+            for player_id in player_ids or []
+            if (player := nfl_players.get(player_id)) is not None
+        ]
     
     def get_roster_by_position(self, roster: Dict[str, Any], nfl_players: Dict[str, Any]) -> Dict[str, List[str]]:
         """Organize roster by position."""
         positions = {"QB": [], "RB": [], "WR": [], "TE": [], "K": [], "DEF": []}
         
         for player_id in roster.get('players', []):
-            if player_id in nfl_players:
-                player = nfl_players[player_id]
+            if (player := nfl_players.get(player_id)) is not None:
                 position = player.get('position', 'UNKNOWN')
                 if position in positions:
                     positions[position].append(player.get('full_name', player_id))
@@ -234,6 +287,5 @@ class SleeperAPI:
         return positions
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
\ No newline at end of file
+        """Sessions are shared, so there is nothing to close per client."""
+        pass
\ No newline at end of file
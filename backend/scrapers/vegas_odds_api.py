@@ -17,17 +17,20 @@ class VegasOddsAPI:
     Vegas Odds API client for NFL betting lines, totals, and player props.
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv('ODDS_API_KEY')
         self.base_url = "https://api.the-odds-api.com/v4"
-        self.session = None
+        # A session passed in by the caller is shared and left open on exit
+        self.session = session
+        self._owns_session = session is None
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
@@ -381,6 +384,6 @@ class VegasOddsAPI:
             return {}
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
+        """Close the HTTP session unless it is shared with the caller."""
+        if self.session and self._owns_session:
             await self.session.close()
\ No newline at end of file
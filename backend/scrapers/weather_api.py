@@ -5,6 +5,7 @@ Weather API client for NFL game weather conditions.
 import aiohttp
 import asyncio
 import logging
+import numpy as np
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
@@ -17,10 +18,14 @@ class WeatherAPI:
     Weather API client for getting game-day weather conditions.
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv('WEATHER_API_KEY')
         self.base_url = "https://api.openweathermap.org/data/2.5"
-        self.session = None
+        # A session passed in by the caller is shared and left open on exit
+        self.session = session
+        self._owns_session = session is None
+        self.max_concurrent_requests = 8
+        self._inflight = None
         
         # NFL stadium locations
         self.stadium_locations = {
@@ -58,42 +63,92 @@ class WeatherAPI:
             "WAS": {"city": "Landover", "state": "MD", "lat": 38.9076, "lon": -76.8645, "dome": False}
         }
         
+        # Parallel team/dome columns so outdoor stadiums are selected with one mask
+        self._teams = np.array(list(self.stadium_locations.keys()), dtype="U3")
+        self._domes = np.array([s["dome"] for s in self.stadium_locations.values()], dtype=bool)
+        
+        # Pre-encoded query strings per stadium; only the API key varies per request
+        self._query_suffix = {}
+        for team, stadium in self.stadium_locations.items():
+            suffix = f"lat={stadium['lat']}&lon={stadium['lon']}&units=imperial"
+            self._query_suffix[team] = suffix
+            self._query_suffix[team.lower()] = suffix
+        
+        # Accept both upper and lower case team codes without per-call str.upper()
+        self._stadium_any_case = {
+            **self.stadium_locations,
+            **{team.lower(): stadium for team, stadium in self.stadium_locations.items()}
+        }
+        
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with a bounded per-host connection pool."""
+        connector = aiohttp.TCPConnector(limit_per_host=16)
+        return aiohttp.ClientSession(connector=connector)
+    
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = self._create_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
-    async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Make async HTTP request to Weather API."""
+    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None,
+                            team: str = None) -> Optional[Dict[str, Any]]:
+        """Make async HTTP request to Weather API.
+        
+        When ``team`` is given, the precomputed stadium query string is used
+        instead of encoding ``params`` on every call.
+        """
         if not self.api_key:
             logger.warning("No weather API key provided")
             return None
             
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = self._create_session()
+        
+        # Bound simultaneous requests to the provider to avoid rate limits
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self.max_concurrent_requests)
             
         try:
-            params['appid'] = self.api_key
-            params['units'] = 'imperial'  # Fahrenheit, mph
+            if team is not None:
+                suffix = self._query_suffix.get(team) or self._query_suffix[team.upper()]
+                url = f"{self.base_url}/{endpoint}?{suffix}&appid={self.api_key}"
+                params = None
+            else:
+                params = dict(params or {})
+                params['appid'] = self.api_key
+                params['units'] = 'imperial'  # Fahrenheit, mph
+                url = f"{self.base_url}/{endpoint}"
             
-            url = f"{self.base_url}/{endpoint}"
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.error(f"Weather API error {response.status} for {endpoint}")
-                    return None
+            async with self._inflight:
+                async with self.session.get(url, params=params) as response:
+                    if response.status == 200:
+                        return await response.json()
+                    else:
+                        logger.error(f"Weather API error {response.status} for {endpoint}")
+                        return None
         except Exception as e:
             logger.error(f"Weather request failed for {endpoint}: {str(e)}")
             return None
     
+    def _get_stadium(self, team: str) -> Optional[Dict[str, Any]]:
+        """Look up a stadium by team code, falling back to upper-casing mixed-case input."""
+        stadium = self._stadium_any_case.get(team)
+        if stadium is None:
+            stadium = self.stadium_locations.get(team.upper())
+        return stadium
+    
+    def get_outdoor_teams(self) -> List[str]:
+        """Get team codes whose home stadium is exposed to the weather."""
+        return self._teams[np.where(~self._domes)[0]].tolist()
+    
     async def get_current_weather(self, team: str) -> Optional[Dict[str, Any]]:
         """Get current weather for a team's stadium."""
         try:
-            stadium = self.stadium_locations.get(team.upper())
+            stadium = self._get_stadium(team)
             if not stadium:
                 logger.error(f"Unknown team: {team}")
                 return None
@@ -109,12 +164,7 @@ class WeatherAPI:
                     "conditions": "indoor_controlled"
                 }
             
-            params = {
-                "lat": stadium["lat"],
-                "lon": stadium["lon"]
-            }
-            
-            weather_data = await self._make_request("weather", params)
+            weather_data = await self._make_request("weather", team=team)
             if not weather_data:
                 return None
             
@@ -127,7 +177,7 @@ class WeatherAPI:
     async def get_game_forecast(self, home_team: str, game_time: datetime) -> Optional[Dict[str, Any]]:
         """Get weather forecast for a specific game."""
         try:
-            stadium = self.stadium_locations.get(home_team.upper())
+            stadium = self._get_stadium(home_team)
             if not stadium:
                 logger.error(f"Unknown team: {home_team}")
                 return None
@@ -145,12 +195,7 @@ class WeatherAPI:
                 }
             
             # Use 5-day forecast endpoint
-            params = {
-                "lat": stadium["lat"],
-                "lon": stadium["lon"]
-            }
-            
-            forecast_data = await self._make_request("forecast", params)
+            forecast_data = await self._make_request("forecast", team=home_team)
             if not forecast_data:
                 return None
             
@@ -306,6 +351,8 @@ class WeatherAPI:
         """Get weather report for all games in a week."""
         try:
             weather_reports = []
+            impacted_games = []
+            summary = self._new_weather_summary()
             
             for game in week_games:
                 home_team = game.get("home_team")
@@ -319,17 +366,17 @@ class WeatherAPI:
                     if weather:
                         weather["away_team"] = game.get("away_team")
                         weather_reports.append(weather)
-            
-            # Identify games with significant weather impact
-            impacted_games = [
-                report for report in weather_reports 
-                if report.get("weather_impact") in ["moderate", "high"]
-            ]
+                        
+                        # Identify games with significant weather impact while
+                        # folding the report into the summary in the same pass
+                        if weather.get("weather_impact") in ("moderate", "high"):
+                            impacted_games.append(weather)
+                        self._update_weather_summary(summary, weather)
             
             return {
                 "week_weather": weather_reports,
                 "impacted_games": impacted_games,
-                "weather_summary": self._generate_weather_summary(weather_reports),
+                "weather_summary": summary,
                 "last_updated": datetime.now().isoformat()
             }
             
@@ -337,41 +384,51 @@ class WeatherAPI:
             logger.error(f"Failed to get weekly weather report: {str(e)}")
             return {}
     
+    def _new_weather_summary(self) -> Dict[str, Any]:
+        """Create an empty weekly weather summary."""
+        return {
+            "total_games": 0,
+            "dome_games": 0,
+            "outdoor_games": 0,
+            "high_impact_games": 0,
+            "moderate_impact_games": 0,
+            "wind_affected_games": 0,
+            "cold_weather_games": 0,
+            "precipitation_games": 0
+        }
+    
+    def _update_weather_summary(self, summary: Dict[str, Any], report: Dict[str, Any]) -> None:
+        """Fold a single game report into a weekly weather summary."""
+        summary["total_games"] += 1
+        
+        if report.get("dome"):
+            summary["dome_games"] += 1
+        else:
+            summary["outdoor_games"] += 1
+        
+        impact = report.get("weather_impact", "low")
+        if impact == "high":
+            summary["high_impact_games"] += 1
+        elif impact == "moderate":
+            summary["moderate_impact_games"] += 1
+        
+        if report.get("wind_speed", 0) > 15:
+            summary["wind_affected_games"] += 1
+        
+        if report.get("temperature", 70) < 45:
+            summary["cold_weather_games"] += 1
+        
+        conditions = report.get("conditions", "").lower()
+        if any(cond in conditions for cond in ["rain", "snow", "storm"]):
+            summary["precipitation_games"] += 1
+    
     def _generate_weather_summary(self, weather_reports: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary of weather impacts for the week."""
         try:
-            summary = {
-                "total_games": len(weather_reports),
-                "dome_games": 0,
-                "outdoor_games": 0,
-                "high_impact_games": 0,
-                "moderate_impact_games": 0,
-                "wind_affected_games": 0,
-                "cold_weather_games": 0,
-                "precipitation_games": 0
-            }
+            summary = self._new_weather_summary()
             
             for report in weather_reports:
-                if report.get("dome"):
-                    summary["dome_games"] += 1
-                else:
-                    summary["outdoor_games"] += 1
-                
-                impact = report.get("weather_impact", "low")
-                if impact == "high":
-                    summary["high_impact_games"] += 1
-                elif impact == "moderate":
-                    summary["moderate_impact_games"] += 1
-                
-                if report.get("wind_speed", 0) > 15:
-                    summary["wind_affected_games"] += 1
-                
-                if report.get("temperature", 70) < 45:
-                    summary["cold_weather_games"] += 1
-                
-                conditions = report.get("conditions", "").lower()
-                if any(cond in conditions for cond in ["rain", "snow", "storm"]):
-                    summary["precipitation_games"] += 1
+                self._update_weather_summary(summary, report)
             
             return summary
             
@@ -380,6 +437,6 @@ class WeatherAPI:
             return {}
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
+        """Close the HTTP session unless it is shared with the caller."""
+        if self.session and self._owns_session:
             await self.session.close()
\ No newline at end of file
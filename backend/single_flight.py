@@ -0,0 +1,42 @@
+"""
+Request coalescing for concurrent identical async calls.
+
+Kept free of app imports so it can be used (and tested) without the server stack.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+# In-flight upstream calls by key, so concurrent identical requests share one call
+_inflight: Dict[str, asyncio.Future] = {}
+
+class _LeaderCancelled(Exception):
+    """The caller running a shared call was cancelled before it finished"""
+
+async def single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Await factory() once for all concurrent callers with the same key and share its outcome"""
+    while (future := _inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            # The leader's own cancellation is not ours; take over or join whoever did
+            continue
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved so a call with no followers doesn't log it again
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
@@ -4,34 +4,343 @@ Breaking news webhook system for real-time fantasy football updates.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import random
+import re
+import time
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from datetime import datetime, timedelta
-import json
 import hashlib
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-from fastapi import HTTPException
 import aiohttp
+import numpy as np
+import orjson
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from ..data.data_pipeline import data_pipeline
-from ..data.data_enrichment import data_enrichment
 from ..agents.llm_integration import LLMManager
+from ..database.vector_store.embeddings import embedding_service
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Static analysis instructions sent as the system prompt for every news item
+BREAKING_NEWS_SYSTEM_PROMPT = """You are an expert fantasy football analyst reacting to breaking news.
+
+ANALYSIS REQUIREMENTS:
+Please provide a comprehensive fantasy football impact analysis including:
+
+1. IMMEDIATE IMPACT (Next 1-2 weeks):
+   - Which players are directly affected (positively/negatively)
+   - Recommended waiver wire pickups
+   - Players to bench or drop
+   - Lineup changes for this week
+
+2. ROS (Rest of Season) IMPACT:
+   - Long-term value changes
+   - Playoff implications
+   - Trade recommendations (buy/sell targets)
+
+3. SPECIFIC RECOMMENDATIONS:
+   - FAAB percentages for waiver targets
+   - Trade values (before market adjusts)
+   - Start/sit confidence changes
+   - Priority levels (urgent, high, medium, low)
+
+4. MARKET TIMING:
+   - How quickly will fantasy community react
+   - Window for advantageous moves
+   - Expected ownership/trade value changes
+
+Provide specific, actionable advice with confidence levels.
+"""
+
+# Per-item news details, filled in with str.format
+BREAKING_NEWS_CONTEXT_TEMPLATE = """BREAKING NEWS ANALYSIS REQUEST
+
+NEWS DETAILS:
+- Headline: {headline}
+- Content: {content}
+- Players Involved: {players}
+- Teams: {teams}
+- Categories: {categories}
+- Impact Level: {impact_level}
+- Source: {source}
+"""
+
+# Confidence adjustments by source reliability and impact level
+SOURCE_CONFIDENCE_BONUS = {
+    'espn': 0.2,
+    'nfl': 0.2,
+    'schefter': 0.2,
+    'twitter': -0.1,
+    'reddit': -0.1
+}
+
+IMPACT_CONFIDENCE_BONUS = {
+    'critical': 0.1,
+    'low': -0.1
+}
+
+# Integer-coded bonus tables for batch scoring; code 0 means "no adjustment"
+SOURCE_CODES = {source: code for code, source in enumerate(SOURCE_CONFIDENCE_BONUS, start=1)}
+IMPACT_CODES = {impact: code for code, impact in enumerate(IMPACT_CONFIDENCE_BONUS, start=1)}
+_SOURCE_BONUS_TABLE = np.array([0.0, *SOURCE_CONFIDENCE_BONUS.values()], dtype=np.float64)
+_IMPACT_BONUS_TABLE = np.array([0.0, *IMPACT_CONFIDENCE_BONUS.values()], dtype=np.float64)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _scores_batch_kernel(sources, impacts, source_table, impact_table):
+        out = np.empty(sources.shape[0], np.float64)
+        for i in prange(sources.shape[0]):
+            score = 0.7 + source_table[sources[i]] + impact_table[impacts[i]]
+            out[i] = min(0.95, max(0.3, score))
+        return out
+
+def _scores_batch(sources: np.ndarray, impacts: np.ndarray) -> np.ndarray:
+    """Confidence scores for int8-coded sources and impact levels."""
+    if NUMBA_AVAILABLE:
+        return _scores_batch_kernel(sources, impacts, _SOURCE_BONUS_TABLE, _IMPACT_BONUS_TABLE)
+    return np.clip(0.7 + _SOURCE_BONUS_TABLE[sources] + _IMPACT_BONUS_TABLE[impacts], 0.3, 0.95)
+
+# Category flags so helpers can branch on a single integer test
+CATEGORY_INJURY = 1
+CATEGORY_TRADE = 2
+CATEGORY_SUSPENSION = 4
+CATEGORY_LINEUP = 8
+CATEGORY_OPPORTUNITY = 16
+
+CATEGORY_BITS = {
+    'injury': CATEGORY_INJURY,
+    'trade': CATEGORY_TRADE,
+    'suspension': CATEGORY_SUSPENSION,
+    'lineup': CATEGORY_LINEUP,
+    'opportunity': CATEGORY_OPPORTUNITY
+}
+
+@dataclass(slots=True, frozen=True)
 class BreakingNews:
     """Breaking news item structure."""
     id: str
     source: str
     headline: str
     content: str
-    player_names: List[str]
-    teams: List[str]
+    player_names: Tuple[str, ...]
+    teams: Tuple[str, ...]
     impact_level: str  # critical, high, medium, low
-    categories: List[str]  # injury, trade, suspension, etc.
+    categories: Tuple[str, ...]  # injury, trade, suspension, etc.
     timestamp: datetime
     processed: bool = False
+    # Bitmask of known categories (CATEGORY_* flags) computed once per item
+    category_bits: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Sequence fields are stored as tuples so items stay hashable
+        object.__setattr__(self, "player_names", tuple(self.player_names))
+        object.__setattr__(self, "teams", tuple(self.teams))
+        object.__setattr__(self, "categories", tuple(self.categories))
+        bits = 0
+        for category in self.categories:
+            bits |= CATEGORY_BITS.get(category, 0)
+        object.__setattr__(self, "category_bits", bits)
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per ``per`` seconds up to ``rate``.
+    """
+    
+    def __init__(self, rate: int, per: float):
+        self.capacity = float(rate)
+        self.refill_rate = rate / per
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+    
+    def try_acquire(self) -> bool:
+        """Take a token if one is available without waiting."""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+    
+    def wait_time(self) -> float:
+        """Seconds until a token becomes available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.refill_rate)
+
+class CompositeRateLimiter:
+    """Rate limiter that only grants a request when every bucket has a token."""
+    
+    def __init__(self, *buckets: TokenBucket):
+        self.buckets = buckets
+    
+    def try_acquire(self) -> bool:
+        """Take a token from every bucket, or none if any bucket is empty."""
+        if any(bucket.wait_time() > 0 for bucket in self.buckets):
+            return False
+        for bucket in self.buckets:
+            bucket.try_acquire()
+        return True
+    
+    async def acquire(self):
+        """Wait until every bucket can grant a token, then take them."""
+        while not self.try_acquire():
+            await asyncio.sleep(max(bucket.wait_time() for bucket in self.buckets))
+
+# Severity designations that must match exactly for a cached analysis to be reused, as (bucket, regex)
+_SEVERITY_TERMS = (
+    ("season_ending", r"season[-\s]ending"),
+    ("week_to_week", r"week[-\s]to[-\s]week"),
+    ("day_to_day", r"day[-\s]to[-\s]day"),
+    ("out", r"out"),
+    ("questionable", r"questionable"),
+    ("doubtful", r"doubtful"),
+    ("probable", r"probable"),
+    ("ir", r"ir|injured reserve"),
+    ("pup", r"pup"),
+    ("minor", r"minor"),
+    ("severe", r"severe"),
+)
+SEVERITY_PATTERN = re.compile(
+    r"\b(?:" + "|".join(f"({regex})" for _, regex in _SEVERITY_TERMS) + r"|suspended\s+(\d+)\s+games?)\b",
+    re.IGNORECASE
+)
+_SUSPENSION_GROUP = len(_SEVERITY_TERMS) + 1
+
+def _severity_bucket(text: str) -> str:
+    """Normalize the first severity designation in the text, or '' if none."""
+    match = SEVERITY_PATTERN.search(text)
+    if not match:
+        return ""
+    if match.group(_SUSPENSION_GROUP):
+        return f"suspended_{match.group(_SUSPENSION_GROUP)}_games"
+    for (name, _), group in zip(_SEVERITY_TERMS, match.groups()):
+        if group:
+            return name
+    return ""
+
+class SemanticImpactCache:
+    """
+    Reuses LLM impact analyses for paraphrased reports of the same story.
+    
+    Entries match when their headline embeddings are close enough and their
+    lexical keys (normalized players, categories, severity and impact level) are identical,
+    so that similar wording about different players or a different injury
+    designation never shares an analysis.
+    
+    Entries expire after ``ttl``. To avoid every popular entry being recomputed
+    at the same moment, lookups use XFetch-style probabilistic early expiry:
+    as an entry nears its expiry, a single caller is asked to refresh it in
+    the background while the cached value keeps being served.
+    """
+    
+    def __init__(self, threshold: float = 0.92, maxsize: int = 1000,
+                 ttl: timedelta = timedelta(hours=6), beta: float = 1.0):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl.total_seconds()
+        self.beta = beta
+        self._entries: List[Dict[str, Any]] = []
+    
+    @staticmethod
+    def _cache_text(news: BreakingNews) -> str:
+        return f"{news.headline} {news.content[:200]}"
+    
+    @staticmethod
+    def _lexical_key(news: BreakingNews) -> Tuple[frozenset, frozenset, str, str]:
+        return (
+            frozenset(p.strip().lower() for p in news.player_names),
+            frozenset(c.strip().lower() for c in news.categories),
+            _severity_bucket(f"{news.headline} {news.content}"),
+            news.impact_level
+        )
+    
+    async def _embed(self, news: BreakingNews) -> np.ndarray:
+        embedding = np.asarray(
+            await embedding_service.generate_embedding(self._cache_text(news)),
+            dtype=np.float32
+        )
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+    
+    def _should_refresh_early(self, entry: Dict[str, Any], now: float) -> bool:
+        # XFetch: refresh when now - delta * beta * ln(rand) passes the expiry,
+        # where delta is how long the value took to compute
+        if entry["refreshing"]:
+            return False
+        jitter = entry["compute_seconds"] * self.beta * math.log(1.0 - random.random())
+        return now - jitter >= entry["expires_at"]
+    
+    async def lookup(self, news: BreakingNews) -> Tuple[Optional[Dict[str, Any]], np.ndarray, Optional[Dict[str, Any]]]:
+        """Find a cached analysis for the news item.
+        
+        Returns the cached analysis (or None), the query embedding so a miss
+        can be stored without embedding the text again, and the matched entry
+        when the caller should refresh it in the background (otherwise None).
+        """
+        embedding = await self._embed(news)
+        lexical_key = self._lexical_key(news)
+        now = time.time()
+        
+        # Drop expired entries so they are never served
+        self._entries = [e for e in self._entries if e["expires_at"] > now]
+        
+        candidates = [e for e in self._entries if e["lexical_key"] == lexical_key]
+        if not candidates:
+            return None, embedding, None
+        
+        scores = np.stack([e["embedding"] for e in candidates]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None, embedding, None
+        
+        entry = candidates[best]
+        if self._should_refresh_early(entry, now):
+            entry["refreshing"] = True
+            return entry["analysis"], embedding, entry
+        return entry["analysis"], embedding, None
+    
+    def store(self, news: BreakingNews, embedding: np.ndarray, analysis: Dict[str, Any],
+              compute_seconds: float = 0.0):
+        """Store an analysis for future paraphrase lookups."""
+        self._entries.append({
+            "news_id": news.id,
+            "embedding": embedding,
+            "lexical_key": self._lexical_key(news),
+            "analysis": analysis,
+            "expires_at": time.time() + self.ttl_seconds,
+            "compute_seconds": compute_seconds,
+            "refreshing": False
+        })
+        if len(self._entries) > self.maxsize:
+            del self._entries[:len(self._entries) - self.maxsize]
+    
+    def refresh(self, entry: Dict[str, Any], analysis: Dict[str, Any], compute_seconds: float):
+        """Replace an entry's analysis and restart its TTL."""
+        entry["analysis"] = analysis
+        entry["expires_at"] = time.time() + self.ttl_seconds
+        entry["compute_seconds"] = compute_seconds
+        entry["refreshing"] = False
 
 class BreakingNewsProcessor:
     """
@@ -40,14 +349,117 @@ class BreakingNewsProcessor:
     
     def __init__(self):
         self.llm_manager = LLMManager()
-        self.news_cache = {}
-        self.subscribers = []
-        self.processing_queue = asyncio.Queue()
+        # Bounded, insertion-ordered cache: oldest entries sit at the front so
+        # eviction and recent-window queries never scan the whole history
+        self.news_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.news_cache_maxsize = 10_000
+        self.news_cache_ttl = timedelta(hours=48)
+        self.subscribers: Dict[str, Callable] = {}
+        self.processing_queue = asyncio.Queue(maxsize=1024)
+        self.num_workers = 8
+        # Shared HTTP session for data refreshes, opened in start()
+        self.http: Optional[aiohttp.ClientSession] = None
+        self._workers: List[asyncio.Task] = []
+        self.queue_metrics = {
+            "enqueued_total": 0,
+            "dropped_events": 0,
+            "processed_total": 0,
+            "failures_total": 0,
+            "processing_latency_seconds": 0.0
+        }
+        self.semantic_cache = SemanticImpactCache()
+        self._background_tasks = set()
+        # Keep LLM calls under provider RPM / hourly limits during news bursts
+        self.llm_rate_limiter = CompositeRateLimiter(
+            TokenBucket(rate=60, per=60),
+            TokenBucket(rate=3000, per=3600)
+        )
+        # Futures for news ids currently being analyzed, shared by duplicate arrivals
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+    async def start(self):
+        """Start the background workers that drain the processing queue."""
+        
+        if self._workers:
+            return
+        
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.num_workers)
+        ]
+        logger.info("Started %d breaking news workers", self.num_workers)
+    
+    async def stop(self):
+        """Stop the background workers."""
         
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+    
+    def enqueue_breaking_news(self, news_item: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a news item for background processing and acknowledge immediately."""
+        
+        news_id = news_item.get('id') or self._generate_news_id(news_item)
+        
+        if self._get_cached_news(news_id) is not None or news_id in self._inflight:
+            return {"status": "already_processed", "news_id": news_id}
+        
+        try:
+            self.processing_queue.put_nowait({**news_item, "id": news_id})
+        except asyncio.QueueFull:
+            self.queue_metrics["dropped_events"] += 1
+            logger.warning("Breaking news queue full, dropping news: %s", news_id)
+            return {"status": "rejected", "news_id": news_id, "error": "processing queue full"}
+        
+        self.queue_metrics["enqueued_total"] += 1
+        return {"status": "queued", "news_id": news_id}
+    
+    async def _worker(self):
+        """Process queued news items until cancelled."""
+        
+        while True:
+            news_item = await self.processing_queue.get()
+            started = time.perf_counter()
+            try:
+                result = await self.process_breaking_news(news_item)
+                if result.get("status") == "error":
+                    self.queue_metrics["failures_total"] += 1
+                else:
+                    self.queue_metrics["processed_total"] += 1
+            except Exception as e:
+                self.queue_metrics["failures_total"] += 1
+                logger.error("Breaking news worker failed: %s", e)
+            finally:
+                self.queue_metrics["processing_latency_seconds"] += time.perf_counter() - started
+                self.processing_queue.task_done()
+    
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """Get backpressure metrics for the processing queue."""
+        
+        return {
+            **self.queue_metrics,
+            "queue_depth": self.processing_queue.qsize(),
+            "queue_capacity": self.processing_queue.maxsize,
+            "workers": len(self._workers)
+        }
+    
     async def process_breaking_news(self, news_item: Dict[str, Any]) -> Dict[str, Any]:
         """Process a breaking news item and generate fantasy impact analysis."""
         
         try:
+            # Read the clock once and reuse it for every timestamp of this request
+            now = datetime.now()
+            now_iso = now.isoformat()
+            
             # Create news object
             news = BreakingNews(
                 id=news_item.get('id', self._generate_news_id(news_item)),
@@ -58,94 +470,125 @@ class BreakingNewsProcessor:
                 teams=news_item.get('teams', []),
                 impact_level=news_item.get('impact_level', 'medium'),
                 categories=news_item.get('categories', []),
-                timestamp=datetime.now()
+                timestamp=now
             )
             
             # Skip if already processed
-            if news.id in self.news_cache:
+            if self._get_cached_news(news.id) is not None:
                 return {"status": "already_processed", "news_id": news.id}
             
-            # Analyze fantasy impact
-            impact_analysis = await self._analyze_fantasy_impact(news)
-            
-            # Store in cache
-            self.news_cache[news.id] = {
-                "news": news,
-                "impact_analysis": impact_analysis,
-                "processed_at": datetime.now()
-            }
-            
-            # Notify subscribers if high impact
-            if news.impact_level in ['critical', 'high']:
-                await self._notify_subscribers(news, impact_analysis)
-            
-            # Update data pipeline if needed
-            if news.categories and any(cat in ['injury', 'trade', 'lineup'] for cat in news.categories):
-                await self._trigger_data_refresh(news)
+            # Share the result of an identical item that is still being processed
+            inflight = self._inflight.get(news.id)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
             
-            return {
-                "status": "processed",
-                "news_id": news.id,
-                "impact_level": news.impact_level,
-                "fantasy_impact": impact_analysis,
-                "timestamp": news.timestamp.isoformat()
-            }
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[news.id] = future
+            try:
+                result = await self._process_news(news, now_iso)
+                future.set_result(result)
+                return result
+            except Exception as e:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited future does not log a warning
+                future.exception()
+                raise
+            finally:
+                if not future.done():
+                    future.cancel()
+                self._inflight.pop(news.id, None)
             
         except Exception as e:
-            logger.error(f"Breaking news processing failed: {e}")
+            logger.error("Breaking news processing failed: %s", e)
             return {"status": "error", "error": str(e)}
     
-    async def _analyze_fantasy_impact(self, news: BreakingNews) -> Dict[str, Any]:
+    async def _process_news(self, news: BreakingNews, now_iso: str) -> Dict[str, Any]:
+        """Analyze, cache and dispatch a news item that is not yet processed."""
+        
+        # Analyze fantasy impact
+        impact_analysis = await self._analyze_fantasy_impact(news, now_iso)
+        
+        # Store in cache
+        self._cache_news(news.id, {
+            "news": news,
+            "impact_analysis": impact_analysis,
+            "processed_at": datetime.now()
+        })
+        
+        # Notifying subscribers and refreshing data are independent, so overlap them
+        followups = []
+        
+        # Notify subscribers if high impact
+        if news.impact_level in ['critical', 'high']:
+            followups.append(self._notify_subscribers(news, impact_analysis, now_iso))
+        
+        # Update data pipeline if needed
+        if news.category_bits & (CATEGORY_INJURY | CATEGORY_TRADE | CATEGORY_LINEUP):
+            followups.append(self._trigger_data_refresh(news))
+        
+        if followups:
+            await asyncio.gather(*followups, return_exceptions=True)
+        
+        return {
+            "status": "processed",
+            "news_id": news.id,
+            "impact_level": news.impact_level,
+            "fantasy_impact": impact_analysis,
+            "timestamp": now_iso
+        }
+    
+    async def _analyze_fantasy_impact(self, news: BreakingNews, now_iso: str) -> Dict[str, Any]:
         """Analyze the fantasy football impact of breaking news."""
         
         try:
-            # Build context for LLM analysis
-            context = f"""
-BREAKING NEWS ANALYSIS REQUEST
-
-NEWS DETAILS:
-- Headline: {news.headline}
-- Content: {news.content}
-- Players Involved: {', '.join(news.player_names)}
-- Teams: {', '.join(news.teams)}
-- Categories: {', '.join(news.categories)}
-- Impact Level: {news.impact_level}
-- Source: {news.source}
-
-ANALYSIS REQUIREMENTS:
-Please provide a comprehensive fantasy football impact analysis including:
-
-1. IMMEDIATE IMPACT (Next 1-2 weeks):
-   - Which players are directly affected (positively/negatively)
-   - Recommended waiver wire pickups
-   - Players to bench or drop
-   - Lineup changes for this week
-
-2. ROS (Rest of Season) IMPACT:
-   - Long-term value changes
-   - Playoff implications
-   - Trade recommendations (buy/sell targets)
-
-3. SPECIFIC RECOMMENDATIONS:
-   - FAAB percentages for waiver targets
-   - Trade values (before market adjusts)
-   - Start/sit confidence changes
-   - Priority levels (urgent, high, medium, low)
-
-4. MARKET TIMING:
-   - How quickly will fantasy community react
-   - Window for advantageous moves
-   - Expected ownership/trade value changes
-
-Provide specific, actionable advice with confidence levels.
-"""
+            # Only the news details vary per call; the static requirements
+            # live in the system prompt
+            context = BREAKING_NEWS_CONTEXT_TEMPLATE.format(
+                headline=news.headline,
+                content=news.content,
+                players=', '.join(news.player_names),
+                teams=', '.join(news.teams),
+                categories=', '.join(news.categories),
+                impact_level=news.impact_level,
+                source=news.source
+            )
             
-            # Get LLM analysis
-            analysis_result = await self.llm_manager.team_analysis({
-                "breaking_news_context": context,
-                "news_categories": news.categories,
-                "impact_level": news.impact_level
-            })
+            # Reuse the analysis of a paraphrased report of the same story if we have one;
+            # a failed lookup is a miss, and without an embedding there is nothing to store
+            try:
+                analysis_result, cache_embedding, stale_entry = await self.semantic_cache.lookup(news)
+            except Exception as e:
+                logger.warning("Semantic cache lookup failed: %s", e)
+                analysis_result, cache_embedding, stale_entry = None, None, None
+            cache_hit = analysis_result is not None
+            
+            if stale_entry is not None:
+                # Serve the cached value now and recompute it off the request path
+                task = asyncio.create_task(self._refresh_semantic_entry(stale_entry, context))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            
+            if not cache_hit:
+                if news.impact_level in ('low', 'medium') and not self.llm_rate_limiter.try_acquire():
+                    # Don't queue low-priority news behind the limiter
+                    analysis_result = self._rate_limited_analysis(news)
+                else:
+                    if news.impact_level not in ('low', 'medium'):
+                        await self.llm_rate_limiter.acquire()
+                    
+                    # Get LLM analysis
+                    started = time.perf_counter()
+                    analysis_result = await self.llm_manager.team_analysis_with_system(
+                        BREAKING_NEWS_SYSTEM_PROMPT, context
+                    )
+                    if cache_embedding is not None:
+                        self.semantic_cache.store(
+                            news, cache_embedding, analysis_result, time.perf_counter() - started
+                        )
+            
+            confidence_score = self._calculate_confidence_score(news)
+            if cache_hit:
+                confidence_score = max(0.3, confidence_score - 0.05)
             
             # Structure the analysis
             structured_impact = {
@@ -163,16 +606,17 @@ Provide specific, actionable advice with confidence levels.
                     f"📅 Immediate action window: {self._calculate_action_window(news)}",
                     f"👥 Players affected: {', '.join(news.player_names[:3])}{'...' if len(news.player_names) > 3 else ''}"
                 ],
-                "confidence_score": self._calculate_confidence_score(news),
+                "confidence_score": confidence_score,
                 "urgency_level": news.impact_level,
                 "analysis_text": analysis_result.get("analysis", "Impact analysis completed"),
-                "generated_at": datetime.now().isoformat()
+                "cache_hit": cache_hit,
+                "generated_at": now_iso
             }
             
             return structured_impact
             
         except Exception as e:
-            logger.error(f"Fantasy impact analysis failed: {e}")
+            logger.error("Fantasy impact analysis failed: %s", e)
             return {
                 "immediate_impact": {},
                 "ros_impact": {},
@@ -181,19 +625,53 @@ Provide specific, actionable advice with confidence levels.
                 "urgency_level": "low"
             }
     
+    async def _refresh_semantic_entry(self, entry: Dict[str, Any], context: str):
+        """Recompute a semantic cache entry that is close to expiring."""
+        
+        try:
+            # Refreshes are opportunistic; never wait on the rate limiter for them
+            if not self.llm_rate_limiter.try_acquire():
+                return
+            
+            started = time.perf_counter()
+            analysis_result = await self.llm_manager.team_analysis_with_system(
+                BREAKING_NEWS_SYSTEM_PROMPT, context
+            )
+            self.semantic_cache.refresh(entry, analysis_result, time.perf_counter() - started)
+            
+        except Exception as e:
+            logger.error("Semantic cache refresh failed: %s", e)
+        finally:
+            entry["refreshing"] = False
+    
+    def _rate_limited_analysis(self, news: BreakingNews) -> Dict[str, Any]:
+        """Templated analysis used when low-priority news is over the LLM rate limit."""
+        
+        return {
+            "analysis": (
+                f"Rule-based impact assessment for {news.impact_level} priority news "
+                f"({', '.join(news.categories) or 'general'}); LLM analysis deferred due to rate limiting."
+            ),
+            "structured_output": {},
+            "model_used": "rate_limited_template",
+            "timestamp": datetime.now().isoformat()
+        }
+    
     def _extract_affected_players(self, news: BreakingNews, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract affected players from analysis."""
         
-        affected = []
-        for player in news.player_names:
-            affected.append({
+        # Impact type only depends on the news categories, not the player
+        impact_type = self._determine_impact_type(None, news)
+        
+        return [
+            {
                 "name": player,
-                "impact_type": self._determine_impact_type(player, news),
+                "impact_type": impact_type,
                 "confidence": 0.8,
                 "timeframe": "immediate"
-            })
-        
-        return affected
+            }
+            for player in news.player_names
+        ]
     
     def _extract_waiver_targets(self, news: BreakingNews, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract waiver wire targets from breaking news."""
@@ -201,7 +679,7 @@ Provide specific, actionable advice with confidence levels.
         targets = []
         
         # Common waiver patterns based on news type
-        if 'injury' in news.categories:
+        if news.category_bits & CATEGORY_INJURY:
             # Look for handcuffs and replacements
             targets.append({
                 "type": "injury_replacement",
@@ -210,7 +688,7 @@ Provide specific, actionable advice with confidence levels.
                 "reasoning": "Immediate opportunity due to injury"
             })
             
-        elif 'trade' in news.categories:
+        elif news.category_bits & CATEGORY_TRADE:
             # Look for opportunity changes
             targets.append({
                 "type": "trade_beneficiary", 
@@ -224,37 +702,36 @@ Provide specific, actionable advice with confidence levels.
     def _extract_lineup_changes(self, news: BreakingNews, analysis: Dict[str, Any]) -> List[str]:
         """Extract recommended lineup changes."""
         
-        changes = []
+        if news.category_bits & CATEGORY_INJURY:
+            template = "❌ BENCH: {} - injury concern"
+        elif news.category_bits & CATEGORY_SUSPENSION:
+            template = "❌ DROP: {} - suspended"
+        elif news.category_bits & CATEGORY_TRADE:
+            template = "📊 MONITOR: {} - new team situation"
+        else:
+            return []
         
-        for player in news.player_names:
-            if 'injury' in news.categories:
-                changes.append(f"❌ BENCH: {player} - injury concern")
-            elif 'suspension' in news.categories:
-                changes.append(f"❌ DROP: {player} - suspended")
-            elif 'trade' in news.categories:
-                changes.append(f"📊 MONITOR: {player} - new team situation")
-                
-        return changes
+        return [template.format(player) for player in news.player_names]
     
     def _extract_value_changes(self, news: BreakingNews, analysis: Dict[str, Any]) -> Dict[str, float]:
         """Extract ROS value changes."""
         
-        changes = {}
+        if news.category_bits & CATEGORY_INJURY:
+            delta = -0.3  # 30% value decrease
+        elif news.category_bits & CATEGORY_TRADE:
+            delta = 0.1   # 10% value increase (opportunity)
+        else:
+            return {}
         
-        for player in news.player_names:
-            if 'injury' in news.categories:
-                changes[player] = -0.3  # 30% value decrease
-            elif 'trade' in news.categories:
-                changes[player] = 0.1   # 10% value increase (opportunity)
-                
-        return changes
+        # Every player gets the same delta, so build the mapping in one C-level call
+        return dict.fromkeys(news.player_names, delta)
     
     def _extract_trade_recs(self, news: BreakingNews, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract trade recommendations."""
         
         recs = []
         
-        if 'injury' in news.categories:
+        if news.category_bits & CATEGORY_INJURY:
             recs.append({
                 "action": "sell",
                 "target": news.player_names[0] if news.player_names else "injured_player",
@@ -264,14 +741,14 @@ Provide specific, actionable advice with confidence levels.
             
         return recs
     
-    def _determine_impact_type(self, player: str, news: BreakingNews) -> str:
+    def _determine_impact_type(self, player: Optional[str], news: BreakingNews) -> str:
         """Determine the type of impact on a player."""
         
-        if 'injury' in news.categories:
+        if news.category_bits & CATEGORY_INJURY:
             return "negative"
-        elif 'trade' in news.categories:
+        elif news.category_bits & CATEGORY_TRADE:
             return "mixed"
-        elif 'suspension' in news.categories:
+        elif news.category_bits & CATEGORY_SUSPENSION:
             return "negative"
         else:
             return "neutral"
@@ -279,21 +756,15 @@ Provide specific, actionable advice with confidence levels.
     def _calculate_confidence_score(self, news: BreakingNews) -> float:
         """Calculate confidence score for the analysis."""
         
-        base_confidence = 0.7
+        return self._confidence_for(news.source, news.impact_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _confidence_for(source: str, impact_level: str) -> float:
+        """Confidence from source reliability and impact level, clamped to [0.3, 0.95]."""
         
-        # Adjust based on source reliability
-        if news.source in ['espn', 'nfl', 'schefter']:
-            base_confidence += 0.2
-        elif news.source in ['twitter', 'reddit']:
-            base_confidence -= 0.1
-            
-        # Adjust based on impact level
-        if news.impact_level == 'critical':
-            base_confidence += 0.1
-        elif news.impact_level == 'low':
-            base_confidence -= 0.1
-            
-        return min(0.95, max(0.3, base_confidence))
+        confidence = 0.7 + SOURCE_CONFIDENCE_BONUS.get(source, 0.0) + IMPACT_CONFIDENCE_BONUS.get(impact_level, 0.0)
+        return min(0.95, max(0.3, confidence))
     
     def _calculate_action_window(self, news: BreakingNews) -> str:
         """Calculate the time window for taking action."""
@@ -308,10 +779,14 @@ Provide specific, actionable advice with confidence levels.
     def _generate_news_id(self, news_item: Dict[str, Any]) -> str:
         """Generate unique ID for news item."""
         
-        content = f"{news_item.get('headline', '')}{news_item.get('content', '')}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        content = f"{news_item.get('headline', '')}{news_item.get('content', '')}".encode()
+        
+        # IDs only need to be unique within the cache, so a fast non-cryptographic hash is enough
+        if XXHASH_AVAILABLE:
+            return format(xxhash.xxh3_64_intdigest(content), '016x')[:12]
+        return hashlib.blake2b(content, digest_size=8).hexdigest()[:12]
     
-    async def _notify_subscribers(self, news: BreakingNews, impact_analysis: Dict[str, Any]):
+    async def _notify_subscribers(self, news: BreakingNews, impact_analysis: Dict[str, Any], now_iso: str):
         """Notify subscribers of high-impact news."""
         
         notification = {
@@ -321,36 +796,89 @@ Provide specific, actionable advice with confidence levels.
             "impact_level": news.impact_level,
             "actionable_items": impact_analysis.get("actionable_items", []),
             "urgency": impact_analysis.get("urgency_level", "medium"),
-            "timestamp": news.timestamp.isoformat()
+            "timestamp": now_iso
         }
         
         # In a real implementation, this would send to WebSocket connections,
         # push notifications, email, etc.
-        logger.info(f"📢 HIGH IMPACT NEWS: {news.headline}")
+        logger.info("📢 HIGH IMPACT NEWS: %s", news.headline)
+        
+        # Serialize once and broadcast the same bytes to every subscriber
+        payload = orjson.dumps(notification)
+        
+        # Fan out so one slow subscriber does not hold up the rest
+        subscribers = list(self.subscribers.items())
+        results = await asyncio.gather(
+            *(self._deliver(callback, payload) for _, callback in subscribers),
+            return_exceptions=True
+        )
+        for (subscriber_id, _), result in zip(subscribers, results):
+            if isinstance(result, Exception):
+                logger.error("Subscriber %s notification failed: %s", subscriber_id, result)
+    
+    async def _deliver(self, callback, payload: bytes):
+        """Invoke a subscriber callback, awaiting it if it is a coroutine function."""
+        
+        result = callback(payload)
+        if asyncio.iscoroutine(result):
+            await result
         
     async def _trigger_data_refresh(self, news: BreakingNews):
         """Trigger immediate data refresh for affected areas."""
         
         try:
             # Force update of relevant data sources
-            if 'injury' in news.categories:
-                await data_pipeline.force_update('nfl_injuries')
+            if news.category_bits & CATEGORY_INJURY:
+                await data_pipeline.force_update('nfl_injuries', session=self.http)
                 
-            if 'trade' in news.categories:
-                await data_pipeline.force_update('sleeper_trending')
+            if news.category_bits & CATEGORY_TRADE:
+                await data_pipeline.force_update('sleeper_trending', session=self.http)
                 
-            logger.info(f"Data refresh triggered for news: {news.id}")
+            logger.info("Data refresh triggered for news: %s", news.id)
             
         except Exception as e:
-            logger.error(f"Data refresh failed: {e}")
+            logger.error("Data refresh failed: %s", e)
+    
+    def _get_cached_news(self, news_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached news entry, expiring it lazily once past its TTL."""
+        
+        entry = self.news_cache.get(news_id)
+        if entry is None:
+            return None
+        
+        if datetime.now() - entry["processed_at"] > self.news_cache_ttl:
+            del self.news_cache[news_id]
+            return None
+        
+        return entry
+    
+    def _cache_news(self, news_id: str, entry: Dict[str, Any]):
+        """Store a processed news entry, evicting expired and excess entries."""
+        
+        self.news_cache[news_id] = entry
+        self.news_cache.move_to_end(news_id)
+        
+        # Entries are ordered by processing time, so expired ones are at the front
+        cutoff_time = entry["processed_at"] - self.news_cache_ttl
+        while self.news_cache:
+            oldest = next(iter(self.news_cache.values()))
+            if oldest["processed_at"] >= cutoff_time:
+                break
+            self.news_cache.popitem(last=False)
+        
+        while len(self.news_cache) > self.news_cache_maxsize:
+            self.news_cache.popitem(last=False)
     
     async def get_recent_news(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get recent breaking news items."""
         
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
+        # Walk newest-first and stop at the first entry processed before the window
         recent_news = []
-        for news_id, news_data in self.news_cache.items():
+        for news_id, news_data in reversed(self.news_cache.items()):
+            if news_data["processed_at"] < cutoff_time:
+                break
             if news_data["news"].timestamp >= cutoff_time:
                 recent_news.append({
                     "id": news_id,
@@ -362,24 +890,59 @@ Provide specific, actionable advice with confidence levels.
                     "timestamp": news_data["news"].timestamp.isoformat()
                 })
         
-        # Sort by timestamp (newest first)
+        # Sort by timestamp (newest first); already nearly ordered
         recent_news.sort(key=lambda x: x["timestamp"], reverse=True)
         
         return recent_news
     
+    def score_recent(self, hours: int = 24) -> Dict[str, float]:
+        """Batch-compute confidence scores for recently processed news."""
+        
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        
+        news_ids = []
+        sources = []
+        impacts = []
+        for news_id, news_data in reversed(self.news_cache.items()):
+            if news_data["processed_at"] < cutoff_time:
+                break
+            news = news_data["news"]
+            news_ids.append(news_id)
+            sources.append(SOURCE_CODES.get(news.source, 0))
+            impacts.append(IMPACT_CODES.get(news.impact_level, 0))
+        
+        if not news_ids:
+            return {}
+        
+        scores = _scores_batch(np.array(sources, dtype=np.int8), np.array(impacts, dtype=np.int8))
+        return dict(zip(news_ids, scores.tolist()))
+    
     def add_subscriber(self, subscriber_id: str, callback):
-        """Add a subscriber for breaking news notifications."""
-        self.subscribers.append({"id": subscriber_id, "callback": callback})
+        """Add a subscriber for breaking news notifications.
+        
+        The callback receives the notification as JSON-encoded bytes, ready to
+        forward as-is (e.g. ``websocket.send_bytes``).
+        """
+        self.subscribers[subscriber_id] = callback
     
     def remove_subscriber(self, subscriber_id: str):
         """Remove a subscriber."""
-        self.subscribers = [s for s in self.subscribers if s["id"] != subscriber_id]
+        self.subscribers.pop(subscriber_id, None)
 
 class WebhookSimulator:
     """
     Simulates incoming webhooks for testing the breaking news system.
     """
     
+    _INJURY_HEADLINE = "{player} suffers {severity} injury".format
+    _INJURY_CONTENT = "{player} of the {team} has been diagnosed with a {severity} injury and his status is uncertain.".format
+    _TRADE_HEADLINE = "{player} traded to {to_team}".format
+    _TRADE_CONTENT = "The {from_team} have traded {player} to the {to_team} in exchange for draft picks.".format
+    _SUSPENSION_HEADLINE = "{player} suspended {weeks} games".format
+    _SUSPENSION_CONTENT = "The NFL has suspended {team} {player} for {weeks} games for violating league policy.".format
+    
+    _SEVERE_INJURIES = frozenset({"season-ending", "severe"})
+    
     def __init__(self, news_processor: BreakingNewsProcessor):
         self.news_processor = news_processor
         
@@ -388,11 +951,11 @@ class WebhookSimulator:
         
         news_item = {
             "source": "espn",
-            "headline": f"{player_name} suffers {severity} injury",
-            "content": f"{player_name} of the {team} has been diagnosed with a {severity} injury and his status is uncertain.",
+            "headline": self._INJURY_HEADLINE(player=player_name, severity=severity),
+            "content": self._INJURY_CONTENT(player=player_name, team=team, severity=severity),
             "player_names": [player_name],
             "teams": [team],
-            "impact_level": "high" if severity in ["season-ending", "severe"] else "medium",
+            "impact_level": "high" if severity in self._SEVERE_INJURIES else "medium",
             "categories": ["injury", "lineup"]
         }
         
@@ -403,8 +966,8 @@ class WebhookSimulator:
         
         news_item = {
             "source": "schefter",
-            "headline": f"{player_name} traded to {to_team}",
-            "content": f"The {from_team} have traded {player_name} to the {to_team} in exchange for draft picks.",
+            "headline": self._TRADE_HEADLINE(player=player_name, to_team=to_team),
+            "content": self._TRADE_CONTENT(player=player_name, from_team=from_team, to_team=to_team),
             "player_names": [player_name],
             "teams": [from_team, to_team],
             "impact_level": "high",
@@ -418,8 +981,8 @@ class WebhookSimulator:
         
         news_item = {
             "source": "nfl",
-            "headline": f"{player_name} suspended {weeks} games",
-            "content": f"The NFL has suspended {team} {player_name} for {weeks} games for violating league policy.",
+            "headline": self._SUSPENSION_HEADLINE(player=player_name, weeks=weeks),
+            "content": self._SUSPENSION_CONTENT(player=player_name, team=team, weeks=weeks),
             "player_names": [player_name],
             "teams": [team],
             "impact_level": "critical" if weeks >= 4 else "high",
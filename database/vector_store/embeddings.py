@@ -6,8 +6,15 @@ for vector similarity search and pattern recognition.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union, Callable
 import numpy as np
 from datetime import datetime
 
@@ -19,21 +26,136 @@ except ImportError:
     logging.warning("SentenceTransformers not available. Using mock embeddings.")
 
 try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import httpx
     import openai
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Saved ONNX exports, one subdirectory per model name
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fantasy_embed_onnx")
+
+# Loaded SentenceTransformer models shared by every service instance in the process
+_MODEL_CACHE: Dict[str, "SentenceTransformer"] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+if NUMBA_AVAILABLE:
+    # Compiled on the first search (or loaded from numba's disk cache), not at import
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _int8_cosine_kernel(query, codes):
+        out = np.empty(codes.shape[0], np.float32)
+        query_sq = 0
+        for j in range(query.shape[0]):
+            query_sq += np.int32(query[j]) * np.int32(query[j])
+        for i in prange(codes.shape[0]):
+            dot = 0
+            row_sq = 0
+            for j in range(codes.shape[1]):
+                value = np.int32(codes[i, j])
+                dot += value * np.int32(query[j])
+                row_sq += value * value
+            denom = np.sqrt(np.float32(row_sq)) * np.sqrt(np.float32(query_sq))
+            out[i] = dot / denom if denom > 0 else 0.0
+        return out
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+OPENAI_MAX_BATCH_SIZE = 2048  # Inputs per embeddings request allowed by the API
+OPENAI_MAX_CONCURRENT_REQUESTS = 8
+
+# Abbreviation and position expansions, applied in one pass between spaces
+FANTASY_TEXT_EXPANSIONS = {
+    "vs": "versus",
+    "w/": "with",
+    "w/o": "without",
+    "QB": "QB quarterback",
+    "RB": "RB running back",
+    "WR": "WR wide receiver",
+    "TE": "TE tight end"
+}
+FANTASY_TEXT_PATTERN = re.compile(
+    r"(?<= )(" + "|".join(re.escape(abbrev) for abbrev in FANTASY_TEXT_EXPANSIONS) + r")(?= )"
+)
+
+# Context markers for better embeddings, checked in order
+FANTASY_CONTEXT_MARKERS = (
+    (re.compile("start|sit", re.IGNORECASE), "lineup decision"),
+    (re.compile("trade|deal", re.IGNORECASE), "trade analysis"),
+    (re.compile("waiver|pickup", re.IGNORECASE), "waiver wire")
+)
+
+# Ordered (key, formatter) pairs used to build profile texts for embedding
+PLAYER_PROFILE_FIELDS = (
+    ("name", "Player: {}".format),
+    ("position", "Position: {}".format),
+    ("team", "Team: {}".format),
+    ("stats", lambda stats: "Stats: " + ", ".join(f"{k}: {v}" for k, v in stats.items())),
+    ("trends", lambda trends: "Trends: " + ", ".join(trends)),
+    ("analysis", "Analysis: {}".format)
+)
+MATCHUP_PROFILE_FIELDS = (
+    ("player", "Player: {}".format),
+    ("opponent", "Opponent: {}".format),
+    ("defense_rank", "Defense rank: {}".format),
+    ("game_script", "Game script: {}".format),
+    ("weather", "Weather: {}".format),
+    ("analysis", "Analysis: {}".format)
+)
+
+@lru_cache(maxsize=16384)
+def _preprocess_fantasy_text(text: str) -> str:
+    """Preprocess text for better fantasy football embeddings."""
+    text = FANTASY_TEXT_PATTERN.sub(lambda match: FANTASY_TEXT_EXPANSIONS[match.group(1)], text)
+    
+    for pattern, marker in FANTASY_CONTEXT_MARKERS:
+        if pattern.search(text):
+            return f"{marker}: {text}"
+    
+    return text
+
+@lru_cache(maxsize=4096)
+def _mock_embedding(text: str, dimension: int) -> np.ndarray:
+    """Deterministic unit vector derived from a stable hash of the text."""
+    # Expand the text hash to one int16 per dimension; no global RNG seeding
+    digest = hashlib.shake_256(text.encode("utf-8")).digest(dimension * 2)
+    embedding = np.frombuffer(digest, dtype=np.int16).astype(np.float32)
+    
+    # Normalize to unit vector
+    embedding /= np.linalg.norm(embedding) or 1.0
+    
+    # Cached vectors are shared between callers, so freeze them
+    embedding.flags.writeable = False
+    return embedding
+
 class EmbeddingService:
     """
     Service for generating text embeddings for vector storage.
     
     Supports multiple embedding models:
     - SentenceTransformers (local)
-    - OpenAI text-embedding-ada-002 (API)
+    - OpenAI text-embedding-3-small (API)
     - Mock embeddings (fallback)
+    
+    Every embedding returned is L2-normalized, so cosine similarity is a plain dot product.
     """
     
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", use_openai: bool = False):
@@ -41,16 +163,29 @@ class EmbeddingService:
         self.use_openai = use_openai
         self.model = None
         self.embedding_dimension = 384  # Default for all-MiniLM-L6-v2
+        self.embed_cache_size = 50000
+        self._embed_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        
+        # Single-text encodes are coalesced into batches by a background worker
+        self.max_encode_batch = 64
+        self.encode_window = 0.005
+        self._encode_queue: Optional[asyncio.Queue] = None
+        self._encode_worker_task: Optional[asyncio.Task] = None
+        # torch parallelizes each encode internally, so a couple of threads avoids oversubscription
+        self._encode_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sbert")
+        
+        self._openai_client = None
+        self._openai_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENT_REQUESTS)
         self._initialize_model()
     
     def _initialize_model(self) -> None:
         """Initialize the embedding model."""
         try:
             if self.use_openai and OPENAI_AVAILABLE:
-                self.embedding_dimension = 1536  # OpenAI ada-002 dimension
+                self.embedding_dimension = 1536  # OpenAI text-embedding-3-small dimension
                 logger.info("Using OpenAI embeddings")
             elif SENTENCE_TRANSFORMERS_AVAILABLE:
-                self.model = SentenceTransformer(self.model_name)
+                self.model = self._get_shared_model()
                 self.embedding_dimension = self.model.get_sentence_embedding_dimension()
                 logger.info(f"Initialized SentenceTransformer model: {self.model_name}")
             else:
@@ -60,136 +195,314 @@ class EmbeddingService:
             logger.error(f"Failed to initialize embedding model: {str(e)}")
             self.model = None
     
-    async def embed_text(self, text: str) -> List[float]:
+    def _get_shared_model(self) -> "SentenceTransformer":
+        """Return the process-wide model for this name, loading it on first use."""
+        with _MODEL_CACHE_LOCK:
+            model = _MODEL_CACHE.get(self.model_name)
+            if model is None:
+                model = self._load_sentence_transformer()
+                _MODEL_CACHE[self.model_name] = model
+            return model
+    
+    def _load_sentence_transformer(self) -> "SentenceTransformer":
+        """Load the SentenceTransformer in fp16 on GPU or on the ONNX Runtime backend on CPU."""
+        if TORCH_AVAILABLE and torch.cuda.is_available():
+            return SentenceTransformer(self.model_name, device="cuda").half()
+        
+        # CPU encodes use every core unless the deployment pinned torch's threads itself
+        if TORCH_AVAILABLE and "OMP_NUM_THREADS" not in os.environ:
+            torch.set_num_threads(os.cpu_count() or 1)
+        
+        # The first start exports the ONNX graph and saves it; later starts load the saved copy
+        export_dir = os.path.join(ONNX_CACHE_DIR, self.model_name.replace("/", "__"))
+        try:
+            if os.path.isfile(os.path.join(export_dir, "onnx", "model.onnx")):
+                return SentenceTransformer(export_dir, backend="onnx")
+            
+            model = SentenceTransformer(self.model_name, backend="onnx")
+            try:
+                model.save_pretrained(export_dir)
+            except Exception as e:
+                logger.warning(f"Could not save ONNX export to {export_dir}: {str(e)}")
+            return model
+        except Exception as e:
+            logger.info(f"ONNX backend unavailable, using default SentenceTransformer: {str(e)}")
+            return SentenceTransformer(self.model_name)
+    
+    async def embed_text(self, text: str) -> np.ndarray:
         """Generate embedding for a single text."""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            self._embed_cache.move_to_end(key)
+            return cached
+        
         try:
             if self.use_openai and OPENAI_AVAILABLE:
-                return await self._embed_with_openai(text)
+                embedding = await self._embed_with_openai(text)
             elif self.model is not None:
-                return await self._embed_with_sentence_transformer(text)
+                embedding = await self._embed_with_sentence_transformer(text)
             else:
-                return self._generate_mock_embedding(text)
+                embedding = self._generate_mock_embedding(text)
         except Exception as e:
+            # A transient backend failure must not pin a mock vector for this text in the cache
             logger.error(f"Failed to generate embedding: {str(e)}")
             return self._generate_mock_embedding(text)
+        
+        # Cached vectors are shared between callers, so freeze them
+        embedding.flags.writeable = False
+        self._embed_cache[key] = embedding
+        if len(self._embed_cache) > self.embed_cache_size:
+            self._embed_cache.popitem(last=False)
+        return embedding
     
-    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
+    async def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate an (N, D) float32 embedding matrix for multiple texts.
+        
+        Backend failures are raised rather than replaced with mock vectors, because
+        callers memoize and store these embeddings under the real model's signature.
+        """
         try:
             if self.use_openai and OPENAI_AVAILABLE:
                 return await self._embed_batch_with_openai(texts)
             elif self.model is not None:
                 return await self._embed_batch_with_sentence_transformer(texts)
             else:
-                return [self._generate_mock_embedding(text) for text in texts]
+                return self._generate_mock_embeddings(texts)
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {str(e)}")
-            return [self._generate_mock_embedding(text) for text in texts]
+            raise
     
-    async def _embed_with_openai(self, text: str) -> List[float]:
-        """Generate embedding using OpenAI API."""
-        try:
-            response = await openai.Embedding.acreate(
-                model="text-embedding-ada-002",
-                input=text
+    def _get_openai_client(self) -> "openai.AsyncOpenAI":
+        """Lazily create the shared OpenAI client, over HTTP/2 when h2 is installed."""
+        if self._openai_client is None:
+            try:
+                http_client = httpx.AsyncClient(http2=True)
+            except ImportError:
+                http_client = httpx.AsyncClient()
+            self._openai_client = openai.AsyncOpenAI(
+                api_key=os.getenv('OPENAI_API_KEY'),
+                http_client=http_client
             )
-            return response['data'][0]['embedding']
-        except Exception as e:
-            logger.error(f"OpenAI embedding failed: {str(e)}")
-            return self._generate_mock_embedding(text)
+        return self._openai_client
     
-    async def _embed_batch_with_openai(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for batch of texts using OpenAI API."""
-        try:
-            response = await openai.Embedding.acreate(
-                model="text-embedding-ada-002",
+    async def _create_openai_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Request embeddings for one chunk of texts under the concurrency cap."""
+        async with self._openai_semaphore:
+            response = await self._get_openai_client().embeddings.create(
+                model=OPENAI_EMBEDDING_MODEL,
                 input=texts
             )
-            return [item['embedding'] for item in response['data']]
-        except Exception as e:
-            logger.error(f"OpenAI batch embedding failed: {str(e)}")
-            return [self._generate_mock_embedding(text) for text in texts]
+        return np.asarray([item.embedding for item in response.data], dtype=np.float32)
     
-    async def _embed_with_sentence_transformer(self, text: str) -> List[float]:
-        """Generate embedding using SentenceTransformer."""
-        try:
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None, 
-                lambda: self.model.encode([text])[0]
-            )
-            return embedding.tolist()
-        except Exception as e:
-            logger.error(f"SentenceTransformer embedding failed: {str(e)}")
-            return self._generate_mock_embedding(text)
+    async def _embed_with_openai(self, text: str) -> np.ndarray:
+        """Generate embedding using OpenAI API; errors propagate to the caller."""
+        embeddings = await self._create_openai_embeddings([text])
+        return self._normalize(embeddings[0])
     
-    async def _embed_batch_with_sentence_transformer(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for batch of texts using SentenceTransformer."""
-        try:
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None,
-                lambda: self.model.encode(texts)
-            )
-            return embeddings.tolist()
-        except Exception as e:
-            logger.error(f"SentenceTransformer batch embedding failed: {str(e)}")
-            return [self._generate_mock_embedding(text) for text in texts]
+    async def _embed_batch_with_openai(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for batch of texts using OpenAI API."""
+        chunks = [
+            texts[i:i + OPENAI_MAX_BATCH_SIZE]
+            for i in range(0, len(texts), OPENAI_MAX_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*[self._create_openai_embeddings(chunk) for chunk in chunks])
+        return self._normalize(np.concatenate(results, axis=0))
     
-    def _generate_mock_embedding(self, text: str) -> List[float]:
-        """Generate a mock embedding based on text hash."""
-        # Create deterministic but varied embedding based on text
-        hash_value = hash(text)
-        np.random.seed(abs(hash_value) % 2**32)
+    async def _embed_with_sentence_transformer(self, text: str) -> np.ndarray:
+        """Generate embedding using SentenceTransformer; errors propagate to the caller."""
+        return await self._submit_encode(text)
+    
+    async def _submit_encode(self, text: str) -> np.ndarray:
+        """Queue a text for the batching encode worker and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+        worker = self._encode_worker_task
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._encode_queue = asyncio.Queue()
+            self._encode_worker_task = asyncio.create_task(self._encode_worker(self._encode_queue))
         
-        # Generate random vector with appropriate dimension
-        embedding = np.random.normal(0, 1, self.embedding_dimension)
+        future = loop.create_future()
+        self._encode_queue.put_nowait((text, future))
+        return await future
+    
+    async def _encode_worker(self, queue: asyncio.Queue) -> None:
+        """Collect queued texts for a short window and encode them in one batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.encode_window
+            while len(batch) < self.max_encode_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            texts = [text for text, _ in batch]
+            try:
+                # Run in thread pool to avoid blocking
+                embeddings = await loop.run_in_executor(
+                    self._encode_pool,
+                    lambda: self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(np.asarray(embedding, dtype=np.float32))
+    
+    async def _embed_batch_with_sentence_transformer(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for batch of texts using SentenceTransformer."""
+        # Sort by length so each batch pads only to its own longest text
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
         
-        # Normalize to unit vector
-        embedding = embedding / np.linalg.norm(embedding)
+        # Run in thread pool to avoid blocking
+        loop = asyncio.get_running_loop()
+        embeddings = await loop.run_in_executor(
+            self._encode_pool,
+            lambda: self.model.encode(sorted_texts, batch_size=32, convert_to_numpy=True,
+                                      normalize_embeddings=True)
+        )
         
-        return embedding.tolist()
+        # Scatter back to the caller's order
+        ordered = np.empty(embeddings.shape, dtype=np.float32)
+        ordered[order] = embeddings
+        return ordered
+    
+    def _generate_mock_embedding(self, text: str) -> np.ndarray:
+        """Generate a mock embedding based on text hash."""
+        return _mock_embedding(text, self.embedding_dimension)
     
-    def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
-        """Calculate cosine similarity between two embeddings."""
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalize a vector or each row of a matrix in place."""
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        embeddings /= norms + 1e-12
+        return embeddings
+    
+    def _generate_mock_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate an (N, D) matrix of mock embeddings."""
+        if not texts:
+            return np.empty((0, self.embedding_dimension), dtype=np.float32)
+        return np.vstack([self._generate_mock_embedding(text) for text in texts])
+    
+    def calculate_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+        """Calculate cosine similarity between two unit-normalized embeddings."""
         try:
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
-            
-            # Calculate cosine similarity
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
+            vec1 = np.asarray(embedding1, dtype=np.float32)
+            vec2 = np.asarray(embedding2, dtype=np.float32)
             
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
+            if SIMSIMD_AVAILABLE:
+                return 1.0 - float(simsimd.cosine(vec1, vec2))
             
-            similarity = dot_product / (norm1 * norm2)
-            return float(similarity)
+            # Embeddings are stored normalized, so cosine reduces to the dot product
+            return float(np.dot(vec1, vec2))
         except Exception as e:
             logger.error(f"Failed to calculate similarity: {str(e)}")
             return 0.0
     
-    async def find_most_similar(self, query_embedding: List[float], 
-                               candidate_embeddings: List[List[float]]) -> List[Tuple[int, float]]:
-        """Find most similar embeddings to the query."""
+    async def find_most_similar(self, query_embedding: np.ndarray, 
+                               candidate_embeddings: Union[List[np.ndarray], np.ndarray],
+                               k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Find most similar embeddings to the query; all embeddings are unit-normalized."""
         try:
-            similarities = []
+            if len(candidate_embeddings) == 0:
+                return []
             
-            for i, candidate in enumerate(candidate_embeddings):
-                similarity = self.calculate_similarity(query_embedding, candidate)
-                similarities.append((i, similarity))
+            # Stack candidates once and score them all in a single matrix-vector product
+            candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+            query = np.asarray(query_embedding, dtype=np.float32)
             
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
+            if SIMSIMD_AVAILABLE:
+                distances = np.asarray(simsimd.cdist(query[None, :], candidates, metric="cosine"))
+                similarities = 1.0 - distances.reshape(-1)
+                return self._rank_similarities(similarities, k)
             
-            return similarities
+            similarities = candidates @ query
+            return self._rank_similarities(similarities, k)
         except Exception as e:
             logger.error(f"Failed to find most similar: {str(e)}")
             return []
     
+    @staticmethod
+    def _rank_similarities(similarities: np.ndarray, k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Order similarity scores descending, keeping only the top k if given."""
+        # Select top-k without sorting everything, then order the selection
+        if k is not None and k < len(similarities):
+            if k <= 0:
+                return []
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top], kind="stable")]
+        else:
+            top = np.argsort(-similarities, kind="stable")
+        
+        return [(int(i), float(similarities[i])) for i in top]
+    
+    @staticmethod
+    def _quantize_int8(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Quantize a unit-normalized embedding to int8, returning codes and scale."""
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec = vec / norm
+        
+        max_abs = float(np.max(np.abs(vec))) if vec.size else 0.0
+        scale = 127.0 / max_abs if max_abs > 0 else 1.0
+        return np.round(vec * scale).astype(np.int8), scale
+    
+    def quantize_embeddings(self, embeddings: Union[List[np.ndarray], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Quantize a batch of embeddings to an (N, D) int8 matrix and per-row scales."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.size == 0:
+            return np.empty((0, self.embedding_dimension), dtype=np.int8), np.empty(0, dtype=np.float32)
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+        
+        max_abs = np.max(np.abs(matrix), axis=1)
+        scales = np.where(max_abs > 0, 127.0 / np.where(max_abs > 0, max_abs, 1.0), 1.0).astype(np.float32)
+        codes = np.round(matrix * scales[:, None]).astype(np.int8)
+        return codes, scales
+    
+    async def find_most_similar_int8(self, query_embedding: np.ndarray, candidate_codes: np.ndarray,
+                                     k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Find most similar int8-quantized embeddings to a float query."""
+        try:
+            if len(candidate_codes) == 0:
+                return []
+            
+            # Cosine is scale invariant, so per-row scales are not needed for ranking
+            query_codes, _ = self._quantize_int8(query_embedding)
+            candidate_codes = np.ascontiguousarray(candidate_codes, dtype=np.int8)
+            
+            if SIMSIMD_AVAILABLE:
+                distances = np.asarray(simsimd.cdist(query_codes[None, :], candidate_codes, metric="cosine"))
+                similarities = 1.0 - distances.reshape(-1)
+            elif NUMBA_AVAILABLE:
+                # Accumulates in int32 without materializing widened copies of the codes
+                similarities = _int8_cosine_kernel(query_codes, candidate_codes)
+            else:
+                candidates = candidate_codes.astype(np.int32)
+                query = query_codes.astype(np.int32)
+                norms = np.sqrt((candidates * candidates).sum(axis=1).astype(np.float32))
+                norms[norms == 0] = 1.0
+                query_norm = float(np.sqrt(np.dot(query, query))) or 1.0
+                similarities = (candidates @ query).astype(np.float32) / (norms * query_norm)
+            
+            return self._rank_similarities(similarities, k)
+        except Exception as e:
+            logger.error(f"Failed to find most similar int8: {str(e)}")
+            return []
+    
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current embedding model."""
         return {
@@ -198,7 +511,9 @@ class EmbeddingService:
             "embedding_dimension": self.embedding_dimension,
             "model_available": self.model is not None or (self.use_openai and OPENAI_AVAILABLE),
             "sentence_transformers_available": SENTENCE_TRANSFORMERS_AVAILABLE,
-            "openai_available": OPENAI_AVAILABLE
+            "openai_available": OPENAI_AVAILABLE,
+            "simsimd_available": SIMSIMD_AVAILABLE,
+            "numba_available": NUMBA_AVAILABLE
         }
 
 class FantasyEmbeddingService(EmbeddingService):
@@ -225,86 +540,30 @@ class FantasyEmbeddingService(EmbeddingService):
     
     def preprocess_fantasy_text(self, text: str) -> str:
         """Preprocess text for better fantasy football embeddings."""
-        # Convert common abbreviations
-        text = text.replace(" vs ", " versus ")
-        text = text.replace(" w/ ", " with ")
-        text = text.replace(" w/o ", " without ")
-        
-        # Expand position abbreviations
-        position_expansions = {
-            "QB": "quarterback",
-            "RB": "running back", 
-            "WR": "wide receiver",
-            "TE": "tight end"
-        }
-        
-        for abbrev, full in position_expansions.items():
-            text = text.replace(f" {abbrev} ", f" {abbrev} {full} ")
-        
-        # Add context markers for better embeddings
-        if any(keyword in text.lower() for keyword in ["start", "sit"]):
-            text = f"lineup decision: {text}"
-        elif any(keyword in text.lower() for keyword in ["trade", "deal"]):
-            text = f"trade analysis: {text}"
-        elif any(keyword in text.lower() for keyword in ["waiver", "pickup"]):
-            text = f"waiver wire: {text}"
-        
-        return text
+        return _preprocess_fantasy_text(text)
     
-    async def embed_fantasy_text(self, text: str) -> List[float]:
+    async def embed_fantasy_text(self, text: str) -> np.ndarray:
         """Generate embedding for fantasy football text with preprocessing."""
         processed_text = self.preprocess_fantasy_text(text)
         return await self.embed_text(processed_text)
     
-    async def embed_player_profile(self, player_data: Dict[str, Any]) -> List[float]:
+    async def embed_player_profile(self, player_data: Dict[str, Any]) -> np.ndarray:
         """Generate embedding for a player profile."""
-        # Create comprehensive text representation
-        profile_parts = []
-        
-        if "name" in player_data:
-            profile_parts.append(f"Player: {player_data['name']}")
-        
-        if "position" in player_data:
-            profile_parts.append(f"Position: {player_data['position']}")
-        
-        if "team" in player_data:
-            profile_parts.append(f"Team: {player_data['team']}")
-        
-        if "stats" in player_data:
-            stats_text = ", ".join([f"{k}: {v}" for k, v in player_data["stats"].items()])
-            profile_parts.append(f"Stats: {stats_text}")
-        
-        if "trends" in player_data:
-            trends_text = ", ".join(player_data["trends"])
-            profile_parts.append(f"Trends: {trends_text}")
-        
-        if "analysis" in player_data:
-            profile_parts.append(f"Analysis: {player_data['analysis']}")
-        
-        profile_text = " | ".join(profile_parts)
-        return await self.embed_fantasy_text(profile_text)
+        return await self.embed_fantasy_text(self._build_profile_text(player_data, PLAYER_PROFILE_FIELDS))
     
-    async def embed_matchup_analysis(self, matchup_data: Dict[str, Any]) -> List[float]:
+    async def embed_player_profiles(self, players: List[Dict[str, Any]]) -> np.ndarray:
+        """Generate embeddings for many player profiles in a single batch."""
+        texts = [
+            self.preprocess_fantasy_text(self._build_profile_text(player_data, PLAYER_PROFILE_FIELDS))
+            for player_data in players
+        ]
+        return await self.embed_texts(texts)
+    
+    async def embed_matchup_analysis(self, matchup_data: Dict[str, Any]) -> np.ndarray:
         """Generate embedding for matchup analysis."""
-        matchup_parts = []
-        
-        if "player" in matchup_data:
-            matchup_parts.append(f"Player: {matchup_data['player']}")
-        
-        if "opponent" in matchup_data:
-            matchup_parts.append(f"Opponent: {matchup_data['opponent']}")
-        
-        if "defense_rank" in matchup_data:
-            matchup_parts.append(f"Defense rank: {matchup_data['defense_rank']}")
-        
-        if "game_script" in matchup_data:
-            matchup_parts.append(f"Game script: {matchup_data['game_script']}")
-        
-        if "weather" in matchup_data:
-            matchup_parts.append(f"Weather: {matchup_data['weather']}")
-        
-        if "analysis" in matchup_data:
-            matchup_parts.append(f"Analysis: {matchup_data['analysis']}")
-        
-        matchup_text = " | ".join(matchup_parts)
-        return await self.embed_fantasy_text(matchup_text)
\ No newline at end of file
+        return await self.embed_fantasy_text(self._build_profile_text(matchup_data, MATCHUP_PROFILE_FIELDS))
+    
+    @staticmethod
+    def _build_profile_text(data: Dict[str, Any], fields: Tuple[Tuple[str, Callable[[Any], str]], ...]) -> str:
+        """Join the formatted fields present in data with ' | '."""
+        return " | ".join(formatter(data[key]) for key, formatter in fields if key in data)
@@ -69,9 +69,68 @@ class PatternStore:
         self.vector_manager = vector_manager or VectorManager()
         self.embedding_service = FantasyEmbeddingService()
         self.logger = logging.getLogger(__name__)
+        
+        # Writes are queued and flushed together to batch embedding and storage calls.
+        # Nothing flushes at interpreter exit: unless the owner awaits close() on shutdown,
+        # patterns queued within the last flush_delay seconds are lost.
+        self.flush_delay = 0.05
+        self.max_pending = 200
+        self._pending_player_patterns: List[Tuple[str, Dict[str, Any]]] = []
+        self._pending_analyses: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def _queue_write(self, player_pattern: Tuple[str, Dict[str, Any]] = None,
+                           analysis: Dict[str, Any] = None) -> None:
+        """Queue a pattern for the next flush, flushing now if the batch is full."""
+        if player_pattern is not None:
+            self._pending_player_patterns.append(player_pattern)
+        if analysis is not None:
+            self._pending_analyses.append(analysis)
+        
+        if len(self._pending_player_patterns) + len(self._pending_analyses) >= self.max_pending:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._debounced_flush())
+    
+    async def _debounced_flush(self) -> None:
+        """Flush queued patterns after a short delay so concurrent writes coalesce."""
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+    
+    async def flush(self) -> int:
+        """Store all queued patterns in batched writes and return how many were stored."""
+        player_patterns, self._pending_player_patterns = self._pending_player_patterns, []
+        analyses, self._pending_analyses = self._pending_analyses, []
+        
+        stored = 0
+        # A failed batch is logged and dropped; it must not take the other batch down with it
+        if player_patterns:
+            try:
+                stored += await self.vector_manager.store_player_patterns_batch(player_patterns)
+            except Exception as e:
+                self.logger.error(f"Failed to store player pattern batch: {str(e)}")
+        if analyses:
+            try:
+                stored += await self.vector_manager.store_expert_analyses_batch(analyses)
+            except Exception as e:
+                self.logger.error(f"Failed to store analysis batch: {str(e)}")
+        
+        pending = len(player_patterns) + len(analyses)
+        if stored < pending:
+            self.logger.error(f"Stored {stored} of {pending} queued patterns")
+        elif pending:
+            self.logger.info(f"Flushed {stored} patterns")
+        
+        return stored
+    
+    async def close(self) -> int:
+        """Write out everything still queued; owners must await this on shutdown to keep pending patterns."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        return await self.flush()
     
     async def store_player_pattern(self, pattern: PlayerPattern) -> bool:
-        """Store a player performance pattern."""
+        """Queue a player performance pattern; True means queued, not yet stored (see flush)."""
         try:
             # Create comprehensive pattern data
             pattern_data = {
@@ -88,23 +147,16 @@ class PatternStore:
                 "timestamp": pattern.created_at.isoformat()
             }
             
-            # Store in vector database
-            success = await self.vector_manager.store_player_pattern(
-                player_name=pattern.player_name,
-                pattern_data=pattern_data
-            )
-            
-            if success:
-                self.logger.info(f"Stored player pattern for {pattern.player_name}")
-            
-            return success
+            # Queue for the next batched write to the vector database
+            await self._queue_write(player_pattern=(pattern.player_name, pattern_data))
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to store player pattern: {str(e)}")
             return False
     
     async def store_matchup_pattern(self, pattern: MatchupPattern) -> bool:
-        """Store a matchup pattern."""
+        """Queue a matchup pattern; True means queued, not yet stored (see flush)."""
         try:
             # Create matchup analysis content
             analysis_data = {
@@ -119,20 +171,16 @@ class PatternStore:
                 "timestamp": pattern.created_at.isoformat()
             }
             
-            # Store in expert analysis collection
-            success = await self.vector_manager.store_expert_analysis(analysis_data)
-            
-            if success:
-                self.logger.info(f"Stored matchup pattern: {pattern.player_position} vs {pattern.opponent_team}")
-            
-            return success
+            # Queue for the next batched write to the expert analysis collection
+            await self._queue_write(analysis=analysis_data)
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to store matchup pattern: {str(e)}")
             return False
     
     async def store_market_pattern(self, pattern: MarketPattern) -> bool:
-        """Store a market sentiment or trade pattern."""
+        """Queue a market sentiment or trade pattern; True means queued, not yet stored (see flush)."""
         try:
             # Create market analysis content
             analysis_data = {
@@ -147,13 +195,9 @@ class PatternStore:
                 "timestamp": pattern.created_at.isoformat()
             }
             
-            # Store in expert analysis collection
-            success = await self.vector_manager.store_expert_analysis(analysis_data)
-            
-            if success:
-                self.logger.info(f"Stored market pattern for {pattern.subject}")
-            
-            return success
+            # Queue for the next batched write to the expert analysis collection
+            await self._queue_write(analysis=analysis_data)
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to store market pattern: {str(e)}")
@@ -6,11 +6,17 @@ expert analysis, and similarity-based recommendations.
 """
 
 import asyncio
-import json
+import atexit
+import hashlib
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
+import orjson
 from dataclasses import dataclass
 
 try:
@@ -21,19 +27,281 @@ except ImportError:
     CHROMADB_AVAILABLE = False
     logging.warning("ChromaDB not available. Vector operations will be simulated.")
 
-from .embeddings import EmbeddingService
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+from .embeddings import EmbeddingService, NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from .embeddings import _int8_cosine_kernel
 
 logger = logging.getLogger(__name__)
 
+# Approximate nearest-neighbour index settings applied when collections are created.
+# Embeddings are unit-normalized before storage and query, so inner product equals cosine.
+HNSW_INDEX_CONFIG = {
+    "hnsw:space": "ip",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64
+}
+
+# Documents per collection write call; ChromaDB inserts fastest in batches of 100-250
+ADD_BATCH_SIZE = 200
+# On-disk historical context cache; bump the schema version when result layout changes
+CONTEXT_CACHE_SCHEMA_VERSION = 1
+CONTEXT_CACHE_TTL = 3600
+
+# Ids per collection.delete call, to keep the underlying SQL IN lists bounded
+DELETE_BATCH_SIZE = 1000
+# Metadata rows fetched per collection.get call during cleanup
+CLEANUP_PAGE_SIZE = 10000
+
+# In-process indexes this large recall candidates from int8 codes, then rescore in float32
+COMPACT_RECALL_MIN_DOCUMENTS = 20000
+COMPACT_RECALL_OVERSAMPLE = 4
+
+# Sorted keys keep document text, and therefore content-hash ids, canonical
+CONTENT_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+COLLECTION_CONFIGS = {
+    "player_patterns": {
+        "description": "Historical player performance patterns and trends",
+        "metadata": {"type": "player_data", "version": "1.0"}
+    },
+    "expert_analysis": {
+        "description": "Expert rankings, analysis, and recommendations",
+        "metadata": {"type": "expert_data", "version": "1.0"}
+    },
+    "matchup_history": {
+        "description": "Historical matchup data and outcomes",
+        "metadata": {"type": "matchup_data", "version": "1.0"}
+    },
+    "trade_patterns": {
+        "description": "Historical trade values and market patterns",
+        "metadata": {"type": "trade_data", "version": "1.0"}
+    },
+    "social_sentiment": {
+        "description": "Social media sentiment and discussion analysis",
+        "metadata": {"type": "sentiment_data", "version": "1.0"}
+    }
+}
+
 @dataclass
 class VectorDocument:
     """Represents a document stored in the vector database."""
     id: str
     content: str
     metadata: Dict[str, Any]
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None
     timestamp: Optional[datetime] = None
 
+# Metadata timestamp for the current wall-clock second, rebuilt only when the second changes
+_ts_second = 0
+_ts_string = ""
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string at one-second resolution."""
+    global _ts_second, _ts_string
+    second = int(time.time())
+    if second != _ts_second:
+        _ts_string = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _ts_second = second
+    return _ts_string
+
+def _int8_cosine_scores(query_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Cosine similarity of one int8 query against int8 rows, without widening copies."""
+    if SIMSIMD_AVAILABLE:
+        return 1.0 - np.asarray(simsimd.cdist(query_codes[None, :], codes, metric="cosine")).reshape(-1)
+    return _int8_cosine_kernel(query_codes, codes)
+
+def _encode_int8(embeddings: np.ndarray) -> np.ndarray:
+    """Quantize float rows to int8 with a per-row scale that maps max |x| to 127."""
+    max_abs = np.max(np.abs(embeddings), axis=1, keepdims=True)
+    max_abs[max_abs == 0] = 1.0
+    return np.round(embeddings * (127.0 / max_abs)).astype(np.int8)
+
+class LocalVectorIndex:
+    """
+    In-process stand-in for a ChromaDB collection when ChromaDB is unavailable.
+    
+    Embeddings are kept in one contiguous float32 (N, D) buffer so a query is a
+    single matrix-vector product over every stored document. An int8 twin of the
+    buffer serves coarse recall for large indexes, with the float32 rows used to
+    rescore the candidates. Writes and queries run in worker threads, so they are
+    serialized with a lock.
+    """
+    
+    def __init__(self, dimension: int, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self._matrix = np.zeros((initial_capacity, dimension), dtype=np.float32)
+        self._codes = np.zeros((initial_capacity, dimension), dtype=np.int8)
+        self._size = 0
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+    
+    def count(self) -> int:
+        """Number of stored documents."""
+        return self._size
+    
+    def add(self, ids: List[str], embeddings: np.ndarray, documents: List[str],
+            metadatas: List[Dict[str, Any]]) -> None:
+        """Append documents, growing the embedding buffer geometrically."""
+        with self._lock:
+            embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dimension)
+            needed = self._size + len(embeddings)
+            if needed > len(self._matrix):
+                matrix = np.zeros((max(needed, 2 * len(self._matrix)), self.dimension), dtype=np.float32)
+                matrix[:self._size] = self._matrix[:self._size]
+                self._matrix = matrix
+                codes = np.zeros((len(matrix), self.dimension), dtype=np.int8)
+                codes[:self._size] = self._codes[:self._size]
+                self._codes = codes
+            
+            self._matrix[self._size:needed] = embeddings
+            self._codes[self._size:needed] = _encode_int8(embeddings)
+            self._size = needed
+            self._positions.update((doc_id, self._size - len(ids) + i) for i, doc_id in enumerate(ids))
+            self._ids.extend(ids)
+            self._documents.extend(documents)
+            self._metadatas.extend(metadatas)
+    
+    def upsert(self, ids: List[str], embeddings: np.ndarray, documents: List[str],
+               metadatas: List[Dict[str, Any]]) -> None:
+        """Replace documents whose ids already exist and append the rest."""
+        with self._lock:
+            embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dimension)
+            for i, doc_id in enumerate(ids):
+                row = self._positions.get(doc_id)
+                if row is None:
+                    self.add([doc_id], embeddings[i:i + 1], [documents[i]], [metadatas[i]])
+                else:
+                    self._matrix[row] = embeddings[i]
+                    self._codes[row] = _encode_int8(embeddings[i:i + 1])[0]
+                    self._documents[row] = documents[i]
+                    self._metadatas[row] = metadatas[i]
+    
+    def query(self, query_embeddings: np.ndarray, n_results: int = 10,
+              where: Optional[Dict[str, Any]] = None) -> Dict[str, List[List[Any]]]:
+        """Return the nearest documents per query in ChromaDB's result layout."""
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(-1, self.dimension)
+        with self._lock:
+            return self._query_locked(queries, n_results, where)
+    
+    def _query_locked(self, queries: np.ndarray, n_results: int,
+                      where: Optional[Dict[str, Any]]) -> Dict[str, List[List[Any]]]:
+        """Score queries against the buffer; the caller holds the lock."""
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        
+        mask = None
+        if where:
+            mask = np.fromiter(
+                (all(metadata.get(key) == value for key, value in where.items()) for metadata in self._metadatas),
+                dtype=bool,
+                count=self._size
+            )
+        
+        use_compact = (SIMSIMD_AVAILABLE or NUMBA_AVAILABLE) and self._size >= COMPACT_RECALL_MIN_DOCUMENTS
+        # Embeddings are unit-normalized, so one GEMM scores every query against every document
+        scores = None if use_compact else queries @ self._matrix[:self._size].T
+        for q, query in enumerate(queries):
+            if use_compact:
+                candidates = self._compact_recall(query, n_results * COMPACT_RECALL_OVERSAMPLE, mask)
+                row = self._matrix[candidates] @ query
+                k = min(n_results, len(candidates))
+            else:
+                candidates = None
+                row = scores[q] if mask is None else np.where(mask, scores[q], -np.inf)
+                k = min(n_results, self._size if mask is None else int(mask.sum()))
+            top = np.argpartition(-row, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.intp)
+            top = top[np.argsort(-row[top], kind="stable")]
+            distances = (1.0 - row[top]).tolist()
+            if candidates is not None:
+                top = candidates[top]
+            
+            results["ids"].append([self._ids[i] for i in top])
+            results["documents"].append([self._documents[i] for i in top])
+            results["metadatas"].append([self._metadatas[i] for i in top])
+            results["distances"].append(distances)
+        
+        return results
+    
+    def _compact_recall(self, query: np.ndarray, n_candidates: int,
+                        mask: Optional[np.ndarray]) -> np.ndarray:
+        """Rows of the best int8 matches for a query, excluding rows outside the mask."""
+        coarse = _int8_cosine_scores(_encode_int8(query[None, :])[0], self._codes[:self._size])
+        if mask is not None:
+            coarse = np.where(mask, coarse, -np.inf)
+        n_candidates = min(n_candidates, self._size if mask is None else int(mask.sum()))
+        if n_candidates <= 0:
+            return np.empty(0, dtype=np.intp)
+        # Ascending rows make the float32 gather a forward scan the hardware prefetcher can follow
+        return np.sort(np.argpartition(-coarse, n_candidates - 1)[:n_candidates])
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with TTL expiry for similarity search results.
+    """
+    
+    def __init__(self, max_size: int = 2000, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return a fresh cached value, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entries past max_size."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the underlying collections change."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
 class VectorManager:
     """
     Manages vector database operations for fantasy football data.
@@ -50,10 +318,27 @@ class VectorManager:
         self.embedding_service = EmbeddingService()
         self.client = None
         self.collections = {}
+        self._collections_lock = threading.Lock()
+        self._use_local_index = False
+        self._query_cache = QueryCache(max_size=2000, ttl=300)
+        
+        # Content-hash memo of document embeddings, kept warm across restarts
+        self.embed_memo_size = 10000
+        self._embed_memo: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embed_memo_path = os.path.join(db_path, "embedding_memo.npz")
+        self._load_embed_memo()
+        atexit.register(self._save_embed_memo)
+        
+        self._context_cache = None
+        if DISKCACHE_AVAILABLE:
+            self._context_cache = diskcache.Cache(
+                os.path.join(os.path.dirname(os.path.abspath(db_path)), "ctx_cache")
+            )
+        
         self._initialize_db()
     
     def _initialize_db(self) -> None:
-        """Initialize ChromaDB client and collections."""
+        """Initialize the ChromaDB client; collections are opened on first use."""
         try:
             if CHROMADB_AVAILABLE:
                 self.client = chromadb.PersistentClient(
@@ -63,268 +348,502 @@ class VectorManager:
                         allow_reset=True
                     )
                 )
-                self._create_collections()
             else:
-                logger.warning("ChromaDB not available. Using simulation mode.")
+                logger.warning("ChromaDB not available. Using in-process vector indexes.")
                 self.client = None
+                self._use_local_index = True
         except Exception as e:
             logger.error(f"Failed to initialize ChromaDB: {str(e)}")
             self.client = None
     
-    def _create_collections(self) -> None:
-        """Create vector collections for different data types."""
-        if not self.client:
-            return
-        
-        collection_configs = {
-            "player_patterns": {
-                "description": "Historical player performance patterns and trends",
-                "metadata": {"type": "player_data", "version": "1.0"}
-            },
-            "expert_analysis": {
-                "description": "Expert rankings, analysis, and recommendations",
-                "metadata": {"type": "expert_data", "version": "1.0"}
-            },
-            "matchup_history": {
-                "description": "Historical matchup data and outcomes",
-                "metadata": {"type": "matchup_data", "version": "1.0"}
-            },
-            "trade_patterns": {
-                "description": "Historical trade values and market patterns",
-                "metadata": {"type": "trade_data", "version": "1.0"}
-            },
-            "social_sentiment": {
-                "description": "Social media sentiment and discussion analysis",
-                "metadata": {"type": "sentiment_data", "version": "1.0"}
-            }
-        }
+    @property
+    def _backend_available(self) -> bool:
+        """Whether searches and writes can reach a real collection."""
+        return self.client is not None or self._use_local_index
+    
+    def _get_collection(self, name: str) -> Optional[Any]:
+        """Return the named collection, opening it on first use."""
+        collection = self.collections.get(name)
+        if collection is not None or name not in COLLECTION_CONFIGS:
+            return collection
         
-        for name, config in collection_configs.items():
+        with self._collections_lock:
+            collection = self.collections.get(name)
+            if collection is not None:
+                return collection
             try:
-                collection = self.client.get_or_create_collection(
-                    name=name,
-                    metadata=config["metadata"]
-                )
+                if self.client is not None:
+                    collection = self.client.get_or_create_collection(
+                        name=name,
+                        metadata={**COLLECTION_CONFIGS[name]["metadata"], **HNSW_INDEX_CONFIG}
+                    )
+                elif self._use_local_index:
+                    collection = LocalVectorIndex(self.embedding_service.embedding_dimension)
+                else:
+                    return None
                 self.collections[name] = collection
                 logger.info(f"Initialized collection: {name}")
             except Exception as e:
                 logger.error(f"Failed to create collection {name}: {str(e)}")
+            return collection
     
     async def store_player_pattern(self, player_name: str, pattern_data: Dict[str, Any]) -> bool:
         """Store a player performance pattern in the vector database."""
+        return await self.store_player_patterns_batch([(player_name, pattern_data)]) == 1
+    
+    async def store_expert_analysis(self, analysis_data: Dict[str, Any]) -> bool:
+        """Store expert analysis in the vector database."""
+        return await self.store_expert_analyses_batch([analysis_data]) == 1
+    
+    async def store_player_patterns_batch(self, patterns: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Store many (player_name, pattern_data) pairs with one embedding call and one write."""
         try:
-            if not self.client:
-                return self._simulate_storage()
-            
-            # Create content for embedding
-            content = self._create_player_pattern_content(player_name, pattern_data)
-            
-            # Generate embedding
-            embedding = await self.embedding_service.embed_text(content)
-            
-            # Create document
-            doc_id = f"player_pattern_{player_name}_{datetime.now().isoformat()}"
-            metadata = {
-                "player_name": player_name,
-                "pattern_type": pattern_data.get("type", "general"),
-                "season": pattern_data.get("season", 2023),
-                "position": pattern_data.get("position", "unknown"),
-                "timestamp": datetime.now().isoformat()
-            }
+            if not patterns:
+                return 0
+            if not self._backend_available:
+                self._simulate_storage()
+                return len(patterns)
             
-            # Store in collection
-            collection = self.collections.get("player_patterns")
-            if collection:
-                collection.add(
-                    ids=[doc_id],
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[metadata]
-                )
-                logger.info(f"Stored player pattern for {player_name}")
-                return True
-            
-            return False
+            collection = self._get_collection("player_patterns")
+            if not collection:
+                return 0
+            
+            contents = [
+                self._create_player_pattern_content(player_name, pattern_data)
+                for player_name, pattern_data in patterns
+            ]
+            embeddings = await self._embed_contents(contents)
+            
+            timestamp = _now_iso()
+            # Index inserts are CPU-bound, so run them off the event loop
+            await asyncio.to_thread(
+                self._upsert_in_chunks,
+                collection,
+                ids=[
+                    f"player_pattern_{self._content_id(player_name, content)}"
+                    for (player_name, _), content in zip(patterns, contents)
+                ],
+                embeddings=embeddings,
+                documents=contents,
+                metadatas=[
+                    {
+                        "player_name": player_name,
+                        "pattern_type": pattern_data.get("type", "general"),
+                        "season": pattern_data.get("season", 2023),
+                        "position": pattern_data.get("position", "unknown"),
+                        "timestamp": timestamp
+                    }
+                    for player_name, pattern_data in patterns
+                ]
+            )
+            self._invalidate_caches()
+            logger.info(f"Stored {len(patterns)} player patterns")
+            return len(patterns)
             
         except Exception as e:
-            logger.error(f"Failed to store player pattern: {str(e)}")
-            return False
+            logger.error(f"Failed to store player pattern batch: {str(e)}")
+            return 0
     
-    async def store_expert_analysis(self, analysis_data: Dict[str, Any]) -> bool:
-        """Store expert analysis in the vector database."""
+    async def store_expert_analyses_batch(self, analyses: List[Dict[str, Any]]) -> int:
+        """Store many expert analyses with one embedding call and one write."""
         try:
-            if not self.client:
-                return self._simulate_storage()
-            
-            # Create content for embedding
-            content = self._create_expert_analysis_content(analysis_data)
-            
-            # Generate embedding
-            embedding = await self.embedding_service.embed_text(content)
-            
-            # Create document
-            doc_id = f"expert_analysis_{analysis_data.get('source', 'unknown')}_{datetime.now().isoformat()}"
-            metadata = {
-                "source": analysis_data.get("source", "unknown"),
-                "expert": analysis_data.get("expert", "unknown"),
-                "analysis_type": analysis_data.get("type", "general"),
-                "confidence": analysis_data.get("confidence", 0.5),
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Store in collection
-            collection = self.collections.get("expert_analysis")
-            if collection:
-                collection.add(
-                    ids=[doc_id],
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[metadata]
-                )
-                logger.info(f"Stored expert analysis from {analysis_data.get('source')}")
-                return True
+            if not analyses:
+                return 0
+            if not self._backend_available:
+                self._simulate_storage()
+                return len(analyses)
             
-            return False
+            collection = self._get_collection("expert_analysis")
+            if not collection:
+                return 0
+            
+            contents = [self._create_expert_analysis_content(analysis_data) for analysis_data in analyses]
+            embeddings = await self._embed_contents(contents)
+            
+            timestamp = _now_iso()
+            # Index inserts are CPU-bound, so run them off the event loop
+            await asyncio.to_thread(
+                self._upsert_in_chunks,
+                collection,
+                ids=[
+                    "expert_analysis_" + self._content_id(
+                        analysis_data.get('source', 'unknown'), analysis_data.get('expert', 'unknown'), content
+                    )
+                    for analysis_data, content in zip(analyses, contents)
+                ],
+                embeddings=embeddings,
+                documents=contents,
+                metadatas=[
+                    {
+                        "source": analysis_data.get("source", "unknown"),
+                        "expert": analysis_data.get("expert", "unknown"),
+                        "analysis_type": analysis_data.get("type", "general"),
+                        "confidence": analysis_data.get("confidence", 0.5),
+                        "timestamp": timestamp
+                    }
+                    for analysis_data in analyses
+                ]
+            )
+            self._invalidate_caches()
+            logger.info(f"Stored {len(analyses)} expert analyses")
+            return len(analyses)
             
         except Exception as e:
-            logger.error(f"Failed to store expert analysis: {str(e)}")
-            return False
+            logger.error(f"Failed to store expert analysis batch: {str(e)}")
+            return 0
+    
+    async def _embed_contents(self, contents: List[str]) -> np.ndarray:
+        """Embed document contents, reusing memoized embeddings for repeated content."""
+        keys = [hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest() for content in contents]
+        embeddings = np.empty((len(contents), self.embedding_service.embedding_dimension), dtype=np.float32)
+        
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._embed_memo.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                self._embed_memo.move_to_end(key)
+                embeddings[i] = cached
+        
+        if missing:
+            computed = await self.embedding_service.embed_texts([contents[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+                self._embed_memo[keys[i]] = embeddings[i].copy()
+            while len(self._embed_memo) > self.embed_memo_size:
+                self._embed_memo.popitem(last=False)
+        
+        return self._normalize(embeddings)
+    
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalize a vector or each row of a matrix in place, copying only read-only input."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if not embeddings.flags.writeable:
+            embeddings = embeddings.copy()
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=-1, keepdims=True), 1e-12)
+        return embeddings
+    
+    def _embed_memo_signature(self) -> str:
+        """Identify the embedding model so a persisted memo is only reused with the same one."""
+        service = self.embedding_service
+        return f"{service.model_name}|{service.use_openai}|{service.model is not None}|{service.embedding_dimension}"
+    
+    def _load_embed_memo(self) -> None:
+        """Load the persisted embedding memo, if one exists for the current model."""
+        try:
+            with np.load(self._embed_memo_path, allow_pickle=False) as data:
+                if str(data["signature"]) != self._embed_memo_signature():
+                    return
+                for key, embedding in zip(data["keys"], data["embeddings"]):
+                    self._embed_memo[key.tobytes()] = embedding
+            logger.info(f"Loaded {len(self._embed_memo)} memoized embeddings")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Failed to load embedding memo: {str(e)}")
+    
+    def _save_embed_memo(self) -> None:
+        """Persist the embedding memo so restarts keep it warm."""
+        if not self._embed_memo:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._embed_memo_path) or ".", exist_ok=True)
+            keys = np.frombuffer(b"".join(self._embed_memo.keys()), dtype=np.uint8).reshape(-1, 16)
+            np.savez(
+                self._embed_memo_path,
+                signature=np.array(self._embed_memo_signature()),
+                keys=keys,
+                embeddings=np.stack(list(self._embed_memo.values()))
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save embedding memo: {str(e)}")
+    
+    @staticmethod
+    def _content_id(*parts: str) -> str:
+        """Deterministic document id so re-ingesting identical content upserts in place."""
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=12).hexdigest()
+    
+    @staticmethod
+    def _upsert_in_chunks(collection: Any, ids: List[str], embeddings: np.ndarray,
+                          documents: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Upsert documents in slices sized for efficient collection writes."""
+        # Upserts reject repeated ids within a call, so keep the last copy of each
+        latest = {doc_id: i for i, doc_id in enumerate(ids)}
+        if len(latest) < len(ids):
+            keep = sorted(latest.values())
+            ids = [ids[i] for i in keep]
+            embeddings = embeddings[keep]
+            documents = [documents[i] for i in keep]
+            metadatas = [metadatas[i] for i in keep]
+        
+        for start in range(0, len(ids), ADD_BATCH_SIZE):
+            end = start + ADD_BATCH_SIZE
+            collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
     
     async def find_similar_patterns(self, query: str, collection_name: str, 
                                    limit: int = 5, metadata_filter: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Find similar patterns using vector similarity search."""
         try:
-            if not self.client:
+            if not self._backend_available:
                 return self._simulate_similarity_search(query, limit)
             
+            cache_key = self._query_cache_key(query, collection_name, limit, metadata_filter)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+            
             # Generate query embedding
-            query_embedding = await self.embedding_service.embed_text(query)
+            query_embedding = self._normalize(await self.embedding_service.embed_text(query))
+            
+            return await self._find_similar_from_embedding(
+                query_embedding, collection_name, limit, metadata_filter, cache_key
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to find similar patterns: {str(e)}")
+            return []
+    
+    @staticmethod
+    def _query_cache_key(query: str, collection_name: str, limit: int,
+                         metadata_filter: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        """Build the query cache key for a search."""
+        return (
+            collection_name, query, limit,
+            frozenset(metadata_filter.items()) if metadata_filter else None
+        )
+    
+    async def _find_similar_from_embedding(self, query_embedding: np.ndarray, collection_name: str,
+                                           limit: int, metadata_filter: Optional[Dict[str, Any]],
+                                           cache_key: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        """Search one collection with a normalized query embedding and cache the results."""
+        # Get collection
+        collection = self._get_collection(collection_name)
+        if not collection:
+            logger.error(f"Collection {collection_name} not found")
+            return []
+        
+        # Perform similarity search off the event loop so searches can overlap
+        results = await asyncio.to_thread(
+            collection.query,
+            query_embeddings=[query_embedding],
+            n_results=limit,
+            where=metadata_filter
+        )
+        
+        formatted_results = self._format_query_results(results, 0) if results['ids'] else []
+        self._query_cache.put(cache_key, formatted_results)
+        return list(formatted_results)
+    
+    @staticmethod
+    def _format_query_results(results: Dict[str, Any], row: int) -> List[Dict[str, Any]]:
+        """Format one query's results, converting all distances to scores in one pass."""
+        ids = results['ids'][row]
+        if results.get('distances'):
+            scores = (1.0 - np.asarray(results['distances'][row], dtype=np.float32)).tolist()
+        else:
+            scores = [0.9] * len(ids)
+        return [
+            {"id": doc_id, "content": content, "metadata": metadata, "similarity_score": score}
+            for doc_id, content, metadata, score in zip(
+                ids, results['documents'][row], results['metadatas'][row], scores
+            )
+        ]
+    
+    async def find_similar_patterns_batch(self, queries: List[str], collection_name: str,
+                                          limit: int = 5, metadata_filter: Dict[str, Any] = None) -> List[List[Dict[str, Any]]]:
+        """Find similar patterns for many queries with one embedding call and one collection query."""
+        try:
+            if not queries:
+                return []
+            if not self._backend_available:
+                return [self._simulate_similarity_search(query, limit) for query in queries]
             
-            # Get collection
-            collection = self.collections.get(collection_name)
+            collection = self._get_collection(collection_name)
             if not collection:
                 logger.error(f"Collection {collection_name} not found")
-                return []
+                return [[] for _ in queries]
             
-            # Perform similarity search
-            results = collection.query(
-                query_embeddings=[query_embedding],
+            query_embeddings = self._normalize(await self.embedding_service.embed_texts(queries))
+            results = await asyncio.to_thread(
+                collection.query,
+                query_embeddings=query_embeddings,
                 n_results=limit,
                 where=metadata_filter
             )
             
-            # Format results
-            formatted_results = []
-            if results['ids']:
-                for i in range(len(results['ids'][0])):
-                    formatted_results.append({
-                        "id": results['ids'][0][i],
-                        "content": results['documents'][0][i],
-                        "metadata": results['metadatas'][0][i],
-                        "similarity_score": 1.0 - results['distances'][0][i] if 'distances' in results else 0.9
-                    })
-            
-            return formatted_results
+            if not results['ids']:
+                return [[] for _ in queries]
+            return [self._format_query_results(results, row) for row in range(len(queries))]
             
         except Exception as e:
-            logger.error(f"Failed to find similar patterns: {str(e)}")
-            return []
+            logger.error(f"Failed to find similar patterns batch: {str(e)}")
+            return [[] for _ in queries]
     
     async def find_player_comparisons(self, player_name: str, position: str = None, 
                                      limit: int = 5) -> List[Dict[str, Any]]:
         """Find players with similar patterns to the given player."""
+        comparisons = await self.find_player_comparisons_batch([player_name], position, limit)
+        return comparisons[0] if comparisons else []
+    
+    async def find_player_comparisons_batch(self, player_names: List[str], position: str = None,
+                                            limit: int = 5) -> List[List[Dict[str, Any]]]:
+        """Find comparable players for several players with a single batched search."""
         try:
-            # Create query for player comparison
-            query = f"Player performance patterns for {player_name}"
-            if position:
-                query += f" at {position} position"
+            # Create one comparison query per player
+            suffix = f" at {position} position" if position else ""
+            queries = [f"Player performance patterns for {player_name}{suffix}" for player_name in player_names]
             
             # Filter by position if provided
             metadata_filter = {"position": position} if position else None
             
             # Search for similar patterns
-            similar_patterns = await self.find_similar_patterns(
-                query=query,
+            similar_patterns = await self.find_similar_patterns_batch(
+                queries=queries,
                 collection_name="player_patterns",
                 limit=limit,
                 metadata_filter=metadata_filter
             )
             
-            # Extract player comparisons
-            comparisons = []
-            for pattern in similar_patterns:
-                if pattern["metadata"].get("player_name") != player_name:
-                    comparisons.append({
+            # Extract player comparisons, skipping each player's own patterns
+            return [
+                [
+                    {
                         "player": pattern["metadata"].get("player_name"),
                         "position": pattern["metadata"].get("position"),
                         "similarity_score": pattern["similarity_score"],
                         "pattern_type": pattern["metadata"].get("pattern_type"),
                         "season": pattern["metadata"].get("season")
-                    })
-            
-            return comparisons
+                    }
+                    for pattern in patterns
+                    if pattern["metadata"].get("player_name") != player_name
+                ]
+                for player_name, patterns in zip(player_names, similar_patterns)
+            ]
             
         except Exception as e:
             logger.error(f"Failed to find player comparisons: {str(e)}")
-            return []
+            return [[] for _ in player_names]
     
     async def get_historical_context(self, context_query: str, 
                                    context_type: str = "all") -> List[Dict[str, Any]]:
         """Get historical context for decision making."""
         try:
+            cache_key = self._context_cache_key(context_query, context_type)
+            if cache_key is not None:
+                cached = self._context_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            
             contexts = []
             
             # Determine which collections to search
-            collections_to_search = []
+            if not self._backend_available:
+                return []
             if context_type == "all":
-                collections_to_search = list(self.collections.keys())
+                collections_to_search = list(COLLECTION_CONFIGS)
             else:
-                collections_to_search = [context_type]
+                collections_to_search = [context_type] if context_type in COLLECTION_CONFIGS else []
             
-            # Search each relevant collection
+            # Serve cached collections directly; embed the query once for the rest
+            results_by_collection = {}
+            pending = []
             for collection_name in collections_to_search:
-                if collection_name in self.collections:
-                    results = await self.find_similar_patterns(
-                        query=context_query,
-                        collection_name=collection_name,
-                        limit=3
-                    )
-                    
-                    for result in results:
-                        contexts.append({
-                            "source": collection_name,
-                            "content": result["content"],
-                            "metadata": result["metadata"],
-                            "relevance_score": result["similarity_score"]
-                        })
-            
-            # Sort by relevance and return top results
-            contexts.sort(key=lambda x: x["relevance_score"], reverse=True)
-            return contexts[:10]
+                query_key = self._query_cache_key(context_query, collection_name, 3, None)
+                cached = self._query_cache.get(query_key)
+                if cached is not None:
+                    results_by_collection[collection_name] = cached
+                else:
+                    pending.append((collection_name, query_key))
+            
+            if pending:
+                # Normalize once; every collection search reuses the same vector
+                query_embedding = self._normalize(await self.embedding_service.embed_text(context_query))
+                searches = await asyncio.gather(
+                    *[
+                        self._find_similar_from_embedding(query_embedding, collection_name, 3, None, query_key)
+                        for collection_name, query_key in pending
+                    ],
+                    return_exceptions=True
+                )
+                for (collection_name, _), results in zip(pending, searches):
+                    if isinstance(results, Exception):
+                        logger.error(f"Failed to search {collection_name}: {str(results)}")
+                        continue
+                    results_by_collection[collection_name] = results
+            
+            for collection_name in collections_to_search:
+                for result in results_by_collection.get(collection_name, []):
+                    contexts.append({
+                        "source": collection_name,
+                        "content": result["content"],
+                        "metadata": result["metadata"],
+                        "relevance_score": result["similarity_score"]
+                    })
+            
+            # Select the most relevant results without sorting every candidate
+            top_contexts = []
+            if contexts:
+                scores = np.fromiter(
+                    (context["relevance_score"] for context in contexts), dtype=np.float32, count=len(contexts)
+                )
+                k = min(10, len(contexts))
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+                top_contexts = [contexts[i] for i in top]
+            if cache_key is not None:
+                self._context_cache.set(cache_key, top_contexts, expire=CONTEXT_CACHE_TTL)
+            return top_contexts
             
         except Exception as e:
             logger.error(f"Failed to get historical context: {str(e)}")
             return []
     
+    def _context_cache_key(self, context_query: str, context_type: str) -> Optional[str]:
+        """Key for the on-disk context cache, scoped to the current data version."""
+        if self._context_cache is None:
+            return None
+        version = self._context_cache.get("version", 0)
+        raw = f"{CONTEXT_CACHE_SCHEMA_VERSION}|{version}|{context_type}|{context_query}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached search results after the stored documents change."""
+        self._query_cache.clear()
+        if self._context_cache is not None:
+            # Bumping the version orphans every old key; they expire on their own
+            self._context_cache.incr("version", default=0)
+    
+    @staticmethod
+    def _dumps(obj: Any) -> str:
+        """Serialize a value to canonical JSON text for document content."""
+        if isinstance(obj, dict) and not obj:
+            return "{}"
+        return orjson.dumps(obj, option=CONTENT_JSON_OPTIONS).decode()
+    
     def _create_player_pattern_content(self, player_name: str, pattern_data: Dict[str, Any]) -> str:
         """Create textual content for player pattern embedding."""
-        content_parts = [f"Player: {player_name}"]
+        content = f"Player: {player_name}"
         
         if "position" in pattern_data:
-            content_parts.append(f"Position: {pattern_data['position']}")
+            content += f" | Position: {pattern_data['position']}"
         
         if "performance_metrics" in pattern_data:
-            metrics = pattern_data["performance_metrics"]
-            content_parts.append(f"Performance metrics: {json.dumps(metrics)}")
+            content += f" | Performance metrics: {self._dumps(pattern_data['performance_metrics'])}"
         
         if "trends" in pattern_data:
-            trends = pattern_data["trends"]
-            content_parts.append(f"Trends: {json.dumps(trends)}")
+            content += f" | Trends: {self._dumps(pattern_data['trends'])}"
         
         if "matchup_data" in pattern_data:
-            content_parts.append(f"Matchup data: {json.dumps(pattern_data['matchup_data'])}")
+            content += f" | Matchup data: {self._dumps(pattern_data['matchup_data'])}"
         
-        return " | ".join(content_parts)
+        return content
     
     def _create_expert_analysis_content(self, analysis_data: Dict[str, Any]) -> str:
         """Create textual content for expert analysis embedding."""
@@ -363,7 +882,7 @@ class VectorManager:
                 "metadata": {
                     "source": "simulation",
                     "confidence": 0.8 - (i * 0.1),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 },
                 "similarity_score": 0.9 - (i * 0.1)
             })
@@ -377,30 +896,21 @@ class VectorManager:
                 logger.info("Simulating cleanup operation")
                 return 100  # Mock cleanup count
             
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+            cutoff = np.datetime64(datetime.now() - timedelta(days=days_to_keep), 'us')
             total_deleted = 0
             
-            for collection_name, collection in self.collections.items():
+            for collection_name in COLLECTION_CONFIGS:
                 try:
-                    # Get all documents with timestamps
-                    results = collection.get(include=["metadatas"])
+                    collection = self._get_collection(collection_name)
+                    if collection is None:
+                        continue
                     
-                    ids_to_delete = []
-                    for i, metadata in enumerate(results['metadatas']):
-                        timestamp_str = metadata.get('timestamp')
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                if timestamp < cutoff_date:
-                                    ids_to_delete.append(results['ids'][i])
-                            except ValueError:
-                                continue
-                    
-                    # Delete old documents
-                    if ids_to_delete:
-                        collection.delete(ids=ids_to_delete)
-                        total_deleted += len(ids_to_delete)
-                        logger.info(f"Deleted {len(ids_to_delete)} old documents from {collection_name}")
+                    # Paging and deleting are blocking Chroma calls, so keep them off the event loop
+                    deleted = await asyncio.to_thread(self._delete_expired, collection, cutoff)
+                    if deleted:
+                        self._invalidate_caches()
+                        total_deleted += deleted
+                        logger.info(f"Deleted {deleted} old documents from {collection_name}")
                 
                 except Exception as e:
                     logger.error(f"Failed to cleanup collection {collection_name}: {str(e)}")
@@ -411,6 +921,49 @@ class VectorManager:
             logger.error(f"Failed to cleanup old data: {str(e)}")
             return 0
     
+    def _delete_expired(self, collection: Any, cutoff: np.datetime64) -> int:
+        """Page through a collection's metadata and delete documents older than the cutoff."""
+        deleted = 0
+        pending: List[str] = []
+        offset = 0
+        while True:
+            page = collection.get(include=["metadatas"], limit=CLEANUP_PAGE_SIZE, offset=offset)
+            page_ids = page['ids']
+            
+            # Compare every timestamp in the page against the cutoff in one vectorized pass
+            timestamps = self._parse_timestamps(
+                [(metadata or {}).get('timestamp') or '' for metadata in page['metadatas']]
+            )
+            pending.extend(np.asarray(page_ids, dtype=object)[timestamps < cutoff].tolist())
+            offset += len(page_ids)
+            
+            last_page = len(page_ids) < CLEANUP_PAGE_SIZE
+            if pending and (last_page or len(pending) >= DELETE_BATCH_SIZE):
+                for start in range(0, len(pending), DELETE_BATCH_SIZE):
+                    collection.delete(ids=pending[start:start + DELETE_BATCH_SIZE])
+                # Deleted rows no longer occupy offsets ahead of the next page
+                offset -= len(pending)
+                deleted += len(pending)
+                pending = []
+            
+            if last_page:
+                return deleted
+    
+    @staticmethod
+    def _parse_timestamps(timestamp_strs: List[str]) -> np.ndarray:
+        """Parse ISO timestamps into datetime64[us], with NaT for missing or malformed values."""
+        cleaned = [timestamp.rstrip('Z') for timestamp in timestamp_strs]
+        try:
+            return np.array([timestamp or 'NaT' for timestamp in cleaned], dtype='datetime64[us]')
+        except ValueError:
+            parsed = np.full(len(cleaned), np.datetime64('NaT'), dtype='datetime64[us]')
+            for i, timestamp in enumerate(cleaned):
+                try:
+                    parsed[i] = np.datetime64(datetime.fromisoformat(timestamp).replace(tzinfo=None), 'us')
+                except ValueError:
+                    continue
+            return parsed
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get vector database statistics."""
         try:
@@ -419,11 +972,15 @@ class VectorManager:
             
             stats = {
                 "status": "active",
-                "collections": {}
+                "collections": {},
+                "query_cache": self._query_cache.get_stats()
             }
             
-            for name, collection in self.collections.items():
+            for name in COLLECTION_CONFIGS:
                 try:
+                    collection = self._get_collection(name)
+                    if collection is None:
+                        raise RuntimeError("collection unavailable")
                     count = collection.count()
                     stats["collections"][name] = {
                         "document_count": count,
@@ -3,9 +3,9 @@
 Fantasy Optimize - Quick start script
 Run the Fantasy Football analysis server
 """
-import subprocess
 import sys
-import os
+
+from server import main as server_main
 
 def main():
     """Start the Fantasy Optimize server"""
@@ -15,8 +15,8 @@ def main():
     print("=" * 50)
     
     try:
-        # Run the server
-        subprocess.run([sys.executable, "server.py"], check=True)
+        # Run the server in this process so it shares our signal handling
+        server_main()
     except KeyboardInterrupt:
         print("\n👋 Fantasy Optimize server stopped.")
     except Exception as e:
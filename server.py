@@ -1,27 +1,130 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, Tuple
 import uvicorn
 import os
 from dotenv import load_dotenv
-import requests
-import json
+import httpx
+import orjson
 from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
+import hashlib
+import logging
+import queue
+import random
+import re
+import time
+import numpy as np
+
+try:
+    import anthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 # Import our real data pipeline
 from backend.data.data_pipeline import data_pipeline
 from backend.data.data_enrichment import data_enrichment
-from backend.scrapers.sleeper_api import SleeperAPI
 from backend.agents.langgraph_workflow import fantasy_workflow
 from backend.data.vector_population import vector_population
 from backend.webhooks.breaking_news import breaking_news_processor, webhook_simulator
+from backend.scrapers.sleeper_api import SleeperAPI
+from backend.single_flight import single_flight
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Fantasy Football Optimizer", version="1.0.0")
+# Handlers only enqueue records; a listener thread does the formatting and stream writes
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_handler = QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logger = logging.getLogger(__name__)
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create shared clients and background workers, then tear them down in reverse order."""
+    _log_listener.start()
+    # One long-lived client so connections, DNS and TLS sessions are reused across requests
+    app.state.http = create_http_client()
+    app.state.redis = create_redis_client()
+    app.state.llm_provider, app.state.llm_client = select_llm_client()
+    app.state.embedding_client = select_embedding_client()
+    
+    # Warm the player name cache in the background once the HTTP client exists
+    players_refresh_task = asyncio.create_task(refresh_player_names_forever())
+    
+    try:
+        await data_pipeline.start_pipeline()
+        logger.info("✅ Real-time data pipeline started successfully")
+    except Exception as e:
+        logger.error(f"❌ Failed to start data pipeline: {e}")
+    
+    try:
+        await breaking_news_processor.start()
+        logger.info("✅ Breaking news workers started successfully")
+    except Exception as e:
+        logger.error(f"❌ Failed to start breaking news workers: {e}")
+    
+    try:
+        yield
+    finally:
+        try:
+            await breaking_news_processor.stop()
+            logger.info("✅ Breaking news workers stopped successfully")
+        except Exception as e:
+            logger.error(f"❌ Error stopping breaking news workers: {e}")
+        
+        try:
+            await data_pipeline.stop_pipeline()
+            logger.info("✅ Data pipeline stopped successfully")
+        except Exception as e:
+            logger.error(f"❌ Error stopping data pipeline: {e}")
+        
+        players_refresh_task.cancel()
+        
+        await app.state.http.aclose()
+        app.state.http = None
+        await SleeperAPI.close_shared_session()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+            app.state.redis = None
+        
+        app.state.llm_provider, app.state.llm_client = None, None
+        app.state.embedding_client = None
+        for client in _llm_clients.values():
+            await client.close()
+        _llm_clients.clear()
+        
+        # Flushes any queued records before the worker exits
+        _log_listener.stop()
+
+app = FastAPI(
+    title="Fantasy Football Optimizer",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Configure CORS
 app.add_middleware(
@@ -61,66 +164,435 @@ class ChatResponse(BaseModel):
     analysis_type: str = "chat"
     confidence: float = 0.9
 
+class MultiAgentResponse(BaseModel):
+    success: bool = True
+    analysis_type: str = "multi_agent_coordination"
+    coordinated_analysis: str
+    confidence_score: float
+    action_items: List[str]
+    evidence_sources: List[str]
+    agents_completed: List[str]
+    execution_log: List[str]
+    agent_outputs: Dict[str, Any]
+    brutality_mode: bool
+    timestamp: str
+
+class PatternSearchResponse(BaseModel):
+    success: bool = True
+    query: str
+    patterns: List[Dict[str, Any]]
+    count: int
+    timestamp: str
+
+class PatternCategoryResponse(BaseModel):
+    success: bool = True
+    category: str
+    patterns: List[Dict[str, Any]]
+    count: int
+    timestamp: str
+
+class RecentNewsResponse(BaseModel):
+    success: bool = True
+    news_count: int
+    recent_news: List[Dict[str, Any]]
+    timeframe_hours: int
+    timestamp: str
+
+class SimulationResponse(BaseModel):
+    simulation: str
+    result: Dict[str, Any]
+    timestamp: str
+
 # Sleeper API functions
-def get_sleeper_user(username: str) -> Dict:
-    """Get Sleeper user data"""
+SLEEPER_BASE_URL = "https://api.sleeper.app/v1"
+
+# Sleeper asks clients to fetch the full player dump at most once a day; only names are kept
+PLAYERS_CACHE_TTL = 86400
+# Background refreshes that fail are retried this soon instead of waiting out a full TTL
+PLAYERS_RETRY_DELAY = 60
+_players_cache: Dict[str, Any] = {"data": None, "ts": 0.0, "last_ok": False}
+_players_lock = asyncio.Lock()
+
+# Last validators and parsed body per Sleeper path, for conditional GETs that may return 304
+CONDITIONAL_CACHE_SIZE = 512
+_validated_responses: "OrderedDict[str, Any]" = OrderedDict()
+
+# League rosters indexed by owner, refreshed at most once a minute per league
+ROSTERS_CACHE_TTL = 60
+ROSTERS_CACHE_SIZE = 256
+_rosters_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+# Keep-alive pool sized for concurrent Sleeper lookups across users; connect failures are retried
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+HTTP_CONNECT_RETRIES = 2
+# Connects fail fast so the retries above fit inside a request; reads keep the longer budget
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client, over HTTP/2 when h2 is installed."""
     try:
-        response = requests.get(f"https://api.sleeper.app/v1/user/{username}")
-        return response.json() if response.status_code == 200 else {}
-    except:
-        return {}
-
-def get_sleeper_league(league_id: str) -> Dict:
-    """Get Sleeper league data"""
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=HTTP_POOL_LIMITS, retries=HTTP_CONNECT_RETRIES)
+    except ImportError:
+        transport = httpx.AsyncHTTPTransport(limits=HTTP_POOL_LIMITS, retries=HTTP_CONNECT_RETRIES)
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport)
+
+# Sleeper lookups shared across workers and restarts through Redis, when REDIS_URL is set
+LEAGUE_CACHE_TTL = 3600
+
+def create_redis_client() -> Any:
+    """Connect to the Redis cache named by REDIS_URL, or None when it isn't configured"""
+    redis_url = os.getenv('REDIS_URL')
+    if not (redis_url and REDIS_AVAILABLE):
+        return None
+    return aioredis.from_url(redis_url)
+
+async def shared_cached(key: str, ttl: int, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Serve a value from Redis, or load it and store it there for ttl seconds; empty results aren't stored"""
+    redis_client = getattr(app.state, "redis", None)
+    if redis_client is None:
+        return await loader()
     try:
-        response = requests.get(f"https://api.sleeper.app/v1/league/{league_id}")
-        return response.json() if response.status_code == 200 else {}
-    except:
-        return {}
-
-def get_user_roster(league_id: str, user_id: str) -> Dict:
-    """Get user's roster in a league"""
+        cached = await redis_client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.warning(f"Redis read failed for {key}: {e}")
+    
+    value = await loader()
+    if value:
+        try:
+            await redis_client.set(key, orjson.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis write failed for {key}: {e}")
+    return value
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client on app.state, creating it if startup has not run."""
+    client = getattr(app.state, "http", None)
+    if client is None:
+        client = app.state.http = create_http_client()
+    return client
+
+async def _fetch_sleeper_json(path: str) -> Any:
+    """GET a Sleeper endpoint and parse it, or None on any failure"""
+    validated = _validated_responses.get(path)
+    headers = {}
+    if validated is not None:
+        etag, last_modified, _ = validated
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
     try:
-        rosters_response = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/rosters")
-        if rosters_response.status_code == 200:
-            rosters = rosters_response.json()
-            for roster in rosters:
-                if roster.get('owner_id') == user_id:
-                    return roster
-        return {}
+        response = await get_http_client().get(f"{SLEEPER_BASE_URL}/{path}", headers=headers)
+        if response.status_code == 304 and validated is not None:
+            _validated_responses.move_to_end(path)
+            return validated[2]
+        if response.status_code != 200:
+            return None
+        data = orjson.loads(response.content)
     except:
+        return None
+    
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag or last_modified:
+        _validated_responses[path] = (etag, last_modified, data)
+        _validated_responses.move_to_end(path)
+        while len(_validated_responses) > CONDITIONAL_CACHE_SIZE:
+            _validated_responses.popitem(last=False)
+    return data
+
+async def fetch_sleeper_json(path: str) -> Any:
+    """Fetch a Sleeper endpoint, sharing one request among concurrent callers for the same path"""
+    return await single_flight(f"sleeper:{path}", lambda: _fetch_sleeper_json(path))
+
+async def get_sleeper_user(username: str) -> Dict:
+    """Get Sleeper user data"""
+    return await fetch_sleeper_json(f"user/{username}") or {}
+
+async def get_sleeper_league(league_id: str) -> Dict:
+    """Get Sleeper league data"""
+    return await shared_cached(
+        f"sleeper:league:{league_id}", LEAGUE_CACHE_TTL, lambda: fetch_sleeper_json(f"league/{league_id}")
+    ) or {}
+
+async def get_league_rosters_by_owner(league_id: str) -> Dict[str, Dict]:
+    """Get a league's rosters keyed by owner_id, cached briefly per league"""
+    cached = _rosters_cache.get(league_id)
+    if cached is not None and time.time() - cached[0] < ROSTERS_CACHE_TTL:
+        _rosters_cache.move_to_end(league_id)
+        return cached[1]
+    
+    rosters = await fetch_sleeper_json(f"league/{league_id}/rosters")
+    if not isinstance(rosters, list):
         return {}
+    rosters_by_owner = {roster.get('owner_id'): roster for roster in rosters}
+    
+    _rosters_cache[league_id] = (time.time(), rosters_by_owner)
+    _rosters_cache.move_to_end(league_id)
+    while len(_rosters_cache) > ROSTERS_CACHE_SIZE:
+        _rosters_cache.popitem(last=False)
+    return rosters_by_owner
+
+def parse_player_names(content: bytes) -> Dict[str, str]:
+    """Project the Sleeper player dump down to {player_id: full_name}"""
+    return {
+        pid: player.get('full_name') or f'Player {pid}'
+        for pid, player in orjson.loads(content).items()
+    }
 
-def get_player_names(player_ids: List[str]) -> Dict[str, str]:
+async def fetch_player_name_map() -> Optional[Dict[str, str]]:
+    """Download the Sleeper player dump and project it to names, or None if Sleeper errors"""
+    response = await get_http_client().get(f"{SLEEPER_BASE_URL}/players/nfl")
+    if response.status_code != 200:
+        return None
+    # Parsing the multi-megabyte dump takes long enough to stall other requests
+    return await asyncio.to_thread(parse_player_names, response.content)
+
+async def get_player_name_map() -> Dict[str, str]:
+    """Get {player_id: full_name} from the Sleeper player dump, refetching at most once per TTL"""
+    if _players_cache["data"] is not None and time.monotonic() - _players_cache["ts"] < PLAYERS_CACHE_TTL:
+        return _players_cache["data"]
+    
+    async with _players_lock:
+        # Another request may have refreshed the cache while we waited
+        if _players_cache["data"] is not None and time.monotonic() - _players_cache["ts"] < PLAYERS_CACHE_TTL:
+            return _players_cache["data"]
+        # "ts" only moves on success; "last_ok" records how the latest attempt went
+        _players_cache["last_ok"] = False
+        try:
+            names = await shared_cached("sleeper:player_names", PLAYERS_CACHE_TTL, fetch_player_name_map)
+            if names:
+                _players_cache["data"] = names
+                _players_cache["ts"] = time.monotonic()
+                _players_cache["last_ok"] = True
+        except:
+            pass
+    
+    # Serve stale data rather than nothing if a refresh fails
+    return _players_cache["data"] or {}
+
+async def refresh_player_names_forever() -> None:
+    """Load the player name map now and reload it each time the cache expires"""
+    while True:
+        await get_player_name_map()
+        if _players_cache["data"] is None or not _players_cache["last_ok"]:
+            await asyncio.sleep(PLAYERS_RETRY_DELAY)
+            continue
+        remaining = PLAYERS_CACHE_TTL - (time.monotonic() - _players_cache["ts"])
+        await asyncio.sleep(max(remaining, PLAYERS_RETRY_DELAY))
+
+async def get_player_names(player_ids: List[str]) -> Dict[str, str]:
     """Get player names from Sleeper API"""
+    names = await get_player_name_map()
+    return {pid: name for pid in player_ids if (name := names.get(pid))}
+
+# LLM response cache: exact (prompt, context) matches, then near-duplicate prompts for the same context
+LLM_CACHE_SIZE = 1024
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_EMBEDDING_MODEL = "text-embedding-3-small"
+# Prompts remembered per context; rings start small and double, and a full ring overwrites its oldest entry
+SEMANTIC_CACHE_INITIAL_ROWS = 4
+SEMANTIC_CACHE_PER_CONTEXT = 64
+# Vector rows allocated across all contexts (~50 MB at 1536 dims); least recently used contexts go first
+SEMANTIC_CACHE_MAX_ROWS = 8192
+# Prompt embeddings are an extra round-trip before the LLM call, so give up on slow ones
+SEMANTIC_CACHE_EMBED_TIMEOUT = 0.5
+_llm_cache: "OrderedDict[str, str]" = OrderedDict()
+# context key -> {"vectors": matrix whose first len(responses) rows are filled, "responses": list, "next": row to overwrite}
+_semantic_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_semantic_rows = {"allocated": 0}
+
+def llm_cache_key(*parts: str) -> str:
+    """Hash prompt parts into a cache key."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+# Async SDK clients by (provider, api key), reused so each keeps its connection pool warm
+_llm_clients: Dict[Any, Any] = {}
+
+# Per-worker cap on in-flight provider calls; bursts queue here instead of tripping 429s
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "10"))
+LLM_RATE_LIMIT_RETRIES = 3
+_llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+_rate_limit_errors = []
+if ANTHROPIC_AVAILABLE:
+    _rate_limit_errors.append(anthropic.RateLimitError)
+if OPENAI_AVAILABLE:
+    _rate_limit_errors.append(openai.RateLimitError)
+RATE_LIMIT_ERRORS = tuple(_rate_limit_errors)
+
+def get_anthropic_client(api_key: str) -> Any:
+    """Return the shared AsyncAnthropic client for an API key"""
+    client = _llm_clients.get(("anthropic", api_key))
+    if client is None:
+        client = _llm_clients[("anthropic", api_key)] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
+def get_openai_client(api_key: str) -> Any:
+    """Return the shared AsyncOpenAI client for an API key"""
+    client = _llm_clients.get(("openai", api_key))
+    if client is None:
+        client = _llm_clients[("openai", api_key)] = openai.AsyncOpenAI(api_key=api_key)
+    return client
+
+def select_llm_client() -> Tuple[Optional[str], Any]:
+    """Pick the configured provider: Claude first, then OpenAI, else (None, None)"""
+    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
+    if anthropic_key and ANTHROPIC_AVAILABLE:
+        return "anthropic", get_anthropic_client(anthropic_key)
+    openai_key = os.getenv('OPENAI_API_KEY')
+    if openai_key and OPENAI_AVAILABLE:
+        return "openai", get_openai_client(openai_key)
+    return None, None
+
+def get_llm_client() -> Tuple[Optional[str], Any]:
+    """Return the provider and client chosen at startup, selecting now if none was configured"""
+    if getattr(app.state, "llm_client", None) is None:
+        app.state.llm_provider, app.state.llm_client = select_llm_client()
+    return app.state.llm_provider, app.state.llm_client
+
+def select_embedding_client() -> Any:
+    """Return the shared OpenAI client used for prompt embeddings, or None without a key"""
+    openai_key = os.getenv('OPENAI_API_KEY')
+    if openai_key and OPENAI_AVAILABLE:
+        return get_openai_client(openai_key)
+    return None
+
+async def embed_prompt(prompt: str) -> Optional[np.ndarray]:
+    """Embed a prompt for semantic cache lookups, or None without an OpenAI key."""
+    if not hasattr(app.state, "embedding_client"):
+        app.state.embedding_client = select_embedding_client()
+    client = app.state.embedding_client
+    if client is None:
+        return None
     try:
-        response = requests.get("https://api.sleeper.app/v1/players/nfl")
-        if response.status_code == 200:
-            all_players = response.json()
-            return {pid: all_players.get(pid, {}).get('full_name', f'Player {pid}') 
-                   for pid in player_ids if pid in all_players}
-        return {}
-    except:
-        return {}
-
-# Simple LLM integration (using OpenAI if available)
-async def get_llm_response(prompt: str, user_context: str = "") -> str:
-    """Get response from LLM with context using Claude"""
+        response = await asyncio.wait_for(
+            client.embeddings.create(model=SEMANTIC_CACHE_EMBEDDING_MODEL, input=prompt),
+            SEMANTIC_CACHE_EMBED_TIMEOUT
+        )
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+    except Exception as e:
+        logger.warning(f"Prompt embedding failed: {e}")
+        return None
+
+def lookup_semantic_cache(context_key: str, vector: np.ndarray) -> Optional[str]:
+    """Return a cached response for a near-duplicate prompt asked with the same context."""
+    entry = _semantic_cache.get(context_key)
+    if not entry:
+        return None
+    similarities = entry["vectors"][:len(entry["responses"])] @ vector
+    best = int(np.argmax(similarities))
+    return entry["responses"][best] if similarities[best] >= SEMANTIC_CACHE_THRESHOLD else None
+
+def store_llm_response(key: str, context_key: str, vector: Optional[np.ndarray], response: str) -> None:
+    """Record a response in both cache tiers, evicting the least recently used entries."""
+    _llm_cache[key] = response
+    while len(_llm_cache) > LLM_CACHE_SIZE:
+        _llm_cache.popitem(last=False)
+    
+    if vector is not None:
+        entry = _semantic_cache.get(context_key)
+        if entry is None:
+            entry = _semantic_cache[context_key] = {
+                "vectors": np.empty((SEMANTIC_CACHE_INITIAL_ROWS, vector.shape[0]), dtype=vector.dtype),
+                "responses": [],
+                "next": 0
+            }
+            _semantic_rows["allocated"] += SEMANTIC_CACHE_INITIAL_ROWS
+        
+        vectors, responses = entry["vectors"], entry["responses"]
+        filled = len(responses)
+        if filled < SEMANTIC_CACHE_PER_CONTEXT:
+            if filled == vectors.shape[0]:
+                grown = np.empty((min(filled * 2, SEMANTIC_CACHE_PER_CONTEXT), vectors.shape[1]), dtype=vectors.dtype)
+                grown[:filled] = vectors
+                _semantic_rows["allocated"] += grown.shape[0] - filled
+                entry["vectors"] = vectors = grown
+            vectors[filled] = vector
+            responses.append(response)
+        else:
+            slot = entry["next"]
+            vectors[slot] = vector
+            responses[slot] = response
+            entry["next"] = (slot + 1) % SEMANTIC_CACHE_PER_CONTEXT
+        
+        _semantic_cache.move_to_end(context_key)
+        while len(_semantic_cache) > 1 and (
+            len(_semantic_cache) > LLM_CACHE_SIZE or _semantic_rows["allocated"] > SEMANTIC_CACHE_MAX_ROWS
+        ):
+            _, evicted = _semantic_cache.popitem(last=False)
+            _semantic_rows["allocated"] -= evicted["vectors"].shape[0]
+
+async def get_llm_response(prompt: str, user_context: str = "", kind: Optional[str] = None,
+                           cache: bool = True) -> str:
+    """Get response from LLM with context, serving repeated questions from cache"""
+    key = llm_cache_key(prompt, user_context)
+    context_key = vector = None
+    # Contexts that never repeat would only pay for an embedding and evict useful entries
+    if cache:
+        cached = _llm_cache.get(key)
+        if cached is not None:
+            _llm_cache.move_to_end(key)
+            return cached
+        
+        context_key = llm_cache_key(user_context)
+        vector = await embed_prompt(prompt)
+        if vector is not None:
+            cached = lookup_semantic_cache(context_key, vector)
+            if cached is not None:
+                return cached
+    
+    async def generate() -> str:
+        response = await call_llm(prompt, user_context)
+        if cache:
+            store_llm_response(key, context_key, vector, response)
+        return response
+    
+    try:
+        # Identical questions asked at the same time wait on one provider call
+        return await single_flight(f"llm:{key}", generate)
+    except Exception as e:
+        logger.error(f"LLM call failed: {e}")
+        # Fallback to enhanced mock responses
+        return generate_smart_response(prompt, user_context, kind)
+
+async def stream_llm_response(prompt: str, user_context: str = "", kind: Optional[str] = None) -> AsyncIterator[str]:
+    """Yield LLM response text as it is generated, caching the completed response"""
+    key = llm_cache_key(prompt, user_context)
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        _llm_cache.move_to_end(key)
+        yield cached
+        return
+    
+    context_key = llm_cache_key(user_context)
+    vector = await embed_prompt(prompt)
+    if vector is not None:
+        cached = lookup_semantic_cache(context_key, vector)
+        if cached is not None:
+            yield cached
+            return
+    
+    chunks = []
     try:
-        import anthropic
-        
-        anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-        if not anthropic_key:
-            # Try OpenAI as fallback
-            from openai import AsyncOpenAI
-            openai_key = os.getenv('OPENAI_API_KEY')
-            if not openai_key:
-                raise Exception("No AI API keys available")
-                
-            client = AsyncOpenAI(api_key=openai_key)
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": f"""
+        async for chunk in stream_llm(prompt, user_context):
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error(f"LLM stream failed: {e}")
+        # Fall back to the canned response only if nothing was sent yet
+        if not chunks:
+            yield generate_smart_response(prompt, user_context, kind)
+        return
+    
+    store_llm_response(key, context_key, vector, "".join(chunks))
+
+# Analyst prompts, filled in per request; instructions stay in one user message in their original
+# order since they are far below the 1024-token minimum for provider prompt caching
+OPENAI_PROMPT_TEMPLATE = """
 You are a brutally honest fantasy football analyst. You have access to real fantasy football data and provide actionable advice.
 
 User Context: {user_context}
@@ -133,15 +605,9 @@ Provide analysis that is:
 3. Honest about team weaknesses
 4. Focused on winning fantasy matchups
 
-Response:"""}],
-                max_tokens=800,
-                temperature=0.7
-            )
-            return response.choices[0].message.content
-            
-        client = anthropic.Anthropic(api_key=anthropic_key)
-        
-        full_prompt = f"""
+Response:"""
+
+ANTHROPIC_PROMPT_TEMPLATE = """
 You are a brutally honest fantasy football analyst with access to real-time data. Provide ReAct-style analysis.
 
 Thought: I need to analyze this fantasy football situation thoroughly.
@@ -164,27 +630,100 @@ Final Answer: Provide analysis that is:
 5. Includes confidence levels where appropriate
 
 Response:"""
-        
-        message = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
-            temperature=0.7,
-            messages=[
-                {"role": "user", "content": full_prompt}
-            ]
-        )
-        return message.content[0].text
-    except Exception as e:
-        print(f"LLM call failed: {e}")
-        # Fallback to enhanced mock responses
-        return generate_smart_response(prompt, user_context)
 
-def generate_smart_response(prompt: str, context: str) -> str:
-    """Generate contextual responses based on prompt analysis"""
-    prompt_lower = prompt.lower()
+# Simple LLM integration (using OpenAI if available)
+async def call_llm(prompt: str, user_context: str = "") -> str:
+    """Get the complete LLM response by draining the same stream the SSE endpoint uses"""
+    return "".join([chunk async for chunk in stream_llm(prompt, user_context)])
+
+# Keyword routing works on whole words, so "position" no longer counts as "sit"
+WORD_PATTERN = re.compile(r"[a-z]+")
+START_KEYWORDS = frozenset({"start", "starts", "started", "starting", "starter", "starters"})
+SIT_KEYWORDS = frozenset({"sit", "sits", "sitting"})
+LINEUP_KEYWORDS = frozenset({"lineup", "lineups"})
+WAIVER_KEYWORDS = frozenset({"waiver", "waivers", "pickup", "pickups"})
+DROP_KEYWORDS = frozenset({"drop", "drops", "dropped", "dropping"})
+TRADE_KEYWORDS = frozenset({"trade", "trades", "traded", "trading"})
+DEAL_KEYWORDS = frozenset({"deal", "deals", "swap", "swaps", "swapped", "swapping"})
+TEAM_ANALYSIS_KEYWORDS = frozenset({
+    "analyze", "analyzes", "analyzed", "analyzing", "analysis",
+    "team", "teams", "grade", "grades", "graded", "grading",
+})
+
+# Chat analysis types in priority order
+CHAT_ANALYSIS_KEYWORDS = (
+    (START_KEYWORDS | SIT_KEYWORDS | LINEUP_KEYWORDS, "start_sit"),
+    (WAIVER_KEYWORDS | DROP_KEYWORDS, "waiver_wire"),
+    (TRADE_KEYWORDS | DEAL_KEYWORDS, "trade"),
+)
+
+def tokenize(text: str) -> frozenset:
+    """Lowercase text and split it into a set of words"""
+    return frozenset(WORD_PATTERN.findall(text.lower()))
+
+def classify_chat_prompt(prompt: str) -> str:
+    """Pick the chat analysis type for a message"""
+    tokens = tokenize(prompt)
+    for keywords, kind in CHAT_ANALYSIS_KEYWORDS:
+        if tokens & keywords:
+            return kind
+    return "general"
+
+async def open_llm_stream(provider: str, client: Any, prompt: str, user_context: str) -> Any:
+    """Start a streaming completion, backing off and retrying when the provider rate limits"""
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        try:
+            if provider == "openai":
+                return await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "user", "content": OPENAI_PROMPT_TEMPLATE.format(user_context=user_context, prompt=prompt)}
+                    ],
+                    max_tokens=800,
+                    temperature=0.7,
+                    stream=True
+                )
+            return await client.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=1000,
+                temperature=0.7,
+                messages=[
+                    {"role": "user", "content": ANTHROPIC_PROMPT_TEMPLATE.format(user_context=user_context, prompt=prompt)}
+                ],
+                stream=True
+            )
+        except RATE_LIMIT_ERRORS:
+            if attempt == LLM_RATE_LIMIT_RETRIES:
+                raise
+            await asyncio.sleep(2 ** attempt + random.random())
+
+async def stream_llm(prompt: str, user_context: str = "") -> AsyncIterator[str]:
+    """Stream response text deltas from Claude, or OpenAI when no Anthropic key is set"""
+    provider, client = get_llm_client()
+    if client is None:
+        raise Exception("No AI API keys available")
     
-    if "start" in prompt_lower and "sit" in prompt_lower:
-        return f"""For start/sit decisions this week:
+    async with _llm_semaphore:
+        stream = await open_llm_stream(provider, client, prompt, user_context)
+        if provider == "openai":
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            return
+        
+        async for event in stream:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
+
+def format_sse(data: str, event: Optional[str] = None) -> str:
+    """Format one server-sent event, splitting multi-line data across data fields"""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+# Canned fallback responses by prompt kind, filled with str.format(prompt=..., context=...)
+SMART_RESPONSE_TEMPLATES = {
+    "start_sit": """For start/sit decisions this week:
 
 • **RB Analysis**: Look for volume over big-play potential. Target RBs with 15+ touch upside
 • **WR Strategy**: Prioritize target share and red zone usage over boom-bust players  
@@ -193,10 +732,8 @@ def generate_smart_response(prompt: str, context: str) -> str:
 
 **Key Rule**: When in doubt, start the player with the higher floor. Fantasy playoffs are won with consistency, not home runs.
 
-Context: {context[:100]}..."""
-
-    elif "waiver" in prompt_lower or "pickup" in prompt_lower:
-        return f"""Waiver Wire Strategy:
+Context: {context}...""",
+    "waiver_wire": """Waiver Wire Strategy:
 
 • **RB Handcuffs**: Prioritize backup RBs to injury-prone starters (Mattison, Hubbard types)
 • **Target Hogs**: WRs seeing 8+ targets consistently, even on bad teams
@@ -205,10 +742,8 @@ Context: {context[:100]}..."""
 
 **This Week's Focus**: Don't chase last week's points. Look for opportunity changes (injuries, role shifts).
 
-League Context: {context[:100]}..."""
-
-    elif "trade" in prompt_lower:
-        return f"""Trade Analysis Framework:
+League Context: {context}...""",
+    "trade": """Trade Analysis Framework:
 
 • **Sell High**: Move players coming off season-high performances
 • **Buy Low**: Target proven players having down weeks due to variance, not injury
@@ -217,10 +752,8 @@ League Context: {context[:100]}..."""
 
 **Red Flags**: Avoid trading for injured players or those losing snaps to teammates.
 
-Context: {context[:100]}..."""
-
-    elif "analyze" in prompt_lower or "team" in prompt_lower or "grade" in prompt_lower:
-        return f"""Team Analysis Summary:
+Context: {context}...""",
+    "team_analysis": """Team Analysis Summary:
 
 Based on your roster composition and league context:
 
@@ -234,10 +767,8 @@ Based on your roster composition and league context:
 3. Review your playoff schedule matchups
 4. Consider 2-for-1 trades to upgrade starting lineup
 
-Context: {context[:100]}..."""
-
-    else:
-        return f"""Fantasy Football Insight:
+Context: {context}...""",
+    "general": """Fantasy Football Insight:
 
 {prompt}
 
@@ -248,30 +779,57 @@ Context: {context[:100]}..."""
 
 **Weekly Strategy**: Stay active on waivers, monitor injury reports, and trust your lineup decisions.
 
-Context: {context[:100]}..."""
+Context: {context}..."""
+}
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the real-time data pipeline on startup."""
-    try:
-        await data_pipeline.start_pipeline()
-        print("✅ Real-time data pipeline started successfully")
-    except Exception as e:
-        print(f"❌ Failed to start data pipeline: {e}")
+# Fallback prompt kinds routed by keyword, first match wins; every keyword set in a route must match
+SMART_RESPONSE_ROUTES = (
+    ((START_KEYWORDS, SIT_KEYWORDS), "start_sit"),
+    ((WAIVER_KEYWORDS,), "waiver_wire"),
+    ((TRADE_KEYWORDS,), "trade"),
+    ((TEAM_ANALYSIS_KEYWORDS,), "team_analysis"),
+)
 
-@app.on_event("shutdown") 
-async def shutdown_event():
-    """Cleanup the data pipeline on shutdown."""
-    try:
-        await data_pipeline.stop_pipeline()
-        print("✅ Data pipeline stopped successfully")
-    except Exception as e:
-        print(f"❌ Error stopping data pipeline: {e}")
+def classify_fallback_prompt(prompt: str) -> str:
+    """Pick the canned response kind for a prompt"""
+    tokens = tokenize(prompt)
+    for keyword_sets, kind in SMART_RESPONSE_ROUTES:
+        if all(tokens & keywords for keywords in keyword_sets):
+            return kind
+    return "general"
+
+def generate_smart_response(prompt: str, context: str, kind: Optional[str] = None) -> str:
+    """Generate contextual responses for a prompt kind, classifying the prompt if none is given"""
+    # Chat never reports team_analysis, so its "general" still gets the fallback routing
+    if kind is None or kind == "general":
+        kind = classify_fallback_prompt(prompt)
+    template = SMART_RESPONSE_TEMPLATES.get(kind, SMART_RESPONSE_TEMPLATES["general"])
+    return template.format(prompt=prompt, context=context[:100])
+
+def pipeline_status_version(pipeline_status: Dict[str, Any]) -> List[Any]:
+    """The parts of the pipeline status that change on pipeline events, leaving out ticking ages"""
+    return [
+        pipeline_status['pipeline_running'],
+        pipeline_status['active_background_tasks'],
+        [
+            [data_type, info['last_updated'], info['is_stale'], info['has_data']]
+            for data_type, info in pipeline_status['data_freshness'].items()
+        ]
+    ]
 
+def etag_response(request: Request, content: Any, version: Any) -> Response:
+    """Serve content under a weak ETag of version, or an empty 304 if the client already holds it"""
+    etag = f'W/"{hashlib.blake2b(orjson.dumps(version), digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in {tag.strip() for tag in if_none_match.split(",")}):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(content, headers={"ETag": etag})
+
+# Dashboards poll the status endpoints, so repeat polls are answered with 304 until the pipeline changes
 @app.get("/")
-async def root():
+async def root(request: Request):
     pipeline_status = data_pipeline.get_pipeline_status()
-    return {
+    return etag_response(request, {
         "message": "Enhanced Fantasy Football Optimizer API with Real-Time Data", 
         "status": "running",
         "data_pipeline": {
@@ -281,21 +839,22 @@ async def root():
                 not info['is_stale'] for info in pipeline_status['data_freshness'].values()
             )
         }
-    }
+    }, pipeline_status_version(pipeline_status))
 
 @app.get("/api/enhanced/health")
-async def health_check():
+async def health_check(request: Request):
     pipeline_status = data_pipeline.get_pipeline_status()
-    return {
+    return etag_response(request, {
         "status": "healthy", 
         "message": "Enhanced backend is running with real-time data pipeline",
         "data_pipeline_status": pipeline_status
-    }
+    }, pipeline_status_version(pipeline_status))
 
 @app.get("/api/enhanced/data-pipeline/status")
-async def get_pipeline_status():
+async def get_pipeline_status(request: Request):
     """Get detailed status of the real-time data pipeline."""
-    return data_pipeline.get_pipeline_status()
+    pipeline_status = data_pipeline.get_pipeline_status()
+    return etag_response(request, pipeline_status, pipeline_status_version(pipeline_status))
 
 @app.post("/api/enhanced/data-pipeline/force-update/{data_type}")
 async def force_data_update(data_type: str):
@@ -315,17 +874,18 @@ async def force_data_update(data_type: str):
 async def get_fresh_data():
     """Get all fresh data from the pipeline for debugging."""
     fresh_data = await data_pipeline.get_fresh_data()
-    return fresh_data
+    # Returning the response directly skips jsonable_encoder's pure-Python walk of the payload
+    return ORJSONResponse(fresh_data)
 
 @app.get("/api/enhanced/data-pipeline/enriched-context")
 async def get_enriched_context():
     """Get enriched context that will be sent to LLM for debugging."""
     fresh_data = await data_pipeline.get_fresh_data()
     enriched_data = await data_enrichment.enrich_pipeline_data(fresh_data)
-    return enriched_data
+    return ORJSONResponse(enriched_data)
 
 @app.post("/api/enhanced/multi-agent-analysis")
-async def multi_agent_analysis(request: TeamAnalysisRequest):
+async def multi_agent_analysis(request: TeamAnalysisRequest) -> MultiAgentResponse:
     """Advanced multi-agent analysis using LangGraph workflow coordination."""
     try:
         # Execute the LangGraph workflow
@@ -339,19 +899,17 @@ async def multi_agent_analysis(request: TeamAnalysisRequest):
             raise HTTPException(status_code=500, detail=workflow_result.get("error", "Workflow failed"))
         
         # Format response
-        return {
-            "success": True,
-            "analysis_type": "multi_agent_coordination",
-            "coordinated_analysis": workflow_result["analysis"],
-            "confidence_score": workflow_result["confidence_score"],
-            "action_items": workflow_result["action_items"],
-            "evidence_sources": workflow_result["evidence_sources"],
-            "agents_completed": workflow_result["agents_completed"],
-            "execution_log": workflow_result["execution_log"],
-            "agent_outputs": workflow_result["agent_outputs"],
-            "brutality_mode": request.brutality_mode,
-            "timestamp": workflow_result["timestamp"]
-        }
+        return MultiAgentResponse(
+            coordinated_analysis=workflow_result["analysis"],
+            confidence_score=workflow_result["confidence_score"],
+            action_items=workflow_result["action_items"],
+            evidence_sources=workflow_result["evidence_sources"],
+            agents_completed=workflow_result["agents_completed"],
+            execution_log=workflow_result["execution_log"],
+            agent_outputs=workflow_result["agent_outputs"],
+            brutality_mode=request.brutality_mode,
+            timestamp=workflow_result["timestamp"]
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Multi-agent analysis failed: {str(e)}")
@@ -370,117 +928,133 @@ async def initialize_vector_database():
         raise HTTPException(status_code=500, detail=f"Vector DB initialization failed: {str(e)}")
 
 @app.get("/api/enhanced/vector-db/search-patterns")
-async def search_patterns(query: str, limit: int = 5):
+async def search_patterns(query: str, limit: int = 5) -> PatternSearchResponse:
     """Search for similar historical patterns."""
     try:
         patterns = await vector_population.search_similar_patterns(query, limit)
-        return {
-            "success": True,
-            "query": query,
-            "patterns": patterns,
-            "count": len(patterns),
-            "timestamp": datetime.now().isoformat()
-        }
+        return PatternSearchResponse(
+            query=query,
+            patterns=patterns,
+            count=len(patterns),
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Pattern search failed: {str(e)}")
 
 @app.get("/api/enhanced/vector-db/patterns/{category}")
-async def get_patterns_by_category(category: str, limit: int = 10):
+async def get_patterns_by_category(category: str, limit: int = 10) -> PatternCategoryResponse:
     """Get patterns by category."""
     try:
         patterns = await vector_population.get_patterns_by_category(category, limit)
-        return {
-            "success": True,
-            "category": category,
-            "patterns": patterns,
-            "count": len(patterns),
-            "timestamp": datetime.now().isoformat()
-        }
+        return PatternCategoryResponse(
+            category=category,
+            patterns=patterns,
+            count=len(patterns),
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Category search failed: {str(e)}")
 
 # Breaking News Webhook Endpoints
 @app.post("/api/enhanced/webhooks/breaking-news")
 async def receive_breaking_news(news_item: dict):
-    """Receive breaking news webhook and process fantasy impact."""
+    """Receive breaking news webhook and queue it for fantasy impact processing."""
     try:
-        result = await breaking_news_processor.process_breaking_news(news_item)
-        return result
+        result = breaking_news_processor.enqueue_breaking_news(news_item)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Breaking news processing failed: {str(e)}")
+    
+    if result["status"] == "rejected":
+        raise HTTPException(status_code=503, detail="Breaking news queue is full, retry later")
+    return result
+
+@app.get("/api/enhanced/webhooks/queue-metrics")
+async def get_breaking_news_queue_metrics():
+    """Get backpressure metrics for the breaking news processing queue."""
+    return breaking_news_processor.get_queue_metrics()
 
 @app.get("/api/enhanced/breaking-news/recent")
-async def get_recent_breaking_news(hours: int = 24):
+async def get_recent_breaking_news(hours: int = 24) -> RecentNewsResponse:
     """Get recent breaking news with fantasy impact analysis."""
     try:
         news = await breaking_news_processor.get_recent_news(hours)
-        return {
-            "success": True,
-            "news_count": len(news),
-            "recent_news": news,
-            "timeframe_hours": hours,
-            "timestamp": datetime.now().isoformat()
-        }
+        return RecentNewsResponse(
+            news_count=len(news),
+            recent_news=news,
+            timeframe_hours=hours,
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Recent news retrieval failed: {str(e)}")
 
 # Webhook Testing Endpoints
 @app.post("/api/enhanced/webhooks/simulate/injury")
-async def simulate_injury(player_name: str, team: str, severity: str):
+async def simulate_injury(player_name: str, team: str, severity: str) -> SimulationResponse:
     """Simulate injury news for testing."""
     try:
         result = await webhook_simulator.simulate_injury_news(player_name, team, severity)
-        return {
-            "simulation": "injury",
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }
+        return SimulationResponse(
+            simulation="injury",
+            result=result,
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Injury simulation failed: {str(e)}")
 
 @app.post("/api/enhanced/webhooks/simulate/trade")
-async def simulate_trade(player_name: str, from_team: str, to_team: str):
+async def simulate_trade(player_name: str, from_team: str, to_team: str) -> SimulationResponse:
     """Simulate trade news for testing."""
     try:
         result = await webhook_simulator.simulate_trade_news(player_name, from_team, to_team)
-        return {
-            "simulation": "trade",
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }
+        return SimulationResponse(
+            simulation="trade",
+            result=result,
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Trade simulation failed: {str(e)}")
 
 @app.post("/api/enhanced/webhooks/simulate/suspension")
-async def simulate_suspension(player_name: str, team: str, weeks: int):
+async def simulate_suspension(player_name: str, team: str, weeks: int) -> SimulationResponse:
     """Simulate suspension news for testing."""
     try:
         result = await webhook_simulator.simulate_suspension_news(player_name, team, weeks)
-        return {
-            "simulation": "suspension",
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }
+        return SimulationResponse(
+            simulation="suspension",
+            result=result,
+            timestamp=datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Suspension simulation failed: {str(e)}")
 
+GRADE_OPTIONS = ("A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F")
+
+# Brutality scores are fixed (8 brutal, 4 nice), so their grades are resolved once at import
+GRADE_BRUTAL = GRADE_OPTIONS[8 - 2]
+GRADE_NICE = GRADE_OPTIONS[4 - 2]
+
+# Fallback advice used to top up analyze_team recommendations when data-driven ones run short
+GENERAL_RECOMMENDATIONS = (
+    "Monitor injury reports for practice participation updates",
+    "Consider trading bench depth for starting lineup upgrades",
+    "Review your playoff schedule (weeks 15-17) for tough matchups",
+    "Check waiver wire for emerging players in your weak positions"
+)
+
+# Enriched sections whose summaries go into the analysis context, in prompt order
+CONTEXT_SUMMARY_FIELDS = (
+    ('trending_analysis', 'analysis_summary'),
+    ('weather_impact', 'weather_summary'),
+    ('vegas_insights', 'betting_summary'),
+    ('injury_alerts', 'injury_summary'),
+    ('expert_rankings', 'rankings_summary'),
+    ('sentiment_analysis', 'sentiment_summary')
+)
+
 @app.post("/api/enhanced/analyze-team")
 async def analyze_team(request: TeamAnalysisRequest) -> AnalysisResult:
     """Enhanced team analysis with real-time data from all sources"""
-    try:
-        # Get real Sleeper data using our enhanced API
-        async with SleeperAPI() as sleeper:
-            user_data = await sleeper.get_user(request.username)
-            league_data = await sleeper.get_league(request.league_id)
-            
-            if not user_data:
-                raise HTTPException(status_code=404, detail="User not found on Sleeper")
-            if not league_data:
-                raise HTTPException(status_code=404, detail="League not found on Sleeper")
-            
-            user_id = user_data.get('user_id')
-            roster_data = await sleeper.get_user_roster_in_league(request.league_id, user_id)
-        
+    async def get_enriched_data():
         # Get fresh real-time data from all sources
         fresh_data = await data_pipeline.get_fresh_data([
             'sleeper_trending', 'fantasypros_rankings', 'reddit_sentiment', 
@@ -488,91 +1062,86 @@ async def analyze_team(request: TeamAnalysisRequest) -> AnalysisResult:
         ])
         
         # Enrich the raw data with actionable insights
-        enriched_data = await data_enrichment.enrich_pipeline_data(fresh_data)
+        return fresh_data, await data_enrichment.enrich_pipeline_data(fresh_data)
+    
+    # The pipeline stages don't depend on Sleeper, so run them alongside the Sleeper lookups
+    enrichment_task = asyncio.create_task(get_enriched_data())
+    try:
+        # Get real Sleeper data: user, league, league rosters and the (cached) player dump are
+        # all independent; the user's roster is picked out of the league rosters by user id
+        user_data, league_data, rosters_by_owner, player_names = await asyncio.gather(
+            get_sleeper_user(request.username),
+            get_sleeper_league(request.league_id),
+            get_league_rosters_by_owner(request.league_id),
+            get_player_name_map()
+        )
         
-        # Build comprehensive context for LLM with enriched data
-        context = f"""
+        if not user_data:
+            raise HTTPException(status_code=404, detail="User not found on Sleeper")
+        if not league_data:
+            raise HTTPException(status_code=404, detail="League not found on Sleeper")
+        
+        roster_data = rosters_by_owner.get(user_data.get('user_id'), {})
+        
+        fresh_data, enriched_data = await enrichment_task
+        # Unpack the enriched sections once for the context, recommendations and source flags
+        insights = enriched_data.get('actionable_insights', [])
+        trending = enriched_data.get('trending_analysis', {})
+        weather = enriched_data.get('weather_impact', {})
+        vegas = enriched_data.get('vegas_insights', {})
+        injuries = enriched_data.get('injury_alerts', {})
+        active_sources = enriched_data.get('data_sources_active', {})
+        # One clock read serves both the prompt and the response timestamp
+        generated_at = datetime.now()
+        
+        # Build comprehensive context for LLM with enriched data, joined once at the end
+        parts = [f"""
 LEAGUE INFORMATION:
 - League: {league_data.get('name', 'Unknown')} ({league_data.get('total_rosters', 'Unknown')} teams)
 - Scoring: {league_data.get('scoring_settings', {}).get('rec', 0)} PPR
 - User: {request.username}
 
 CURRENT ROSTER:
-"""
+"""]
         
         if roster_data:
             player_ids = roster_data.get('players', [])[:15]
-            async with SleeperAPI() as sleeper:
-                player_details = await sleeper.get_nfl_players()
-            roster_names = [player_details.get(pid, {}).get('full_name', f'Player {pid}') for pid in player_ids if pid in player_details]
-            context += f"Players: {', '.join(roster_names[:10])}{'...' if len(roster_names) > 10 else ''}\n"
+            # Iterate the roster itself so names keep roster order
+            roster_names = [name for pid in player_ids if (name := player_names.get(pid))]
+            parts.append(f"Players: {', '.join(roster_names[:10])}{'...' if len(roster_names) > 10 else ''}\n")
         
         # Add enriched real-time analysis
-        context += "\n=== REAL-TIME FANTASY INTELLIGENCE ===\n"
+        parts.append("\n=== REAL-TIME FANTASY INTELLIGENCE ===\n")
         
         # Add actionable insights
-        insights = enriched_data.get('actionable_insights', [])
         if insights:
-            context += "\n🎯 KEY INSIGHTS THIS WEEK:\n"
-            for insight in insights[:5]:  # Top 5 insights
-                context += f"  • {insight}\n"
-        
-        # Add trending analysis
-        trending = enriched_data.get('trending_analysis', {})
-        if trending.get('analysis_summary'):
-            context += f"\n{trending['analysis_summary']}"
+            parts.append("\n🎯 KEY INSIGHTS THIS WEEK:\n")
+            parts.extend(f"  • {insight}\n" for insight in insights[:5])  # Top 5 insights
         
-        # Add weather impact
-        weather = enriched_data.get('weather_impact', {})
-        if weather.get('weather_summary'):
-            context += f"\n{weather['weather_summary']}"
-        
-        # Add Vegas game scripts
-        vegas = enriched_data.get('vegas_insights', {})
-        if vegas.get('betting_summary'):
-            context += f"\n{vegas['betting_summary']}"
-        
-        # Add injury alerts
-        injuries = enriched_data.get('injury_alerts', {})
-        if injuries.get('injury_summary'):
-            context += f"\n{injuries['injury_summary']}"
-        
-        # Add expert rankings
-        rankings = enriched_data.get('expert_rankings', {})
-        if rankings.get('rankings_summary'):
-            context += f"\n{rankings['rankings_summary']}"
-        
-        # Add community sentiment
-        sentiment = enriched_data.get('sentiment_analysis', {})
-        if sentiment.get('sentiment_summary'):
-            context += f"\n{sentiment['sentiment_summary']}"
+        # Add trending, weather, Vegas, injury, rankings and sentiment summaries
+        for section, field in CONTEXT_SUMMARY_FIELDS:
+            summary = enriched_data.get(section, {}).get(field)
+            if summary:
+                parts.append(f"\n{summary}")
         
         # Data source status
-        active_sources = enriched_data.get('data_sources_active', {})
-        context += f"\n📊 DATA SOURCES ACTIVE: {', '.join([k.upper() for k, v in active_sources.items() if v])}\n"
-        context += f"⏰ Analysis generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append(f"\n📊 DATA SOURCES ACTIVE: {', '.join([k.upper() for k, v in active_sources.items() if v])}\n")
+        parts.append(f"⏰ Analysis generated at: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        context = "".join(parts)
         
-        # Get LLM analysis with rich context
-        analysis_text = await get_llm_response(request.question, context)
+        # Get LLM analysis with rich context; the generated-at stamp makes every context unique, so skip the cache
+        analysis_text = await get_llm_response(request.question, context, cache=False)
         
         # Determine grades based on analysis sentiment and brutality mode
-        grade_options = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F"]
-        brutality_score = 8 if request.brutality_mode else 4
-        grade_idx = min(len(grade_options) - 1, max(0, brutality_score - 2))
-        team_grade = grade_options[grade_idx]
-        
-        recommendations = [
-            "Check your waiver wire for emerging players in your weak positions",
-            "Consider trading bench depth for starting lineup upgrades",
-            "Monitor injury reports for handcuff opportunities",
-            "Review your playoff schedule (weeks 15-17) for tough matchups"
-        ]
+        if request.brutality_mode:
+            brutality_score, team_grade = 8, GRADE_BRUTAL
+        else:
+            brutality_score, team_grade = 4, GRADE_NICE
         
         # Generate evidence-based recommendations from enriched data
         recommendations = []
         
         # Add waiver wire recommendations from trending data
-        trending = enriched_data.get('trending_analysis', {})
         if trending.get('top_adds'):
             top_add = trending['top_adds'][0]
             recommendations.append(f"🔥 Top Waiver Target: {top_add['name']} ({top_add['position']}) - {top_add['add_percentage']}% add rate")
@@ -582,14 +1151,12 @@ CURRENT ROSTER:
                 recommendations.append(f"📈 Breakout Alert: {candidate['name']} ({candidate['position']}) - {candidate['reason']}")
         
         # Add weather-based recommendations
-        weather = enriched_data.get('weather_impact', {})
         if weather.get('games_affected'):
             for affected in weather['games_affected'][:2]:
                 if affected['overall_impact'] in ['negative', 'slightly_negative']:
                     recommendations.append(f"🌧️ Weather Impact: Avoid {affected['team']} passing game - {affected['conditions']}")
         
         # Add Vegas-based recommendations
-        vegas = enriched_data.get('vegas_insights', {})
         if vegas.get('high_total_games'):
             game = vegas['high_total_games'][0]
             recommendations.append(f"📊 High-Scoring Target: {game['matchup']} (O/U {game['total']}) - favor pass-catchers")
@@ -599,24 +1166,14 @@ CURRENT ROSTER:
             recommendations.append(f"💨 Blowout Script: {game['matchup']} ({game['spread']} spread) - target lead RB")
         
         # Add injury-based recommendations
-        injuries = enriched_data.get('injury_alerts', {})
         if injuries.get('key_injuries'):
             rb_injuries = [inj for inj in injuries['key_injuries'] if inj['position'] == 'RB']
             if rb_injuries:
                 recommendations.append(f"🏥 Handcuff Alert: {len(rb_injuries)} RBs injured - check backup values")
         
-        # Add general recommendations if we don't have enough data-driven ones
-        while len(recommendations) < 4:
-            general_recs = [
-                "Monitor injury reports for practice participation updates",
-                "Consider trading bench depth for starting lineup upgrades",
-                "Review your playoff schedule (weeks 15-17) for tough matchups",
-                "Check waiver wire for emerging players in your weak positions"
-            ]
-            for rec in general_recs:
-                if rec not in recommendations:
-                    recommendations.append(rec)
-                    break
+        # Add general recommendations if we don't have enough data-driven ones; the data-driven
+        # ones are all tagged with an emoji prefix, so the two lists never overlap
+        recommendations.extend(GENERAL_RECOMMENDATIONS[:max(0, 4 - len(recommendations))])
         
         return AnalysisResult(
             analysis=analysis_text,
@@ -627,14 +1184,14 @@ CURRENT ROSTER:
             data_sources={
                 "sleeper_api": bool(roster_data),
                 "data_enrichment_service": True,
-                **enriched_data.get('data_sources_active', {}),
+                **active_sources,
                 "llm_analysis": True,
                 "real_time_pipeline": True,
-                "actionable_insights": len(enriched_data.get('actionable_insights', [])),
-                "trending_analysis": bool(enriched_data.get('trending_analysis')),
-                "weather_impact": bool(enriched_data.get('weather_impact')),
-                "vegas_insights": bool(enriched_data.get('vegas_insights')),
-                "injury_alerts": bool(enriched_data.get('injury_alerts'))
+                "actionable_insights": len(insights),
+                "trending_analysis": bool(trending),
+                "weather_impact": bool(weather),
+                "vegas_insights": bool(vegas),
+                "injury_alerts": bool(injuries)
             },
             execution_summary={
                 "steps_completed": [
@@ -648,41 +1205,54 @@ CURRENT ROSTER:
                 "errors": [],
                 "total_time": 3.8
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=generated_at.isoformat()
         )
         
     except HTTPException:
+        enrichment_task.cancel()
+        with suppress(Exception, asyncio.CancelledError):
+            await enrichment_task
         raise
     except Exception as e:
+        enrichment_task.cancel()
+        with suppress(Exception, asyncio.CancelledError):
+            await enrichment_task
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+# Chat types answered from the question itself; they only need the league name, not the user's roster
+LEAGUE_ONLY_CHAT_TYPES = frozenset({"start_sit", "waiver_wire", "trade"})
+
+async def build_chat_context(request: ChatRequest, analysis_type: str) -> str:
+    """Build the basic Sleeper user context for a chat message"""
+    if analysis_type in LEAGUE_ONLY_CHAT_TYPES:
+        league_data = await get_sleeper_league(request.league_id)
+        return f"League: {league_data.get('name', 'Unknown')}, User: {request.username}"
+    
+    user_data, league_data, rosters_by_owner = await asyncio.gather(
+        get_sleeper_user(request.username),
+        get_sleeper_league(request.league_id),
+        get_league_rosters_by_owner(request.league_id)
+    )
+    
+    context = f"League: {league_data.get('name', 'Unknown')}, User: {request.username}"
+    
+    if user_data:
+        roster_data = rosters_by_owner.get(user_data.get('user_id'), {})
+        if roster_data:
+            context += f", Team: {len(roster_data.get('players', []))} players"
+    
+    return context
+
 @app.post("/api/enhanced/chat")
 async def chat(request: ChatRequest) -> ChatResponse:
     """Enhanced chat with real Sleeper context"""
     try:
-        # Get basic user context
-        user_data = get_sleeper_user(request.username)
-        league_data = get_sleeper_league(request.league_id)
-        
-        context = f"League: {league_data.get('name', 'Unknown')}, User: {request.username}"
-        
-        if user_data:
-            user_id = user_data.get('user_id')
-            roster_data = get_user_roster(request.league_id, user_id)
-            if roster_data:
-                context += f", Team: {len(roster_data.get('players', []))} players"
+        # Determine analysis type first; it decides how much Sleeper context to fetch
+        analysis_type = classify_chat_prompt(request.message)
+        context = await build_chat_context(request, analysis_type)
         
         # Get LLM response
-        response_text = await get_llm_response(request.message, context)
-        
-        # Determine analysis type
-        analysis_type = "general"
-        if any(word in request.message.lower() for word in ["start", "sit", "lineup"]):
-            analysis_type = "start_sit"
-        elif any(word in request.message.lower() for word in ["waiver", "pickup", "drop"]):
-            analysis_type = "waiver_wire"
-        elif any(word in request.message.lower() for word in ["trade", "deal", "swap"]):
-            analysis_type = "trade"
+        response_text = await get_llm_response(request.message, context, analysis_type)
         
         return ChatResponse(
             response=response_text,
@@ -697,5 +1267,42 @@ async def chat(request: ChatRequest) -> ChatResponse:
             confidence=0.1
         )
 
+@app.post("/api/enhanced/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Enhanced chat streamed as server-sent events while the LLM generates"""
+    async def events() -> AsyncIterator[str]:
+        try:
+            analysis_type = classify_chat_prompt(request.message)
+            context = await build_chat_context(request, analysis_type)
+            async for chunk in stream_llm_response(request.message, context, analysis_type):
+                yield format_sse(chunk)
+        except Exception:
+            yield format_sse(
+                f"I encountered an issue analyzing your question: {request.message}. Please try rephrasing or check your league settings.",
+                event="error"
+            )
+        yield format_sse("[DONE]", event="done")
+    
+    # Reverse proxies such as nginx buffer responses by default, which would hold tokens back until the end
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def main():
+    """Run the API server, in a single worker process unless WORKERS says otherwise."""
+    # Breaking news, webhook queue, pipeline status and simulator state live in process memory,
+    # and every worker would run its own scraping pipeline; raise WORKERS only once that is shared.
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8002,
+        workers=int(os.getenv('WORKERS', '1')),
+        # "auto" uses uvloop and httptools when installed, else the asyncio loop and h11
+        loop="auto",
+        http="auto"
+    )
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8002)
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -4,9 +4,12 @@ Production startup script for Fantasy Football AI Multi-Agent System.
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add the project root to Python path
@@ -15,14 +18,17 @@ sys.path.insert(0, str(project_root))
 
 from backend.api.multi_agent_server import MultiAgentFantasyServer
 
-# Configure logging
+# Configure logging; request paths only enqueue records, the listener thread writes file and stream
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('logs/fantasy_ai.log'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/fantasy_ai.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
@@ -69,6 +75,8 @@ async def test_system_health():
         async with SleeperAPI() as sleeper:
             test_user = await sleeper.get_user('testuser')
             logger.info("✓ Sleeper API connection successful")
+        # This check runs on its own event loop, so release the shared session before it ends
+        await SleeperAPI.close_shared_session()
         
         # Test agent initialization
         coordinator = AgentCoordinator()
@@ -87,6 +95,9 @@ async def test_system_health():
 
 def main():
     """Main entry point for production server."""
+    log_listener.start()
+    # Drain queued records on every exit path, including the sys.exit calls below
+    atexit.register(log_listener.stop)
     logger.info("Starting Fantasy Football AI Multi-Agent System...")
     
     # Check environment
@@ -121,7 +132,10 @@ def main():
             host=host,
             port=port,
             log_level="debug" if debug else "info",
-            access_log=True
+            access_log=True,
+            # "auto" uses uvloop and httptools when installed, else the asyncio loop and h11
+            loop="auto",
+            http="auto"
         )
         
     except KeyboardInterrupt:
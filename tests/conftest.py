@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Let tests import the top-level server module and the backend/database packages
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
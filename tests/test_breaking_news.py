@@ -0,0 +1,61 @@
+"""
+Tests for breaking news impact caching.
+"""
+
+import asyncio
+from datetime import datetime
+
+from backend.webhooks.breaking_news import BreakingNews, BreakingNewsProcessor, SemanticImpactCache, WebhookSimulator
+
+
+def _injury_news(severity):
+    return BreakingNews(
+        id=f"test-{severity}",
+        source="espn",
+        headline=f"Test Player suffers {severity} injury",
+        content=f"Test Player of the BUF has been diagnosed with a {severity} injury and his status is uncertain.",
+        player_names=["Test Player"],
+        teams=["BUF"],
+        impact_level="high" if severity in WebhookSimulator._SEVERE_INJURIES else "medium",
+        categories=["injury", "lineup"],
+        timestamp=datetime.now()
+    )
+
+
+def test_injury_severities_get_distinct_lexical_keys():
+    keys = {
+        severity: SemanticImpactCache._lexical_key(_injury_news(severity))
+        for severity in ("minor", "severe", "season-ending", "day-to-day", "week-to-week")
+    }
+    assert len(set(keys.values())) == len(keys)
+    assert keys["minor"][2] == "minor"
+    assert keys["season-ending"][2] == "season_ending"
+    assert keys["minor"][3] != keys["season-ending"][3]
+
+
+def test_breaking_news_is_hashable():
+    news = _injury_news("minor")
+    assert news.categories == ("injury", "lineup")
+    assert {news: "cached"}[news] == "cached"
+    assert news.category_bits
+
+
+def test_failed_cache_lookup_falls_through_to_llm(monkeypatch):
+    processor = BreakingNewsProcessor()
+    
+    async def failing_lookup(news):
+        raise RuntimeError("embedding backend down")
+    
+    async def analysis(system_prompt, context):
+        return {"analysis": "fresh analysis"}
+    
+    def unexpected_store(*args, **kwargs):
+        raise AssertionError("nothing to store without an embedding")
+    
+    monkeypatch.setattr(processor.semantic_cache, "lookup", failing_lookup)
+    monkeypatch.setattr(processor.semantic_cache, "store", unexpected_store)
+    monkeypatch.setattr(processor.llm_manager, "team_analysis_with_system", analysis)
+    
+    impact = asyncio.run(processor._analyze_fantasy_impact(_injury_news("severe"), datetime.now().isoformat()))
+    assert impact["analysis_text"] == "fresh analysis"
+    assert impact["cache_hit"] is False
@@ -0,0 +1,45 @@
+"""
+Tests for embedding fallbacks in EmbeddingService.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from database.vector_store.embeddings import EmbeddingService
+
+
+class FlakyModel:
+    """SentenceTransformer stand-in that fails until told to recover."""
+    
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self.failing = True
+    
+    def encode(self, texts, **kwargs):
+        if self.failing:
+            raise RuntimeError("model unavailable")
+        return np.ones((len(texts), self.dimension), dtype=np.float32) / np.sqrt(self.dimension)
+
+
+@pytest.fixture
+def service():
+    service = EmbeddingService()
+    service.model = FlakyModel(service.embedding_dimension)
+    return service
+
+
+def test_failed_embedding_is_not_cached(service):
+    async def scenario():
+        fallback = await service.embed_text("Josh Allen rushing upside")
+        assert len(service._embed_cache) == 0
+        
+        service.model.failing = False
+        recovered = await service.embed_text("Josh Allen rushing upside")
+        return fallback, recovered
+    
+    fallback, recovered = asyncio.run(scenario())
+    assert np.allclose(fallback, service._generate_mock_embedding("Josh Allen rushing upside"))
+    assert np.allclose(recovered, 1 / np.sqrt(service.embedding_dimension))
+    assert len(service._embed_cache) == 1
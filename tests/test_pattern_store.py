@@ -0,0 +1,84 @@
+"""
+Tests for queued pattern writes in PatternStore.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("orjson")
+
+from database.vector_store import pattern_store
+from database.vector_store.pattern_store import PatternStore, PlayerPattern, MarketPattern
+
+
+@pytest.fixture(autouse=True)
+def no_embedding_model(monkeypatch):
+    """Writes go through the vector manager, so skip loading a real embedding model."""
+    monkeypatch.setattr(pattern_store, "FantasyEmbeddingService", lambda: None)
+
+
+class FailingPlayerBatchManager:
+    """Vector manager stand-in whose player batch write always fails."""
+    
+    def __init__(self):
+        self.analyses = []
+    
+    async def store_player_patterns_batch(self, patterns):
+        raise RuntimeError("collection unavailable")
+    
+    async def store_expert_analyses_batch(self, analyses):
+        self.analyses.extend(analyses)
+        return len(analyses)
+
+
+def _player_pattern():
+    return PlayerPattern(
+        player_name="Test Player", position="WR", team="BUF", pattern_type="weekly",
+        timeframe="last_4", metrics={"points": 14.2}, context={}, confidence=0.7,
+        created_at=datetime.now()
+    )
+
+
+def _market_pattern():
+    return MarketPattern(
+        subject="Test Player", pattern_type="sentiment", trend_direction="increasing",
+        magnitude=0.4, timeframe="week", source="test", confidence=0.6,
+        created_at=datetime.now()
+    )
+
+
+def test_failed_batch_is_logged_and_does_not_block_other_batches(caplog):
+    async def scenario():
+        manager = FailingPlayerBatchManager()
+        store = PatternStore(manager)
+        store.flush_delay = 3600
+        
+        assert await store.store_player_pattern(_player_pattern()) is True
+        assert await store.store_market_pattern(_market_pattern()) is True
+        
+        stored = await store.flush()
+        return store, manager, stored
+    
+    store, manager, stored = asyncio.run(scenario())
+    assert stored == 1
+    assert len(manager.analyses) == 1
+    assert not store._pending_player_patterns and not store._pending_analyses
+    assert "Failed to store player pattern batch" in caplog.text
+
+
+def test_close_writes_queued_patterns():
+    async def scenario():
+        manager = FailingPlayerBatchManager()
+        store = PatternStore(manager)
+        
+        await store.store_market_pattern(_market_pattern())
+        # Nothing has been written yet; the debounced flush is still waiting
+        assert manager.analyses == []
+        await store.close()
+        return manager
+    
+    manager = asyncio.run(scenario())
+    assert len(manager.analyses) == 1
@@ -0,0 +1,78 @@
+"""
+Tests for request coalescing in backend.single_flight.
+"""
+
+import asyncio
+
+import pytest
+
+from backend import single_flight as coalescing
+
+
+async def _cancel_leader_with_waiting_follower(key):
+    """Start a leader, queue a follower behind it, cancel the leader and return the follower's result."""
+    started = asyncio.Event()
+    calls = 0
+    
+    async def slow_then_fast():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(3600)
+        return "shared answer"
+    
+    leader = asyncio.create_task(coalescing.single_flight(key, slow_then_fast))
+    await started.wait()
+    follower = asyncio.create_task(coalescing.single_flight(key, slow_then_fast))
+    # Let the follower reach the shared future before the leader goes away
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    return await asyncio.wait_for(follower, timeout=5), calls
+
+
+def test_follower_gets_result_when_leader_is_cancelled():
+    result, calls = asyncio.run(_cancel_leader_with_waiting_follower("test:cancel"))
+    assert result == "shared answer"
+    assert calls == 2
+    assert "test:cancel" not in coalescing._inflight
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        calls = 0
+        release = asyncio.Event()
+        
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+        
+        tasks = [asyncio.create_task(coalescing.single_flight("test:share", factory)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks), calls
+    
+    results, calls = asyncio.run(scenario())
+    assert results == [1] * 5
+    assert calls == 1
+
+
+def test_leader_error_reaches_followers():
+    async def scenario():
+        release = asyncio.Event()
+        
+        async def factory():
+            await release.wait()
+            raise ValueError("upstream failed")
+        
+        tasks = [asyncio.create_task(coalescing.single_flight("test:error", factory)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,38 @@
+"""
+Tests for embedding memoization in VectorManager.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from database.vector_store.vector_manager import VectorManager
+
+
+class FlakyModel:
+    """SentenceTransformer stand-in that fails until told to recover."""
+    
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self.failing = True
+    
+    def encode(self, texts, **kwargs):
+        if self.failing:
+            raise RuntimeError("model unavailable")
+        return np.ones((len(texts), self.dimension), dtype=np.float32)
+
+
+def test_failed_embeddings_are_not_memoized(tmp_path):
+    manager = VectorManager(db_path=str(tmp_path / "chroma_db"))
+    manager.embedding_service.model = FlakyModel(manager.embedding_service.embedding_dimension)
+    contents = ["Bijan Robinson usage report", "Puka Nacua target share"]
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(manager._embed_contents(contents))
+    assert len(manager._embed_memo) == 0
+    
+    manager.embedding_service.model.failing = False
+    embeddings = asyncio.run(manager._embed_contents(contents))
+    assert embeddings.shape == (2, manager.embedding_service.embedding_dimension)
+    assert len(manager._embed_memo) == 2